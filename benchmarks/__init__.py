@@ -0,0 +1 @@
+"""Offline benchmark suite for fluent_validator (run with ``python -m benchmarks``)."""
@@ -0,0 +1,142 @@
+"""Run the benchmark suite and compare the results with a stored baseline.
+
+Usage::
+
+    python -m benchmarks                      # measure and compare with benchmarks/baseline.json
+    python -m benchmarks -k record            # only the workloads whose name contains "record"
+    python -m benchmarks --update-baseline    # measure and store the results as the new baseline
+
+Throughput is the best of several timed rounds, in operations per second.
+Allocations are measured separately with ``tracemalloc`` (which slows the code
+down, so it never runs during the timed rounds): ``alloc_blocks`` is the number
+of memory blocks still allocated after one operation compared to before it and
+``peak_bytes`` the peak of traced memory above the starting point during it.
+The command exits with status 1 when a workload is slower than the baseline by
+more than ``--time-tolerance`` or allocates more than ``--alloc-tolerance``.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .workloads import workloads
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def measure_throughput(fn: Callable[[], Any], *, rounds: int, min_time: float) -> float:
+    """Return the best throughput of ``fn`` over ``rounds`` rounds, in operations per second."""
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    while elapsed < min_time:
+        number *= 2
+        elapsed = timer.timeit(number)
+    best = min([elapsed, *timer.repeat(repeat=rounds - 1, number=number)])
+    return number / best
+
+
+def measure_allocations(fn: Callable[[], Any]) -> tuple[int, int]:
+    """Return ``(alloc_blocks, peak_bytes)`` of one call of ``fn`` (after a warm-up call)."""
+    fn()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "traceback"))
+    return blocks, peak - start
+
+
+def run(pattern: str, *, rounds: int, min_time: float) -> dict[str, dict[str, float]]:
+    """Measure the workloads whose name contains ``pattern``."""
+    results = {}
+    for name, fn in workloads().items():
+        if pattern not in name:
+            continue
+        ops = measure_throughput(fn, rounds=rounds, min_time=min_time)
+        blocks, peak = measure_allocations(fn)
+        results[name] = {"ops_per_sec": round(ops, 1), "alloc_blocks": blocks, "peak_bytes": peak}
+        print(f"{name:<24} {ops:>14,.1f} ops/s {blocks:>8} blocks {peak:>12,} peak bytes")
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    *,
+    time_tolerance: float,
+    alloc_tolerance: float,
+) -> list[str]:
+    """Return one message per workload regressing beyond the tolerances."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        ratio = result["ops_per_sec"] / reference["ops_per_sec"]
+        if ratio < 1 - time_tolerance:
+            regressions.append(f"{name}: {ratio:.0%} of the baseline throughput")
+        for counter in ("alloc_blocks", "peak_bytes"):
+            # small absolute slack: a handful of blocks/bytes is interpreter noise
+            limit = reference[counter] * (1 + alloc_tolerance) + (8 if counter == "alloc_blocks" else 512)
+            if result[counter] > limit:
+                regressions.append(f"{name}: {counter} {result[counter]} > baseline {reference[counter]}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite from the command line and return the exit status."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", dest="pattern", default="", help="only run workloads whose name contains PATTERN")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="baseline JSON file (default: %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--rounds", type=int, default=5, help="timed rounds per workload (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per round (default: %(default)s)")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="allowed throughput loss (default: 0.25)")
+    parser.add_argument("--alloc-tolerance", type=float, default=0.10, help="allowed allocation growth (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, rounds=args.rounds, min_time=args.min_time)
+
+    if args.update_baseline:
+        stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        stored.setdefault("workloads", {}).update(results)
+        stored["machine"] = {"python": platform.python_version(), "platform": platform.platform()}
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(
+        results,
+        baseline["workloads"],
+        time_tolerance=args.time_tolerance,
+        alloc_tolerance=args.alloc_tolerance,
+    )
+    if regressions:
+        print("Regressions against the baseline:", *regressions, sep="\n  ")
+        return 1
+    print("No regression against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
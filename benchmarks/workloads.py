@@ -0,0 +1,103 @@
+"""Representative workloads measured by the benchmark suite.
+
+Each workload is a zero-argument callable performing one operation; setup work
+(building inputs and, except for the ``build`` workloads, the specs) happens
+once when the workload table is created so that only the operation is measured.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from fluent_validator import Validator as vb
+from fluent_validator import ValidatorSpec
+
+CHAIN_LENGTH = 50
+TREE_DEPTH = 30
+COLLECTION_SIZE = 10_000
+BATCH_SIZE = 10_000
+RECORDS = 200
+ENUM_SIZE = 300
+
+
+def build_chain() -> ValidatorSpec:
+    """Return a spec chaining ``CHAIN_LENGTH`` numeric rules."""
+    spec = vb.is_number()
+    for bound in range(CHAIN_LENGTH - 1):
+        spec = spec.is_greater_than(-bound - 1) if bound % 2 else spec.is_less_than(bound + 1_000)
+    return spec
+
+
+def build_tree() -> ValidatorSpec:
+    """Return a ``TREE_DEPTH`` levels deep tree alternating OR and NOT."""
+    spec = vb.is_equal(0)
+    for level in range(1, TREE_DEPTH + 1):
+        spec = spec | vb.is_equal(level) if level % 2 else ~~(spec | vb.is_string())
+    return spec
+
+
+def build_enum() -> ValidatorSpec:
+    """Return an OR of ``ENUM_SIZE`` string equalities, as generated for enum schemas."""
+    spec = vb.is_string().is_equal("value-0")
+    for index in range(1, ENUM_SIZE):
+        spec = spec | vb.is_string().is_equal(f"value-{index}")
+    return spec
+
+
+def build_record() -> ValidatorSpec:
+    """Return a record schema with nested collections."""
+    line = vb.schema({"sku": vb.is_string().is_not_empty(), "qty": vb.is_number().is_gt(0)})
+    return vb.schema(
+        {
+            "id": vb.is_instance_of(int).is_gt(0),
+            "customer": vb.schema({"name": vb.is_string(), "tags": vb.each(vb.is_string())}),
+            "lines": vb.each(line),
+            "meta": vb.each_value(vb.is_number()),
+        },
+    )
+
+
+def make_record(index: int) -> dict[str, Any]:
+    """Return a valid record for :func:`build_record`."""
+    return {
+        "id": index + 1,
+        "customer": {"name": f"customer-{index}", "tags": ["a", "b", "c"]},
+        "lines": [{"sku": f"sku-{n}", "qty": n + 1} for n in range(5)],
+        "meta": {"weight": 1.5, "volume": 3},
+    }
+
+
+def workloads() -> dict[str, Callable[[], Any]]:
+    """Return the workloads keyed by name."""
+    chain = build_chain()
+    tree = build_tree()
+    # strings rather than a range, which is_in checks arithmetically without building a lookup
+    keys = [f"key-{index}" for index in range(COLLECTION_SIZE)]
+    key_set = set(keys)
+    large_in = vb.is_in(keys)
+    numbers = vb.is_number().is_between(0, BATCH_SIZE)
+    batch = list(range(BATCH_SIZE))
+    enum = build_enum()
+    record = build_record()
+    records = [make_record(index) for index in range(RECORDS)]
+
+    return {
+        "chain.build": build_chain,
+        "chain.validate": lambda: chain.validate(500),
+        # describe() is memoized per spec: render the tree itself, and time the memo separately
+        "chain.describe": lambda: ValidatorSpec._render_pretty(chain._get_describe_tree()),
+        "chain.describe_memoized": chain.describe,
+        "tree.build": build_tree,
+        "tree.validate": lambda: tree.validate(TREE_DEPTH - 1),
+        "tree.describe": lambda: ValidatorSpec._render_pretty(tree._get_describe_tree()),
+        "tree.describe_memoized": tree.describe,
+        "is_in.build": lambda: vb.is_in(keys),
+        "is_in.build_set": lambda: vb.is_in(key_set),
+        "is_in.validate_hit": lambda: large_in.validate(keys[-1]),
+        "is_in.validate_miss": lambda: large_in.validate("missing", strategy="return_result"),
+        "enum.build": build_enum,
+        "enum.validate": lambda: enum.validate(f"value-{ENUM_SIZE - 1}"),
+        "numeric.validate_each": lambda: numbers.validate_each(batch),
+        "record.build": build_record,
+        "record.validate": lambda: record.validate(records[0]),
+        "record.validate_each": lambda: record.validate_each(records),
+    }
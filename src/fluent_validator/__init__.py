@@ -1,10 +1,25 @@
 """Public exports for fluent_validator package.
 
-Expose ValidationError, Validator, Validator and ValidatorSpec.
+Expose ValidationError, ValidationReport, Validator, ValidatorSpec, Peekable, the
+field() cross-field expression factory and the validated/validated_field
+dataclass helpers.
 """
 
+from fluent_validator.dataclass_fields import validated, validated_field
 from fluent_validator.exceptions import ValidationError
+from fluent_validator.expressions import field
+from fluent_validator.functions import Peekable
+from fluent_validator.report import ValidationReport
 from fluent_validator.validator import Validator
 from fluent_validator.validator_spec import ValidatorSpec
 
-__all__ = ["ValidationError", "Validator", "ValidatorSpec"]
+__all__ = [
+    "Peekable",
+    "ValidationError",
+    "ValidationReport",
+    "Validator",
+    "ValidatorSpec",
+    "field",
+    "validated",
+    "validated_field",
+]
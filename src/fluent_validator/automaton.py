@@ -0,0 +1,84 @@
+"""Multi-keyword substring search for fluent_validator.
+
+KeywordAutomaton is an Aho-Corasick automaton: it is built once from a set of
+keywords and then finds whether any of them occurs in a text with a single
+left-to-right scan, independently of the number of keywords.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+
+# below this many keywords, C-level ``str.__contains__`` scans beat a Python-level automaton
+SMALL_KEYWORD_SET = 8
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton answering "does ``text`` contain any keyword?".
+
+    The trie has one node per distinct keyword prefix and each node keeps a dict of
+    its outgoing edges, so memory is proportional to the total keyword length.
+    """
+
+    __slots__ = ("_fail", "_goto", "_keywords", "_terminal")
+
+    def __init__(self, keywords: Iterable[str]):
+        """Build the automaton for ``keywords``."""
+        keywords = tuple(dict.fromkeys(keywords))
+        for keyword in keywords:
+            if not isinstance(keyword, str):
+                raise TypeError(f"Keywords must be strings, got {keyword!r}")
+
+        self._keywords: tuple[str, ...] | None = keywords if len(keywords) <= SMALL_KEYWORD_SET else None
+        goto: list[dict[str, int]] = [{}]
+        terminal = [False]
+
+        for keyword in keywords:
+            node = 0
+            for char in keyword:
+                child = goto[node].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto[node][char] = child
+                    goto.append({})
+                    terminal.append(False)
+                node = child
+            terminal[node] = True
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fallback = goto[state].get(char, 0)
+                fail[child] = fallback if fallback != child else 0
+                terminal[child] = terminal[child] or terminal[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._terminal = terminal
+
+    def search(self, text: str) -> bool:
+        """Return True if any keyword occurs in ``text``."""
+        if self._keywords is not None:
+            return any(keyword in text for keyword in self._keywords)
+
+        goto, fail, terminal = self._goto, self._fail, self._terminal
+        if terminal[0]:
+            # the empty keyword matches everywhere
+            return True
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if terminal[node]:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        """Return the number of trie nodes (a proxy for memory use)."""
+        return len(self._goto)
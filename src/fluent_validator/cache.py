@@ -0,0 +1,122 @@
+"""Memoization of validation outcomes for fluent_validator.
+
+ResultCache remembers whether a value passed a spec, with LRU eviction. Only
+values of immutable built-in types (and tuples/frozensets of them) are cached,
+keyed together with their types so that ``1``, ``1.0`` and ``True`` (which are
+equal and hash alike) get separate entries; any other value bypasses the cache.
+Values that are equal while rendering differently (``0.0`` and ``-0.0``,
+``Decimal("1")`` and ``Decimal("1.0")``, the same instant in two time zones) are
+keyed by their ``repr``, and NaNs, never equal to themselves, are not cached.
+"""
+
+import cmath
+import datetime
+import enum
+import fractions
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+_IMMUTABLE_TYPES = frozenset(
+    {
+        bool,
+        int,
+        str,
+        bytes,
+        type(None),
+        fractions.Fraction,
+        datetime.date,
+        datetime.timedelta,
+    },
+)
+
+# equal values of these types may still differ (sign of zero, exponent, time zone, fold)
+_KEYED_BY_REPR = frozenset({float, complex, Decimal, datetime.datetime, datetime.time})
+_NAN_CHECKS: dict[type, Callable[[Any], bool]] = {float: math.isnan, complex: cmath.isnan, Decimal: Decimal.is_nan}
+
+_UNCACHEABLE = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`ResultCache`, in the spirit of ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    bypassed: int
+    maxsize: int | None
+    currsize: int
+
+
+def cache_key(value: Any) -> Any:
+    """Return a typed key for ``value``, or ``_UNCACHEABLE`` if it may be mutable or unhashable."""
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES or isinstance(value, enum.Enum):
+        return (value_type, value)
+    if value_type in _KEYED_BY_REPR:
+        if value_type in _NAN_CHECKS and _NAN_CHECKS[value_type](value):
+            # a NaN lookup would never hit, so each one would add an entry
+            return _UNCACHEABLE
+        return (value_type, repr(value))
+    if value_type is tuple or value_type is frozenset:
+        keys = []
+        for item in value:
+            key = cache_key(item)
+            if key is _UNCACHEABLE:
+                return _UNCACHEABLE
+            keys.append(key)
+        return (value_type, value_type(keys))
+    return _UNCACHEABLE
+
+
+class ResultCache:
+    """LRU cache of validation outcomes; ``maxsize=None`` never evicts."""
+
+    __slots__ = ("_entries", "_lock", "bypassed", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize: int | None = 1024):
+        """Create an empty cache holding at most ``maxsize`` outcomes."""
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError(f"maxsize must be positive or None, got {maxsize}")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, bool] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def lookup(self, value: Any, compute: Callable[[Any], bool]) -> bool:
+        """Return the cached outcome for ``value``, calling ``compute(value)`` on a miss."""
+        key = cache_key(value)
+        if key is _UNCACHEABLE:
+            self.bypassed += 1
+            return compute(value)
+
+        entries = self._entries
+        with self._lock:
+            outcome = entries.get(key)
+            if outcome is not None:
+                self.hits += 1
+                if self.maxsize is not None:
+                    entries.move_to_end(key)
+                return outcome
+            self.misses += 1
+
+        outcome = compute(value)
+        with self._lock:
+            entries[key] = outcome
+            if self.maxsize is not None and len(entries) > self.maxsize:
+                entries.popitem(last=False)
+        return outcome
+
+    def info(self) -> CacheInfo:
+        """Return the hit/miss statistics and current size."""
+        return CacheInfo(self.hits, self.misses, self.bypassed, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Drop every cached outcome and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.bypassed = 0
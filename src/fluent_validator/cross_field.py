@@ -0,0 +1,41 @@
+"""Cross-field record validations for fluent_validator.
+
+A CrossFieldRule checks a predicate over several fields of one record (a
+mapping or an object such as a dataclass) and declares which fields it reads,
+so incremental revalidation knows which rules a changed field affects.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+MISSING = object()
+
+
+def read_field(record: Any, name: Any) -> Any:
+    """Return field ``name`` of a mapping or object record, or ``MISSING``."""
+    if type(record) is dict or isinstance(record, Mapping):
+        return record.get(name, MISSING)
+    return getattr(record, name, MISSING)
+
+
+class CrossFieldRule:
+    """Validation calling ``predicate(*values)`` with the values of ``fields``.
+
+    The rule fails when one of the fields is missing from the record.
+    """
+
+    __slots__ = ("fields", "predicate")
+
+    def __init__(self, fields: Iterable[Any], predicate: Callable[..., bool]):
+        """Store the fields read by ``predicate``, in argument order."""
+        self.fields = tuple(fields)
+        if not self.fields:
+            raise ValueError("A cross-field rule needs at least one field")
+        self.predicate = predicate
+
+    def __call__(self, record: Any) -> bool:
+        """Return True if the fields are present and satisfy the predicate."""
+        values = [read_field(record, name) for name in self.fields]
+        if any(value is MISSING for value in values):
+            return False
+        return bool(self.predicate(*values))
@@ -0,0 +1,186 @@
+"""Dataclass field validation for fluent_validator.
+
+Specs are attached to dataclass fields through ``field(metadata={"validator": spec})``
+(or :func:`validated_field`) and/or the :func:`validated` class decorator. The
+field checks are compiled once per class into a :class:`DataclassRule` cached on
+the class, so validating an instance never reflects over ``dataclasses.fields``.
+"""
+
+import dataclasses
+import functools
+from collections.abc import Callable, Iterator, Mapping
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .exceptions import ValidationError
+from .messages import Message, format_value
+from .nested import Checks, Failure, NestedRule, compile_checks, is_deep, run_checks
+from .paths import PathNode, format_path, path_tuple
+
+if TYPE_CHECKING:
+    from .validator_spec import ValidatorSpec
+
+VALIDATOR_METADATA_KEY = "validator"
+_RULE_ATTRIBUTE = "__fluent_validator_rule__"
+_EXTRA_SPECS_ATTRIBUTE = "__fluent_validator_fields__"
+
+NOT_A_DATACLASS_MSG = "Should be a dataclass instance (rule: {rule})"
+
+T = TypeVar("T", bound=type)
+
+
+class DataclassRule(NestedRule):
+    """Compiled field checks of one dataclass."""
+
+    __slots__ = ("_checks", "cls", "deep")
+
+    def __init__(self, cls: type):
+        """Collect the field specs of ``cls`` from field metadata and :func:`validated`."""
+        extra_specs: Mapping[str, ValidatorSpec] = getattr(cls, _EXTRA_SPECS_ATTRIBUTE, {})
+        specs: dict[str, ValidatorSpec] = {}
+        for field in dataclasses.fields(cls):
+            spec = extra_specs.get(field.name) or field.metadata.get(VALIDATOR_METADATA_KEY)
+            if spec is not None:
+                specs[field.name] = spec
+
+        unknown = set(extra_specs) - {field.name for field in dataclasses.fields(cls)}
+        if unknown:
+            raise ValueError(f"{cls.__name__} has no dataclass fields named {sorted(unknown)}")
+
+        self.cls = cls
+        self._checks = tuple((name, attrgetter(name), compile_checks(spec)) for name, spec in specs.items())
+        self.deep = is_deep(checks for _, _, checks in self._checks)
+
+    def parts(self, obj: Any) -> Iterator[tuple[Any, Checks]]:
+        """Return ``(value, checks)`` pairs for the validated fields of ``obj``."""
+        return ((get_value(obj), checks) for _, get_value, checks in self._checks)
+
+    def failure_parts(
+        self,
+        obj: Any,
+        path: PathNode | None,
+    ) -> tuple[list[Failure], Iterator[tuple[Any, Checks, PathNode | None]]]:
+        """Return the validated fields of ``obj`` keyed by field name."""
+        return [], ((get_value(obj), checks, PathNode(name, path)) for name, get_value, checks in self._checks)
+
+    def __call__(self, obj: Any) -> bool:
+        """Return True if every validated field of ``obj`` passes its spec."""
+        if self.deep:
+            return run_checks(obj, ((), (self,), ()))
+        for _, get_value, (fns, _, _) in self._checks:
+            value = get_value(obj)
+            for fn in fns:
+                if not fn(value):
+                    return False
+        return True
+
+
+def rule_for(cls: type) -> DataclassRule:
+    """Return the compiled :class:`DataclassRule` of dataclass ``cls``, compiling it on first use."""
+    rule = cls.__dict__.get(_RULE_ATTRIBUTE)
+    if rule is None:
+        rule = DataclassRule(cls)
+        setattr(cls, _RULE_ATTRIBUTE, rule)
+    return rule
+
+
+def has_valid_fields(obj: Any) -> bool:
+    """Return True if ``obj`` is a dataclass instance whose validated fields all pass."""
+    cls = type(obj)
+    rule = cls.__dict__.get(_RULE_ATTRIBUTE)
+    if rule is None:
+        if not dataclasses.is_dataclass(cls) or isinstance(obj, type):
+            return False
+        rule = rule_for(cls)
+    return rule(obj)
+
+
+def _has_valid_fields_failures(obj: Any, path: PathNode | None = None) -> list[tuple[PathNode | None, Message]]:
+    if not dataclasses.is_dataclass(obj) or isinstance(obj, type):
+        return [(path, NOT_A_DATACLASS_MSG.format(rule="has_valid_fields"))]
+    return rule_for(type(obj)).failures(obj, path)
+
+
+has_valid_fields.failures = _has_valid_fields_failures  # type: ignore[attr-defined]
+
+
+def has_invalid_fields(obj: Any) -> bool:
+    """Return True if ``obj`` is a dataclass instance with at least one validated field failing.
+
+    Values that are not dataclass instances have no fields, so they fail too.
+    """
+    if not dataclasses.is_dataclass(obj) or isinstance(obj, type):
+        return False
+    return not has_valid_fields(obj)
+
+
+def _has_invalid_fields_failures(obj: Any, path: PathNode | None = None) -> list[tuple[PathNode | None, Message]]:
+    if not dataclasses.is_dataclass(obj) or isinstance(obj, type):
+        return [(path, NOT_A_DATACLASS_MSG.format(rule="has_invalid_fields"))]
+    # the fields pass: the rule message explains the failure
+    return []
+
+
+has_invalid_fields.failures = _has_invalid_fields_failures  # type: ignore[attr-defined]
+
+
+def validated_field(spec: "ValidatorSpec", **kwargs: Any) -> Any:
+    """Return a :func:`dataclasses.field` whose value is validated by ``spec``."""
+    metadata = {**kwargs.pop("metadata", {}), VALIDATOR_METADATA_KEY: spec}
+    return dataclasses.field(metadata=metadata, **kwargs)
+
+
+def validated(
+    cls: T | None = None,
+    *,
+    fields: Mapping[str, "ValidatorSpec"] | None = None,
+    validate_on_init: bool = True,
+) -> T | Callable[[T], T]:
+    """Class decorator compiling the field specs of a dataclass once.
+
+    ``fields`` adds or overrides specs by field name. With ``validate_on_init``
+    (default) instances are validated at the end of ``__init__`` (after any
+    user-defined ``__post_init__``) and a :class:`ValidationError` naming the
+    failing fields is raised. Subclasses inherit the specs and get their own
+    compiled rule. Apply it on top of ``@dataclass``.
+    """
+
+    def decorate(cls: T) -> T:
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f"@validated must be applied to a dataclass, got {cls!r}")
+        if fields:
+            setattr(cls, _EXTRA_SPECS_ATTRIBUTE, {**getattr(cls, _EXTRA_SPECS_ATTRIBUTE, {}), **fields})
+        rule_for(cls)
+
+        if validate_on_init:
+            # resolved through the MRO, so an inherited __post_init__ keeps running; one added by
+            # @validated on a base class is unwrapped, since this one validates with the subclass rule
+            inherited_post_init = getattr(cls, "__post_init__", None)
+            original_post_init = getattr(inherited_post_init, "original_post_init", inherited_post_init)
+
+            def __post_init__(self: Any, *args: Any) -> None:
+                if original_post_init is not None:
+                    original_post_init(self, *args)
+                rule = rule_for(type(self))
+                if not rule(self):
+                    errors = [(path_tuple(node), msg) for node, msg in rule.failures(self)]
+                    details = "; ".join(f"{format_path(path)}: {msg}" for path, msg in errors)
+                    raise ValidationError(f"The value {format_value(self)} failed validation: {details}", errors=errors)
+
+            __post_init__.original_post_init = original_post_init  # type: ignore[attr-defined]
+            cls.__post_init__ = __post_init__
+            if inherited_post_init is None:
+                # the generated __init__ only calls __post_init__ if it existed at @dataclass time
+                original_init = cls.__init__
+
+                @functools.wraps(original_init)
+                def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+                    original_init(self, *args, **kwargs)
+                    __post_init__(self)
+
+                cls.__init__ = __init__
+        return cls
+
+    if cls is None:
+        return decorate
+    return decorate(cls)
@@ -0,0 +1,143 @@
+"""Failure event hooks for fluent_validator.
+
+Specs attached to a :class:`FailureEvents` hub (see ``ValidatorSpec.on_failure``)
+append a compact :class:`FailureEvent` tuple to a bounded ring buffer for every
+failing rule. A background thread drains the buffer in batches and hands each
+batch to the registered sinks (a log, a file, a metrics client, ...), so slow
+sinks never run on the validation path. When the buffer is full the oldest
+events are dropped and counted instead of blocking.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+
+from .messages import format_value
+
+logger = logging.getLogger(__name__)
+
+
+class FailureEvent(NamedTuple):
+    """One failing rule: which spec, which rule, which item index (if any) and a bounded value repr."""
+
+    spec_id: str
+    rule: str
+    index: int | None
+    value: str
+
+
+Sink = Callable[[list[FailureEvent]], Any]
+
+
+class FailureEvents:
+    """Ring buffer of failure events delivered in batches to sinks by a background thread.
+
+    ``capacity`` bounds the buffer, ``batch_size`` the number of events per sink
+    call and ``flush_interval`` (seconds) how often the thread wakes up. Sink
+    exceptions are logged and counted in :attr:`sink_errors`.
+    """
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def __init__(
+        self,
+        sinks: Iterable[Sink] = (),
+        *,
+        capacity: int = 65_536,
+        batch_size: int = 512,
+        flush_interval: float = 0.5,
+    ):
+        """Create the buffer and start the delivery thread."""
+        if capacity <= 0 or batch_size <= 0:
+            raise ValueError("capacity and batch_size must be positive")
+        self.sinks: list[Sink] = list(sinks)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.delivered = 0
+        self.sink_errors = 0
+        self._buffer: deque[FailureEvent] = deque(maxlen=capacity)
+        self._drain_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="fluent-validator-events", daemon=True)
+        self._thread.start()
+
+    def add_sink(self, sink: Sink) -> None:
+        """Register ``sink``, called with lists of :class:`FailureEvent`."""
+        self.sinks.append(sink)
+
+    def emit(self, spec_id: str, rule: Any, index: int | None, value: Any) -> None:
+        """Queue a failure event; never blocks and drops the oldest event when full."""
+        buffer = self._buffer
+        if len(buffer) == buffer.maxlen:
+            self.dropped += 1
+        buffer.append(FailureEvent(spec_id, str(rule), index, format_value(value)))
+
+    def _drain(self) -> int:
+        buffer, popleft = self._buffer, self._buffer.popleft
+        delivered = 0
+        while buffer:
+            batch = []
+            try:
+                for _ in range(self.batch_size):
+                    batch.append(popleft())
+            except IndexError:
+                pass
+            for sink in self.sinks:
+                try:
+                    sink(batch)
+                except Exception:  # a failing sink must not stop the delivery thread
+                    self.sink_errors += 1
+                    logger.exception("Failure event sink %r raised", sink)
+            delivered += len(batch)
+        self.delivered += delivered
+        return delivered
+
+    def flush(self) -> int:
+        """Deliver every queued event now, in the calling thread; return how many were delivered."""
+        with self._drain_lock:
+            return self._drain()
+
+    def close(self) -> None:
+        """Stop the delivery thread after delivering the queued events."""
+        self._stopped.set()
+        self._thread.join()
+        self.flush()
+
+    def __enter__(self) -> Self:
+        """Return the hub; it is closed when the block exits."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the hub, delivering the queued events."""
+        self.close()
+
+
+def logging_sink(target: logging.Logger | None = None, level: int = logging.WARNING) -> Sink:
+    """Return a sink logging one record per event to ``target`` (default: this module's logger)."""
+    target = target or logger
+
+    def sink(events: list[FailureEvent]) -> None:
+        if not target.isEnabledFor(level):
+            return
+        for event in events:
+            target.log(level, "%s failed %s at index %s: %s", event.spec_id, event.rule, event.index, event.value)
+
+    return sink
+
+
+def jsonl_sink(path: str | Path) -> Sink:
+    """Return a sink appending one JSON object per event to the file at ``path``."""
+    path = Path(path)
+
+    def sink(events: list[FailureEvent]) -> None:
+        with path.open("a", encoding="utf-8") as file:
+            file.writelines(json.dumps(event._asdict()) + "\n" for event in events)
+
+    return sink
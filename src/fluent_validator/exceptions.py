@@ -3,8 +3,22 @@
 ValidationError is raised when a validation fails.
 """
 
+from typing import Any
+
 
 class ValidationError(ValueError):
-    """Raised when a validation fails."""
+    """Raised when a validation fails.
+
+    ``errors`` lists ``(path, message)`` pairs, where ``path`` is a tuple of keys and
+    indexes such as ``("orders", 3, "sku")`` (``()`` for the validated value itself).
+    """
+
+    def __init__(self, message: str = "", errors: list[tuple[tuple, Any]] | None = None):
+        """Store the message and the structured ``(path, message)`` errors."""
+        super().__init__(message)
+        self.errors: list[tuple[tuple, Any]] = errors if errors is not None else []
 
-    pass
+    @property
+    def paths(self) -> list[tuple]:
+        """Return the paths of the failing values, in reporting order."""
+        return [path for path, _ in self.errors]
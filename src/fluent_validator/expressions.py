@@ -0,0 +1,374 @@
+"""Declarative cross-field conditions for fluent_validator.
+
+``field("start").lt(field("end"))`` builds a :class:`Condition` instead of an
+opaque lambda. :class:`ConditionGroup` compiles several conditions into one
+plan: identical sub-expressions become a single node, so each field is read once
+per record and a shared computation (e.g. ``field("items").sum("price")``) is
+evaluated once for every condition using it. Nodes whose inputs are missing or
+could not be computed are skipped together with the conditions depending on them.
+"""
+
+import operator
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from .cross_field import MISSING, CrossFieldRule, read_field
+from .messages import LazyMessage, Message
+from .nested import Checks, run_checks
+from .paths import PathNode
+
+# raised by comparisons/arithmetic on values of the wrong type; the node is then skipped
+_EVALUATION_ERRORS = (TypeError, ValueError, ArithmeticError, AttributeError, LookupError)
+
+_SKIPPED = object()
+
+
+def _holds(value: Any) -> bool:
+    """Return True if a condition node evaluated to a truthy value (not skipped)."""
+    if value is _SKIPPED:
+        return False
+    try:
+        return bool(value)
+    except _EVALUATION_ERRORS:
+        return False
+
+
+def _sum(values: Iterable[Any], attribute: Any) -> Any:
+    if attribute is None:
+        return sum(values)
+    return sum(read_field(value, attribute) for value in values)
+
+
+_OPERATIONS: dict[str, Callable[..., Any]] = {
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "neg": operator.neg,
+    "abs": abs,
+    "len": len,
+    "sum": _sum,
+    "apply": lambda value, fn: fn(value),
+    "and": lambda *values: all(values),
+    "or": lambda *values: any(values),
+    "not": operator.not_,
+}
+
+_SYMBOLS = {
+    "lt": "<",
+    "le": "<=",
+    "gt": ">",
+    "ge": ">=",
+    "eq": "==",
+    "ne": "!=",
+    "add": "+",
+    "sub": "-",
+    "mul": "*",
+    "truediv": "/",
+    "and": "AND",
+    "or": "OR",
+}
+
+
+def _as_expression(value: Any) -> "Expression":
+    return value if isinstance(value, Expression) else Expression("const", (value,))
+
+
+class Expression:
+    """Value computed from the fields of a record.
+
+    Build expressions with :func:`field`, arithmetic operators, :meth:`sum`,
+    :meth:`len` and :meth:`apply`, then compare them with :meth:`lt`, :meth:`eq`, ...
+    """
+
+    __slots__ = ("args", "op")
+
+    def __init__(self, op: str, args: tuple):
+        """Store operation ``op`` applied to ``args`` (expressions, or raw values for leaves)."""
+        self.op = op
+        self.args = args
+
+    def key(self) -> tuple:
+        """Return a structural key: equal keys denote the same computation."""
+        if self.op == "field":
+            return ("field", self.args[0])
+        if self.op in ("const", "sum", "apply"):
+            try:
+                hash(self.args)
+                operands = self.args
+            except TypeError:
+                operands = tuple(map(id, self.args))
+            if self.op == "const":
+                return ("const", type(self.args[0]), operands)
+            return (self.op, self.args[0].key(), operands[1:])
+        return (self.op, *(arg.key() for arg in self.args))
+
+    def fields(self) -> tuple:
+        """Return the names of the fields read by the expression, in first-use order."""
+        names: dict[Any, None] = {}
+        stack = [self]
+        while stack:
+            expression = stack.pop()
+            if expression.op == "field":
+                names[expression.args[0]] = None
+            elif expression.op != "const":
+                stack.extend(arg for arg in reversed(expression.args) if isinstance(arg, Expression))
+        return tuple(names)
+
+    def _binary(self, op: str, other: Any) -> "Expression":
+        return Expression(op, (self, _as_expression(other)))
+
+    def _reflected(self, op: str, other: Any) -> "Expression":
+        return Expression(op, (_as_expression(other), self))
+
+    def len(self) -> "Expression":
+        """Return the length of the value."""
+        return Expression("len", (self,))
+
+    def sum(self, attribute: Any = None) -> "Expression":
+        """Return the sum of the items, or of ``attribute`` (key or attribute name) of each item."""
+        return Expression("sum", (self, attribute))
+
+    def apply(self, fn: Callable[[Any], Any]) -> "Expression":
+        """Return ``fn(value)``."""
+        return Expression("apply", (self, fn))
+
+    def lt(self, other: Any) -> "Condition":
+        """Return the condition ``self < other``."""
+        return Condition("lt", (self, _as_expression(other)))
+
+    def le(self, other: Any) -> "Condition":
+        """Return the condition ``self <= other``."""
+        return Condition("le", (self, _as_expression(other)))
+
+    def gt(self, other: Any) -> "Condition":
+        """Return the condition ``self > other``."""
+        return Condition("gt", (self, _as_expression(other)))
+
+    def ge(self, other: Any) -> "Condition":
+        """Return the condition ``self >= other``."""
+        return Condition("ge", (self, _as_expression(other)))
+
+    def eq(self, other: Any) -> "Condition":
+        """Return the condition ``self == other``."""
+        return Condition("eq", (self, _as_expression(other)))
+
+    def ne(self, other: Any) -> "Condition":
+        """Return the condition ``self != other``."""
+        return Condition("ne", (self, _as_expression(other)))
+
+    def __add__(self, other: Any) -> "Expression":
+        """Return ``self + other``."""
+        return self._binary("add", other)
+
+    def __radd__(self, other: Any) -> "Expression":
+        """Return ``other + self``."""
+        return self._reflected("add", other)
+
+    def __sub__(self, other: Any) -> "Expression":
+        """Return ``self - other``."""
+        return self._binary("sub", other)
+
+    def __rsub__(self, other: Any) -> "Expression":
+        """Return ``other - self``."""
+        return self._reflected("sub", other)
+
+    def __mul__(self, other: Any) -> "Expression":
+        """Return ``self * other``."""
+        return self._binary("mul", other)
+
+    def __rmul__(self, other: Any) -> "Expression":
+        """Return ``other * self``."""
+        return self._reflected("mul", other)
+
+    def __truediv__(self, other: Any) -> "Expression":
+        """Return ``self / other``."""
+        return self._binary("truediv", other)
+
+    def __rtruediv__(self, other: Any) -> "Expression":
+        """Return ``other / self``."""
+        return self._reflected("truediv", other)
+
+    def __neg__(self) -> "Expression":
+        """Return ``-self``."""
+        return Expression("neg", (self,))
+
+    def __abs__(self) -> "Expression":
+        """Return ``abs(self)``."""
+        return Expression("abs", (self,))
+
+    def __bool__(self) -> bool:
+        """Refuse truth testing, which would silently bypass the expression."""
+        raise TypeError(f"{self!r} is evaluated per record; combine conditions with &, | and ~")
+
+    def __repr__(self) -> str:
+        """Return a debug representation with the rendered expression."""
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __str__(self) -> str:
+        """Render the expression, e.g. ``total == items.sum(price)``."""
+        op, args = self.op, self.args
+        if op == "field":
+            return str(args[0])
+        if op == "const":
+            return repr(args[0])
+        if op in ("sum", "apply"):
+            operand = "" if args[1] is None else getattr(args[1], "__name__", str(args[1]))
+            return f"{args[0]}.{op}({operand})"
+        if op in ("len", "abs"):
+            return f"{op}({args[0]})"
+        if op == "neg":
+            return f"-{args[0]}"
+        if op == "not":
+            return f"NOT ({args[0]})"
+        return f" {_SYMBOLS[op]} ".join(f"({arg})" if arg.op in _SYMBOLS else str(arg) for arg in args)
+
+
+class Condition(Expression):
+    """Boolean expression over the fields of a record; combine with ``&``, ``|`` and ``~``."""
+
+    __slots__ = ()
+
+    def __and__(self, other: "Condition") -> "Condition":
+        """Return the condition ``self AND other``."""
+        return Condition("and", (self, other))
+
+    def __or__(self, other: "Condition") -> "Condition":
+        """Return the condition ``self OR other``."""
+        return Condition("or", (self, other))
+
+    def __invert__(self) -> "Condition":
+        """Return the condition ``NOT self``."""
+        return Condition("not", (self,))
+
+
+def field(name: Any) -> Expression:
+    """Return an expression reading field ``name`` (mapping key or attribute) of the record."""
+    return Expression("field", (name,))
+
+
+class ConditionGroup:
+    """Validation checking several conditions against a record through one shared plan.
+
+    The plan is a list of unique nodes in dependency order, one per distinct
+    sub-expression. ``field_checks`` maps field names to the ``(required, checks)``
+    entries of the record spec; conditions reading a field failing those checks are
+    not reported, since the field error already explains them.
+    """
+
+    __slots__ = ("_conditions", "_field_checks", "_nodes", "conditions")
+
+    # failures() may be empty on purpose: conditions reading fields reported as failing are left out
+    defers_failures = True
+
+    def __init__(
+        self,
+        conditions: Iterable[tuple[Condition, Message]],
+        field_checks: Mapping[Any, list[tuple[bool, Checks]]] | None = None,
+    ):
+        """Compile ``(condition, message)`` pairs into a single evaluation plan."""
+        self.conditions = tuple(conditions)
+        if not self.conditions:
+            raise ValueError("At least one condition is required")
+        for condition, _ in self.conditions:
+            if not isinstance(condition, Condition):
+                raise TypeError(f"Expected a condition such as field('a').lt(field('b')), got {condition!r}")
+
+        index: dict[tuple, int] = {}
+        nodes: list[tuple] = []
+
+        def add(expression: Expression) -> int:
+            key = expression.key()
+            position = index.get(key)
+            if position is not None:
+                return position
+            if expression.op in ("field", "const"):
+                node = (expression.op, expression.args[0], ())
+            else:
+                inputs = tuple(add(arg) for arg in expression.args if isinstance(arg, Expression))
+                extra = tuple(arg for arg in expression.args if not isinstance(arg, Expression))
+                node = (_OPERATIONS[expression.op], extra, inputs)
+            nodes.append(node)
+            position = index[key] = len(nodes) - 1
+            return position
+
+        self._conditions = tuple((add(condition), condition.fields(), msg) for condition, msg in self.conditions)
+        self._nodes = tuple(nodes)
+        self._field_checks = dict(field_checks or {})
+
+    def evaluate(self, record: Any, *, stop_on_failure: bool = False) -> list[Any] | None:
+        """Return the value of every node for ``record`` (``_SKIPPED`` for skipped nodes).
+
+        With ``stop_on_failure`` return None as soon as a condition does not hold.
+        """
+        values: list[Any] = []
+        append = values.append
+        condition_nodes = {position for position, _, _ in self._conditions} if stop_on_failure else ()
+        for position, (operation, operand, inputs) in enumerate(self._nodes):
+            if operation == "field":
+                value = read_field(record, operand)
+                append(_SKIPPED if value is MISSING else value)
+            elif operation == "const":
+                append(operand)
+            else:
+                arguments = [values[i] for i in inputs]
+                if any(argument is _SKIPPED for argument in arguments):
+                    append(_SKIPPED)
+                else:
+                    try:
+                        append(operation(*arguments, *operand))
+                    except _EVALUATION_ERRORS:
+                        append(_SKIPPED)
+            if position in condition_nodes and not _holds(values[-1]):
+                return None
+        return values
+
+    def failures(self, record: Any, path: PathNode | None = None) -> list[tuple[PathNode | None, Message]]:
+        """Return the messages of the conditions not holding, skipping those reading failed fields."""
+        values = self.evaluate(record)
+        field_checks = self._field_checks
+        failed_fields: dict[Any, bool] = {}
+
+        def field_failed(name: Any) -> bool:
+            if name not in failed_fields:
+                entries = field_checks.get(name, ())
+                value = read_field(record, name)
+                if value is MISSING:
+                    failed_fields[name] = any(required for required, _ in entries)
+                else:
+                    failed_fields[name] = not all(run_checks(value, checks) for _, checks in entries)
+            return failed_fields[name]
+
+        return [
+            (path, msg)
+            for position, names, msg in self._conditions
+            if not _holds(values[position]) and not any(field_failed(name) for name in names)
+        ]
+
+    def rules(self) -> list[tuple[CrossFieldRule, Message]]:
+        """Return one :class:`CrossFieldRule` per condition, for incremental revalidation."""
+        rules = []
+        for condition, msg in self.conditions:
+            group = ConditionGroup([(condition, msg)])
+            names = condition.fields()
+
+            def predicate(*values: Any, group: ConditionGroup = group, names: tuple = names) -> bool:
+                return group(dict(zip(names, values, strict=True)))
+
+            rules.append((CrossFieldRule(names, predicate), msg))
+        return rules
+
+    def __call__(self, record: Any) -> bool:
+        """Return True if every condition holds for ``record``."""
+        return self.evaluate(record, stop_on_failure=True) is not None
+
+
+def condition_message(condition: Condition) -> LazyMessage:
+    """Return the default message of ``condition``."""
+    return LazyMessage("Should satisfy {condition} (rule: satisfies)", condition=condition)
@@ -5,11 +5,19 @@ Validator. Each function returns True when the predicate matches the
 provided value; negative counterparts are also provided.
 """
 
-import dataclasses
-from collections.abc import Iterable
+import re
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Container, Iterable, Iterator
 from decimal import Decimal
+from functools import lru_cache
+from itertools import islice, pairwise
+from operator import length_hint
 from typing import Any, Literal
 
+from .automaton import KeywordAutomaton
+from .intervals import IntervalSet
+
 
 def is_instance_of(obj: Any, types: type | tuple[type, ...]) -> bool:
     """Return True if ``obj`` is an instance of the given ``types``.
@@ -56,6 +64,8 @@ def is_iterable(obj: Any) -> bool:
     """Return True if ``obj`` is an iterable.
 
     Strings are handled by :func:`is_string` if needed by higher-level validators.
+    ``isinstance`` against an ABC is answered from the ABC's own per-type cache
+    after the first check of each class.
 
     Args:
         obj: Value to check.
@@ -64,7 +74,7 @@ def is_iterable(obj: Any) -> bool:
         True if ``isinstance(obj, Iterable)``.
 
     """
-    return is_instance_of(obj, Iterable)
+    return isinstance(obj, Iterable)
 
 
 def is_not_iterable(obj: Any) -> bool:
@@ -72,13 +82,17 @@ def is_not_iterable(obj: Any) -> bool:
     return not is_iterable(obj)
 
 
+_DATACLASS_FIELDS = "__dataclass_fields__"
+
+
 def is_dataclass(obj: Any) -> bool:
     """Return True if ``obj`` is a dataclass instance or dataclass type.
 
-    Uses :mod:`dataclasses.is_dataclass` under the hood.
+    Same check as :func:`dataclasses.is_dataclass`, inlined: a class-level
+    attribute lookup served by the interpreter's per-type attribute cache.
 
     """
-    return dataclasses.is_dataclass(obj)
+    return hasattr(obj if isinstance(obj, type) else type(obj), _DATACLASS_FIELDS)
 
 
 def is_not_dataclass(obj: Any) -> bool:
@@ -96,7 +110,7 @@ def is_string(obj: Any) -> bool:
         True if ``isinstance(obj, str)``.
 
     """
-    return is_instance_of(obj, str)
+    return isinstance(obj, str)
 
 
 def is_not_string(obj: Any) -> bool:
@@ -104,9 +118,12 @@ def is_not_string(obj: Any) -> bool:
     return not is_string(obj)
 
 
+_NUMBER_TYPES = (int, float, Decimal)
+
+
 def is_number(obj: Any) -> bool:
     """Return True if ``obj`` is a number (int, float or Decimal)."""
-    return is_instance_of(obj, (int, float, Decimal))
+    return isinstance(obj, _NUMBER_TYPES)
 
 
 def is_not_number(obj: Any) -> bool:
@@ -116,7 +133,7 @@ def is_not_number(obj: Any) -> bool:
 
 def is_bool(obj: Any) -> bool:
     """Return True if ``obj`` is a boolean."""
-    return is_instance_of(obj, bool)
+    return isinstance(obj, bool)
 
 
 def is_not_bool(obj: Any) -> bool:
@@ -247,76 +264,202 @@ def is_not_between(
     return not is_between(obj, lower_bound, upper_bound, closed)
 
 
-def contains_at_least(obj: Any, count: int) -> bool:
-    """Return True if the iterable ``obj`` contains at least ``count`` elements."""
-    if obj is None:
-        return False
+class Peekable(Iterator):
+    """Iterator wrapper that can look ahead without losing items.
+
+    Items read by :meth:`peek` are buffered and yielded again on iteration, so size
+    predicates can inspect a generator and the caller can still consume all of it::
+
+        rows = Peekable(read_rows())
+        Validator.contains_at_least(1).validate(rows)
+        for row in rows:  # buffered rows first, then the rest
+            ...
+
+    """
+
+    __slots__ = ("_buffer", "_iterator")
+
+    def __init__(self, iterable: Iterable):
+        """Wrap ``iterable`` without reading from it."""
+        self._iterator = iter(iterable)
+        self._buffer: deque = deque()
+
+    def peek(self, count: int) -> int:
+        """Buffer up to ``count`` items and return how many are available (at most ``count``)."""
+        buffer = self._buffer
+        missing = count - len(buffer)
+        if missing > 0:
+            buffer.extend(islice(self._iterator, missing))
+        return min(len(buffer), count)
+
+    def __next__(self) -> Any:
+        """Return the next buffered item, or the next item of the wrapped iterator."""
+        if self._buffer:
+            return self._buffer.popleft()
+        return next(self._iterator)
+
+    def __length_hint__(self) -> int:
+        """Return the buffered count plus the wrapped iterator's length hint."""
+        return len(self._buffer) + length_hint(self._iterator)
+
+
+# builtin iterators whose length hint is the exact number of remaining items
+_EXACT_LENGTH_HINT_TYPES = frozenset(
+    type(iter(empty)) for empty in ([], (), range(0), "", b"", {}, {}.values(), {}.items(), set())
+)
+
+
+def _count_up_to(obj: Any, limit: int) -> int:
+    """Return the number of items in ``obj``, counting at most ``limit`` when it has no length.
+
+    Sized objects, :class:`Peekable` wrappers and builtin iterators with an exact
+    length hint are not consumed; other iterators are advanced by at most ``limit``.
+    """
     try:
-        return len(obj) >= count
+        return len(obj)
     except TypeError:
-        # not sized; iterate until count is reached
-        c = 0
-        for _ in obj:
-            c += 1
-            if c >= count:
-                return True
+        pass
+    # negative counts can never be met by fewer items; islice rejects them
+    limit = max(limit, 0)
+    if isinstance(obj, Peekable):
+        return obj.peek(limit)
+    if type(obj) in _EXACT_LENGTH_HINT_TYPES:
+        return length_hint(obj)
+    count = 0
+    for _ in islice(obj, limit):
+        count += 1
+    return count
+
+
+def contains_at_least(obj: Any, count: int) -> bool:
+    """Return True if the iterable ``obj`` contains at least ``count`` elements.
+
+    Only the first ``count`` elements are read; wrap iterators in :class:`Peekable`
+    to keep them.
+    """
+    if obj is None:
         return False
+    return _count_up_to(obj, count) >= count
 
 
 def contains_at_most(obj: Any, count: int) -> bool:
-    """Return True if the iterable ``obj`` contains at most ``count`` elements."""
+    """Return True if the iterable ``obj`` contains at most ``count`` elements.
+
+    Only the first ``count + 1`` elements are read; wrap iterators in :class:`Peekable`
+    to keep them.
+    """
     if obj is None:
         return False
-    try:
-        return len(obj) <= count
-    except TypeError:
-        c = 0
-        for _ in obj:
-            c += 1
-            if c > count:
-                return False
-        return True
+    return _count_up_to(obj, count + 1) <= count
 
 
 def contains_exactly(obj: Any, count: int) -> bool:
-    """Return True if the iterable ``obj`` contains exactly ``count`` elements."""
+    """Return True if the iterable ``obj`` contains exactly ``count`` elements.
+
+    Only the first ``count + 1`` elements are read; wrap iterators in :class:`Peekable`
+    to keep them.
+    """
     if obj is None:
         return False
-    try:
-        return len(obj) == count
-    except TypeError:
-        c = 0
-        for _ in obj:
-            c += 1
-        return c == count
+    return _count_up_to(obj, count + 1) == count
+
+
+_LIST_TAG = object()
+_DICT_TAG = object()
+_FROZEN_CONTAINERS = (list, tuple, dict, set, frozenset)
+
+
+def _freeze_leaf(obj: Any) -> Any:
+    if isinstance(obj, bytearray):
+        return bytes(obj)
+    hash(obj)
+    return obj
+
+
+def _freeze(obj: Any) -> Any:
+    """Return a hashable stand-in for ``obj`` that compares equal exactly when ``obj`` does.
+
+    Lists and dicts are tagged so they never collide with tuples or other values they
+    are not equal to; sets become frozensets and bytearrays bytes, matching Python
+    equality. Nested containers are walked with an explicit stack, so the depth of
+    ``obj`` is not bounded by the recursion limit. Raises TypeError for unhashable
+    values that cannot be frozen, including containers that contain themselves.
+    """
+    if not isinstance(obj, _FROZEN_CONTAINERS):
+        return _freeze_leaf(obj)
+    # one frame per open container: (container, remaining children, frozen children)
+    stack = [(obj, iter(obj.values() if isinstance(obj, dict) else obj), [])]
+    open_ids = {id(obj)}
+    while True:
+        container, children, frozen = stack[-1]
+        for child in children:
+            if isinstance(child, _FROZEN_CONTAINERS):
+                if id(child) in open_ids:
+                    raise TypeError("Cannot freeze a container that contains itself")
+                open_ids.add(id(child))
+                stack.append((child, iter(child.values() if isinstance(child, dict) else child), []))
+                break
+            frozen.append(_freeze_leaf(child))
+        else:
+            stack.pop()
+            open_ids.discard(id(container))
+            if isinstance(container, list):
+                value = (_LIST_TAG, tuple(frozen))
+            elif isinstance(container, tuple):
+                value = tuple(frozen)
+            elif isinstance(container, dict):
+                value = (_DICT_TAG, frozenset(zip(container, frozen, strict=True)))
+            else:
+                value = frozenset(frozen)
+            if not stack:
+                return value
+            stack[-1][2].append(value)
 
 
 def has_unique_values(obj: Any) -> bool:
-    """Return True if the iterable ``obj`` contains only unique values."""
+    """Return True if the iterable ``obj`` contains only unique values.
+
+    Items are consumed one at a time and the check stops at the first duplicate.
+    Hashable items go through a set; unhashable lists, dicts, sets and bytearrays
+    are frozen into equivalent hashable values, and only values that cannot be
+    frozen are compared pairwise among themselves.
+    """
     if obj is None:
         return False
     try:
-        items = list(obj)
+        iterator = iter(obj)
     except TypeError:
         return False
 
-    try:
-        return len(set(items)) == len(items)
-    except TypeError:
-        # some elements may be unhashable; fall back to O(n^2) equality check
-        seen: list = []
-        for item in items:
-            for s in seen:
-                if item == s:
+    seen: set = set()
+    added = 0
+    unfrozen: list = []
+    for item in iterator:
+        try:
+            seen.add(item)
+        except TypeError:
+            try:
+                seen.add(_freeze(item))
+            except TypeError:
+                if item in unfrozen:
                     return False
-            seen.append(item)
-        return True
+                unfrozen.append(item)
+                continue
+        added += 1
+        if len(seen) != added:
+            return False
+    return True
 
 
 def is_empty(obj: Any) -> bool:
-    """Return True if ``obj`` is empty (length 0) or is None."""
+    """Return True if ``obj`` is empty (length 0) or is None.
+
+    A :class:`Peekable` is checked by looking ahead one item.
+    """
     if obj is None:
         return True
+    if isinstance(obj, Peekable):
+        return obj.peek(1) == 0
     try:
         return len(obj) == 0
     except TypeError:
@@ -348,8 +491,100 @@ def is_not_true(obj: Any) -> bool:
     return not is_true(obj)
 
 
+class _SortedLookup:
+    """Membership over orderable, unhashable values using binary search."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: tuple):
+        self._items = items
+
+    def __contains__(self, obj: Any) -> bool:
+        items = self._items
+        try:
+            index = bisect_left(items, obj)
+        except TypeError:
+            return False
+        return index < len(items) and items[index] == obj
+
+
+class _RangeLookup:
+    """Membership over a ``range`` using arithmetic, also for non-int numbers."""
+
+    __slots__ = ("_range",)
+
+    def __init__(self, rng: range):
+        self._range = rng
+
+    def __contains__(self, obj: Any) -> bool:
+        if not isinstance(obj, int):
+            # range.__contains__ falls back to a linear scan for non-int values
+            try:
+                as_int = int(obj)
+            except (TypeError, ValueError, OverflowError):
+                return False
+            if as_int != obj:
+                return False
+            obj = as_int
+        return obj in self._range
+
+
+def as_lookup(collection: Iterable) -> Container:
+    """Return a container answering ``obj in collection`` as fast as possible.
+
+    The collection is copied once into the best available structure (frozensets are
+    used as they are):
+
+      - ``range``: arithmetic membership (O(1)), also for integral floats/Decimals.
+      - all elements hashable: a ``frozenset`` (O(1) lookup).
+      - all elements orderable: a sorted tuple searched with :mod:`bisect` (O(log n)).
+      - otherwise: a tuple scanned linearly.
+
+    Strings and bytes are returned unchanged to keep substring semantics, and so are
+    values that cannot be iterated: :func:`is_in` then answers False for them.
+    """
+    if isinstance(collection, (str, bytes)):
+        return collection
+    if isinstance(collection, range):
+        return _RangeLookup(collection)
+
+    if type(collection) is frozenset:
+        return collection
+    if type(collection) in (list, tuple, set, dict):
+        # these can be iterated again, so the common all-hashable case needs no intermediate tuple
+        try:
+            return frozenset(collection)
+        except TypeError:
+            items = tuple(collection)
+    else:
+        try:
+            items = tuple(collection)
+        except TypeError:
+            return collection
+        try:
+            return frozenset(items)
+        except TypeError:
+            pass
+    if len(items) < 2:
+        # sorting fewer than two items compares nothing, so it proves nothing about ordering
+        return items
+    try:
+        ordered = tuple(sorted(items))
+    except TypeError:
+        return items
+    # partial orders (e.g. sets compared by inclusion) sort without error but cannot be bisected
+    if all(a < b or a == b for a, b in pairwise(ordered)):
+        return _SortedLookup(ordered)
+    return items
+
+
 def is_in(obj: Any, collection: Iterable) -> bool:
-    """Return True if ``obj`` is contained in ``collection``."""
+    """Return True if ``obj`` is contained in ``collection``.
+
+    For repeated checks against the same collection, prepare it once with
+    :func:`as_lookup`.
+
+    """
     try:
         return obj in collection
     except Exception:
@@ -359,3 +594,126 @@ def is_in(obj: Any, collection: Iterable) -> bool:
 def is_not_in(obj: Any, collection: Iterable) -> bool:
     """Return True if ``obj`` is not contained in ``collection``."""
     return not is_in(obj, collection)
+
+
+PATTERN_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile_cached(pattern: str | bytes, flags: int) -> re.Pattern:
+    return re.compile(pattern, flags)
+
+
+def compile_pattern(pattern: str | bytes | re.Pattern, flags: int = 0) -> re.Pattern:
+    """Return ``pattern`` compiled with ``flags`` through a bounded LRU cache shared by all specs.
+
+    Already compiled patterns are returned unchanged (``flags`` must then be 0).
+    """
+    if isinstance(pattern, re.Pattern):
+        if flags:
+            raise ValueError("Cannot set flags on an already compiled pattern")
+        return pattern
+    return _compile_cached(pattern, flags)
+
+
+def matches(obj: Any, pattern: str | re.Pattern, flags: int = 0) -> bool:
+    """Return True if ``obj`` is a string and ``pattern`` matches at its beginning (``re.match``)."""
+    try:
+        return compile_pattern(pattern, flags).match(obj) is not None
+    except TypeError:
+        return False
+
+
+def does_not_match(obj: Any, pattern: str | re.Pattern, flags: int = 0) -> bool:
+    """Return the negation of :func:`matches`."""
+    return not matches(obj, pattern, flags)
+
+
+def fullmatches(obj: Any, pattern: str | re.Pattern, flags: int = 0) -> bool:
+    """Return True if ``obj`` is a string entirely matched by ``pattern`` (``re.fullmatch``)."""
+    try:
+        return compile_pattern(pattern, flags).fullmatch(obj) is not None
+    except TypeError:
+        return False
+
+
+def does_not_fullmatch(obj: Any, pattern: str | re.Pattern, flags: int = 0) -> bool:
+    """Return the negation of :func:`fullmatches`."""
+    return not fullmatches(obj, pattern, flags)
+
+
+def starts_with(obj: Any, prefix: str | tuple[str, ...]) -> bool:
+    """Return True if ``obj`` is a string starting with ``prefix`` (or any of a tuple of prefixes)."""
+    return is_string(obj) and obj.startswith(prefix)
+
+
+def does_not_start_with(obj: Any, prefix: str | tuple[str, ...]) -> bool:
+    """Return the negation of :func:`starts_with`."""
+    return not starts_with(obj, prefix)
+
+
+def ends_with(obj: Any, suffix: str | tuple[str, ...]) -> bool:
+    """Return True if ``obj`` is a string ending with ``suffix`` (or any of a tuple of suffixes)."""
+    return is_string(obj) and obj.endswith(suffix)
+
+
+def does_not_end_with(obj: Any, suffix: str | tuple[str, ...]) -> bool:
+    """Return the negation of :func:`ends_with`."""
+    return not ends_with(obj, suffix)
+
+
+def has_length_between(obj: Any, min_length: int, max_length: int) -> bool:
+    """Return True if ``len(obj)`` is between ``min_length`` and ``max_length`` (inclusive)."""
+    try:
+        return min_length <= len(obj) <= max_length
+    except TypeError:
+        return False
+
+
+def has_length_not_between(obj: Any, min_length: int, max_length: int) -> bool:
+    """Return the negation of :func:`has_length_between`."""
+    return not has_length_between(obj, min_length, max_length)
+
+
+def contains_any_of(obj: Any, keywords: Iterable[str] | KeywordAutomaton) -> bool:
+    """Return True if the string ``obj`` contains any of ``keywords`` as a substring.
+
+    For repeated checks, pass a prebuilt :class:`~fluent_validator.automaton.KeywordAutomaton`
+    so every check is a single scan of ``obj``.
+
+    """
+    if not is_string(obj):
+        return False
+    automaton = keywords if isinstance(keywords, KeywordAutomaton) else KeywordAutomaton(keywords)
+    return automaton.search(obj)
+
+
+def contains_none_of(obj: Any, keywords: Iterable[str] | KeywordAutomaton) -> bool:
+    """Return the negation of :func:`contains_any_of`."""
+    return not contains_any_of(obj, keywords)
+
+
+def is_in_ranges(
+    obj: Any,
+    ranges: Iterable[tuple[Any, Any]] | IntervalSet,
+    closed: Literal["both", "left", "right", "none"] = "both",
+) -> bool:
+    """Return True if ``obj`` lies in any of the ``(lower, upper)`` ``ranges``.
+
+    ``closed`` controls inclusion of the bounds as in :func:`is_between`. NumPy arrays
+    are checked element-wise and pass only if every element lies in a range. For
+    repeated checks, pass a prebuilt :class:`~fluent_validator.intervals.IntervalSet`
+    (its own ``closed`` setting is used).
+
+    """
+    intervals = ranges if isinstance(ranges, IntervalSet) else IntervalSet(ranges, closed)
+    return intervals.contains_all(obj)
+
+
+def is_not_in_ranges(
+    obj: Any,
+    ranges: Iterable[tuple[Any, Any]] | IntervalSet,
+    closed: Literal["both", "left", "right", "none"] = "both",
+) -> bool:
+    """Return the negation of :func:`is_in_ranges`."""
+    return not is_in_ranges(obj, ranges, closed)
@@ -0,0 +1,170 @@
+"""Incremental revalidation of records for fluent_validator.
+
+IncrementalValidation keeps the per-field results of one record. After some
+fields change only those fields and the cross-field rules reading them are
+checked again, so revalidating a large form after each edit costs time
+proportional to the edit rather than to the record.
+"""
+
+import dataclasses
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from .cross_field import MISSING, CrossFieldRule, read_field
+from .dataclass_fields import has_valid_fields, rule_for
+from .expressions import ConditionGroup
+from .messages import Message
+from .nested import Checks, collect_failures, explain_failure, run_checks
+from .paths import PathNode, path_tuple
+from .profiling import unwrap
+from .schema import MISSING_FIELD_MSG, UNEXPECTED_FIELD_MSG, SchemaRule
+
+if TYPE_CHECKING:
+    from .validator_spec import ValidatorSpec
+
+
+class IncrementalValidation:
+    """Validation state of one record, refreshed only for the fields that changed.
+
+    Field specs come from the ``schema`` validations of the spec (mapping records)
+    or from the dataclass field specs checked by ``has_valid_fields``. Cross-field
+    rules are checked again when one of their fields changed and are skipped while
+    one of their fields fails. Any other validation of the spec reads the whole
+    record and is checked again on every revalidation.
+    """
+
+    def _check_field(self, name: Any) -> list[tuple[tuple, Message]]:
+        value = read_field(self.record, name)
+        errors: list[tuple[tuple, Message]] = []
+        for required, checks in self._field_checks[name]:
+            if value is MISSING:
+                if required:
+                    return [((name,), MISSING_FIELD_MSG)]
+                continue
+            if not run_checks(value, checks):
+                errors.extend((path_tuple(node), msg) for node, msg in collect_failures(value, checks, PathNode(name)))
+        return errors
+
+    def _revalidate(self, *, all_cross_rules: bool) -> bool:
+        dirty, self._dirty = self._dirty, set()
+        record = self.record
+
+        for name in dirty:
+            if name in self._field_checks:
+                errors = self._check_field(name)
+                if errors:
+                    self._field_errors[name] = errors
+                else:
+                    self._field_errors.pop(name, None)
+            if self._closed_schemas:
+                is_extra = any(name not in known for known in self._closed_schemas)
+                if is_extra and read_field(record, name) is not MISSING:
+                    self._extra_fields[name] = None
+                else:
+                    self._extra_fields.pop(name, None)
+
+        if all_cross_rules:
+            affected = set(range(len(self._cross_rules)))
+        else:
+            affected = {index for name in dirty for index in self._dependents.get(name, ())}
+        for index in affected:
+            rule, msg = self._cross_rules[index]
+            if any(name in self._field_errors for name in rule.fields) or rule(record):
+                self._cross_errors.pop(index, None)
+            else:
+                self._cross_errors[index] = msg
+
+        self._record_errors = [
+            error
+            for validation_fn, msg in self._record_rules
+            if not validation_fn(record)
+            for error in explain_failure(validation_fn, msg, record)
+        ]
+        return self.ok
+
+    def __init__(self, spec: "ValidatorSpec", record: Any):
+        """Split the validations of ``spec`` by the fields they read and validate ``record``."""
+        if spec._stream_rules:
+            raise ValueError("Stream rules cannot be used for incremental validation")
+        self.record = record
+        is_mapping = isinstance(record, Mapping)
+
+        field_checks: dict[Any, list[tuple[bool, Checks]]] = {}
+        closed_schemas: list[frozenset] = []
+        cross_rules: list[tuple[CrossFieldRule, Message]] = []
+        record_rules: list[tuple[Any, Message]] = []
+        for profiled_fn, msg in spec._validations:
+            validation_fn = unwrap(profiled_fn)
+            if isinstance(validation_fn, SchemaRule) and is_mapping:
+                for key, required, checks in validation_fn._checks:
+                    field_checks.setdefault(key, []).append((required, checks))
+                if validation_fn._forbid_extra:
+                    closed_schemas.append(validation_fn._known)
+            elif validation_fn is has_valid_fields and dataclasses.is_dataclass(record) and not is_mapping:
+                for name, _, checks in rule_for(type(record))._checks:
+                    field_checks.setdefault(name, []).append((True, checks))
+            elif isinstance(validation_fn, CrossFieldRule):
+                cross_rules.append((validation_fn, msg))
+            elif isinstance(validation_fn, ConditionGroup):
+                cross_rules.extend(validation_fn.rules())
+            else:
+                record_rules.append((profiled_fn, msg))
+
+        dependents: dict[Any, list[int]] = {}
+        for index, (rule, _) in enumerate(cross_rules):
+            for name in rule.fields:
+                dependents.setdefault(name, []).append(index)
+
+        self._field_checks = field_checks
+        self._closed_schemas = closed_schemas
+        self._cross_rules = cross_rules
+        self._record_rules = record_rules
+        self._dependents = dependents
+
+        self._field_errors: dict[Any, list[tuple[tuple, Message]]] = {}
+        self._extra_fields: dict[Any, None] = {}
+        self._cross_errors: dict[int, Message] = {}
+        self._record_errors: list[tuple[tuple, Message]] = []
+
+        initial = set(field_checks)
+        if closed_schemas:
+            initial.update(record)
+        self._dirty = initial
+        self._revalidate(all_cross_rules=True)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the record passed every validation at the last revalidation."""
+        return not (self._field_errors or self._extra_fields or self._cross_errors or self._record_errors)
+
+    @property
+    def errors(self) -> list[tuple[tuple, Message]]:
+        """Return the current ``(path, message)`` failures: fields, extra keys, cross-field then record rules."""
+        errors = [error for key in self._field_checks for error in self._field_errors.get(key, ())]
+        errors.extend(((key,), UNEXPECTED_FIELD_MSG) for key in self._extra_fields)
+        errors.extend(((), self._cross_errors[index]) for index in sorted(self._cross_errors))
+        errors.extend(self._record_errors)
+        return errors
+
+    def field_errors(self, name: Any) -> list[tuple[tuple, Message]]:
+        """Return the current failures of field ``name``."""
+        return list(self._field_errors.get(name, ()))
+
+    def mark_changed(self, *names: Any) -> None:
+        """Record that fields ``names`` were changed (or removed) outside of :meth:`update`."""
+        self._dirty.update(names)
+
+    def update(self, changes: Mapping[Any, Any] | None = None, /, **fields: Any) -> bool:
+        """Assign the given field values to the record, revalidate them and return :attr:`ok`."""
+        changes = {**(changes or {}), **fields}
+        if isinstance(self.record, Mapping):
+            self.record.update(changes)
+        else:
+            for name, value in changes.items():
+                setattr(self.record, name, value)
+        self._dirty.update(changes)
+        return self.revalidate()
+
+    def revalidate(self) -> bool:
+        """Check the changed fields and the rules depending on them again; return :attr:`ok`."""
+        return self._revalidate(all_cross_rules=False)
@@ -0,0 +1,98 @@
+"""Interval-set membership for fluent_validator.
+
+IntervalSet normalizes a collection of ``(lower, upper)`` ranges once into
+sorted, disjoint bounds and answers membership queries with binary search.
+NumPy arrays are checked in a single vectorized ``searchsorted`` call.
+"""
+
+import importlib
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from typing import Any, Literal
+
+
+def _is_numpy_array(obj: Any) -> bool:
+    return type(obj).__module__ == "numpy" and hasattr(obj, "shape")
+
+
+class IntervalSet:
+    """Union of ranges sharing the same ``closed`` setting, queried in O(log n).
+
+    ``closed`` has the same meaning as in :func:`~fluent_validator.functions.is_between`.
+    Overlapping (and, unless ``closed="none"``, touching) ranges are merged.
+    """
+
+    __slots__ = ("_arrays", "_closed_left", "_closed_right", "_lowers", "_uppers")
+
+    def __init__(
+        self,
+        ranges: Iterable[tuple[Any, Any]],
+        closed: Literal["both", "left", "right", "none"] = "both",
+    ):
+        """Sort and merge ``ranges`` into disjoint bounds."""
+        if closed not in ("both", "left", "right", "none"):
+            raise ValueError(
+                f"Invalid value for 'closed': {closed}. Expected one of 'both', 'left', 'right', 'none'.",
+            )
+        self._closed_left = closed in ("both", "left")
+        self._closed_right = closed in ("both", "right")
+
+        lowers: list = []
+        uppers: list = []
+        for lower, upper in sorted(
+            (lower, upper) for lower, upper in ranges if lower < upper or (lower == upper and closed == "both")
+        ):
+            if uppers and (lower < uppers[-1] or (lower == uppers[-1] and closed != "none")):
+                uppers[-1] = max(uppers[-1], upper)
+            else:
+                lowers.append(lower)
+                uppers.append(upper)
+
+        self._lowers = lowers
+        self._uppers = uppers
+        self._arrays: tuple | None = None
+
+    def mask(self, values: Any) -> Any:
+        """Return a boolean NumPy array telling which of ``values`` lie in a range."""
+        # numpy is optional and not a dependency: resolve it at call time only
+        np = importlib.import_module("numpy")
+
+        if self._arrays is None:
+            self._arrays = (np.asarray(self._lowers), np.asarray(self._uppers))
+        lowers, uppers = self._arrays
+
+        values = np.asarray(values)
+        if not len(lowers):
+            return np.zeros(values.shape, dtype=bool)
+        index = np.searchsorted(lowers, values, side="right" if self._closed_left else "left") - 1
+        upper = uppers[np.clip(index, 0, None)]
+        inside = values <= upper if self._closed_right else values < upper
+        return (index >= 0) & inside
+
+    def contains_all(self, values: Any) -> bool:
+        """Return True if ``values`` (a scalar or a NumPy array) lies entirely within the ranges."""
+        if _is_numpy_array(values):
+            return bool(self.mask(values).all())
+        return values in self
+
+    def __iter__(self):
+        """Iterate over the merged ``(lower, upper)`` ranges."""
+        return zip(self._lowers, self._uppers, strict=True)
+
+    def __contains__(self, value: Any) -> bool:
+        """Return True if ``value`` lies in any range; incomparable values are not contained."""
+        try:
+            if self._closed_left:
+                index = bisect_right(self._lowers, value) - 1
+            else:
+                index = bisect_left(self._lowers, value) - 1
+            if index < 0:
+                return False
+            upper = self._uppers[index]
+            return value <= upper if self._closed_right else value < upper
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        """Return the number of disjoint ranges after merging."""
+        return len(self._lowers)
@@ -0,0 +1,177 @@
+"""Lazily rendered rule messages for fluent_validator.
+
+LazyMessage keeps a message template and its parameters and only formats them
+when the text is actually needed (errors, ``describe``), truncating long
+parameter representations.
+"""
+
+import reprlib
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any
+
+MAX_PARAM_ITEMS = 20
+MAX_PARAM_LENGTH = 200
+
+
+class _BoundedRepr(reprlib.Repr):
+    """``reprlib.Repr`` keeping the iteration order of sets and dicts.
+
+    The stock implementation sorts them first, which costs O(n log n) for an
+    abbreviated repr and shows members the value does not start with.
+    """
+
+    def repr_set(self, x: set, level: int) -> str:
+        """Return the abbreviated repr of set ``x`` in iteration order."""
+        if not x:
+            return "set()"
+        return self._repr_iterable(x, level, "{", "}", self.maxset)
+
+    def repr_frozenset(self, x: frozenset, level: int) -> str:
+        """Return the abbreviated repr of frozenset ``x`` in iteration order."""
+        if not x:
+            return "frozenset()"
+        return self._repr_iterable(x, level, "frozenset({", "})", self.maxfrozenset)
+
+    def repr_dict(self, x: dict, level: int) -> str:
+        """Return the abbreviated repr of dict ``x`` in insertion order."""
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{" + self.fillvalue + "}"
+        repr1 = self.repr1
+        pieces = [
+            f"{repr1(key, level - 1)}: {repr1(value, level - 1)}" for key, value in islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append(self.fillvalue)
+        return "{" + ", ".join(pieces) + "}"
+
+
+_param_repr = _BoundedRepr()
+_param_repr.maxlevel = 3
+_param_repr.maxlist = _param_repr.maxtuple = MAX_PARAM_ITEMS
+_param_repr.maxset = _param_repr.maxfrozenset = _param_repr.maxdeque = MAX_PARAM_ITEMS
+_param_repr.maxdict = _param_repr.maxarray = MAX_PARAM_ITEMS
+_param_repr.maxstring = _param_repr.maxother = MAX_PARAM_LENGTH // 2
+
+
+def _truncate(text: str) -> str:
+    if len(text) <= MAX_PARAM_LENGTH:
+        return text
+    return f"{text[: MAX_PARAM_LENGTH - 3]}..."
+
+
+def _format_param(value: Any) -> str:
+    """Return the text used for ``value`` inside a message.
+
+    Short values render exactly like ``str(value)``; large collections are
+    abbreviated with :mod:`reprlib` without formatting every element.
+    """
+    if isinstance(value, LazyMessage):
+        return str(value)
+    if isinstance(value, (list, tuple, set, frozenset, dict)) and len(value) > MAX_PARAM_ITEMS:
+        return _truncate(_param_repr.repr(value))
+    return _truncate(str(value))
+
+
+def snapshot(collection: Any) -> Any:
+    """Return a copy of a collection parameter holding only the items a message can show.
+
+    Builders prepare their checks from the collection when the spec is built, so the
+    message must not follow later changes to the caller's (mutable) collection, nor
+    keep the whole collection alive next to the prepared lookup. Other values
+    (strings, ranges, iterators, ...) are returned unchanged.
+    """
+    collection_type = type(collection)
+    if collection_type in (list, tuple, set, frozenset):
+        return collection_type(islice(collection, MAX_PARAM_ITEMS + 1))
+    if collection_type is dict:
+        return dict(islice(collection.items(), MAX_PARAM_ITEMS + 1))
+    return collection
+
+
+def format_value(value: Any) -> str:
+    """Return the bounded ``repr`` of a validated value used in error messages.
+
+    Deeply nested or large values are abbreviated instead of rendered in full.
+    """
+    return _truncate(_param_repr.repr(value))
+
+
+class LazyMessage:
+    """Message template rendered on first use and cached.
+
+    Behaves like the rendered string for formatting, comparison and hashing.
+    """
+
+    __slots__ = ("_params", "_rendered", "_template")
+
+    def __init__(self, template: str, /, **params: Any):
+        """Store ``template`` (``str.format`` syntax) and its ``params`` without rendering."""
+        self._template = template
+        self._params = params
+        self._rendered: str | None = None
+
+    @classmethod
+    def join(cls, separator: str, messages: Iterable["Message"]) -> "LazyMessage":
+        """Return a message rendering ``separator.join(messages)`` lazily."""
+        return _JoinedMessage(separator, tuple(messages))
+
+    def _render(self) -> str:
+        return self._template.format(**{name: _format_param(value) for name, value in self._params.items()})
+
+    def _parts(self) -> Iterable[Any]:
+        return self._params.values()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by rendered text with other messages or plain strings."""
+        if isinstance(other, (str, LazyMessage)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash like the rendered text."""
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        """Return the repr of the rendered text."""
+        return repr(str(self))
+
+    def __str__(self) -> str:
+        """Render (once) and return the message text."""
+        if self._rendered is None:
+            # render unrendered nested messages first, deepest first, so that messages
+            # of specs built from thousands of ``|`` / ``~`` do not recurse
+            stack: list[LazyMessage] = [self]
+            while stack:
+                message = stack[-1]
+                pending = [
+                    part for part in message._parts() if isinstance(part, LazyMessage) and part._rendered is None
+                ]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                if message._rendered is None:
+                    message._rendered = message._render()
+        return self._rendered
+
+
+class _JoinedMessage(LazyMessage):
+    """Concatenation of messages; parts are rendered verbatim, never truncated."""
+
+    __slots__ = ()
+
+    def __init__(self, separator: str, messages: tuple["Message", ...]):
+        super().__init__(separator)
+        self._params = messages
+
+    def _render(self) -> str:
+        return self._template.join(str(message) for message in self._params)
+
+    def _parts(self) -> Iterable[Any]:
+        return self._params
+
+
+Message = str | LazyMessage
@@ -0,0 +1,266 @@
+"""Nested validations for fluent_validator.
+
+Validations such as ``each``, ``each_value`` or ``schema`` apply specs to the
+parts of a value. When such a rule nests other nested rules it does not call
+them recursively: it only hands out its parts and :func:`run_checks` walks them
+with an explicit stack of iterators. Arbitrarily deep structures therefore stay
+within the recursion limit, the stack grows with the depth (not the size) of
+the value, and a success costs neither exception handling nor path tracking.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, Literal
+
+from .messages import Message
+from .paths import PathNode, path_tuple
+
+if TYPE_CHECKING:
+    from .validator_spec import ValidatorSpec
+
+# (plain validation fns, deep nested rules, (fn, msg) validations for failure reports)
+Checks = tuple[tuple[Callable[[Any], bool], ...], tuple["NestedRule", ...], tuple]
+Failure = tuple[PathNode | None, Message]
+
+NOT_ITERABLE_MSG = "Should be iterable (rule: each)"
+NOT_A_MAPPING_MSG = "Should be a mapping (rule: {rule})"
+
+
+def run_checks(obj: Any, checks: Checks) -> bool:
+    """Return True if ``obj`` passes ``checks``, expanding deep nested rules iteratively."""
+    stack: list[Iterator[tuple[Any, Checks]]] = [iter(((obj, checks),))]
+    push, pop = stack.append, stack.pop
+    while stack:
+        for value, (fns, nested, _) in stack[-1]:
+            for fn in fns:
+                if not fn(value):
+                    return False
+            if nested:
+                for rule in nested:
+                    parts = rule.parts(value)
+                    if parts is None:
+                        return False
+                    push(parts)
+                break
+        else:
+            pop()
+    return True
+
+
+class NestedRule:
+    """Base class for validations applying specs to the parts of a value.
+
+    Subclasses implement :meth:`parts` and :meth:`failure_parts` and set ``deep``
+    when one of their specs contains another nested rule; shallow rules are called
+    directly, deep ones are expanded by :func:`run_checks`.
+    """
+
+    __slots__ = ()
+
+    deep: bool
+
+    def parts(self, obj: Any) -> Iterator[tuple[Any, Checks]] | None:
+        """Return ``(part, checks)`` pairs to validate, or None if ``obj`` has the wrong shape."""
+        raise NotImplementedError
+
+    def failure_parts(
+        self,
+        obj: Any,
+        path: PathNode | None,
+    ) -> tuple[list[Failure], Iterator[tuple[Any, Checks, PathNode | None]]]:
+        """Return the failures of ``obj`` itself and its ``(part, checks, path)`` triples."""
+        raise NotImplementedError
+
+    def failures(self, obj: Any, path: PathNode | None = None) -> list[Failure]:
+        """Return ``(path, message)`` pairs describing why ``obj`` (found at ``path``) fails."""
+        return collect_failures(obj, ((), (), ((self, None),)), path)
+
+    def __call__(self, obj: Any) -> bool:
+        """Return True if every part of ``obj`` passes its checks."""
+        if self.deep:
+            return run_checks(obj, ((), (self,), ()))
+        parts = self.parts(obj)
+        if parts is None:
+            return False
+        for value, (fns, _, _) in parts:
+            for fn in fns:
+                if not fn(value):
+                    return False
+        return True
+
+
+def compile_checks(spec: "ValidatorSpec") -> Checks:
+    """Split the validations of ``spec`` into direct calls and deep nested rules."""
+    if spec._stream_rules:
+        raise ValueError("Stream rules cannot run inside a nested validation")
+    fns = []
+    nested = []
+    for validation_fn, _ in spec._validations:
+        if isinstance(validation_fn, NestedRule) and validation_fn.deep:
+            nested.append(validation_fn)
+        else:
+            fns.append(validation_fn)
+    return tuple(fns), tuple(nested), tuple(spec._validations)
+
+
+def is_deep(checks: Iterable[Checks]) -> bool:
+    """Return True if any of ``checks`` contains a nested rule."""
+    return any(isinstance(fn, NestedRule) for _, _, validations in checks for fn, _ in validations)
+
+
+def collect_failures(obj: Any, checks: Checks, path: PathNode | None) -> list[Failure]:
+    """Return every ``(path, message)`` failure of ``obj`` against ``checks``, depth first."""
+    result: list[Failure] = []
+    stack: list[Iterator[tuple[Any, Checks, PathNode | None]]] = [iter(((obj, checks, path),))]
+    while stack:
+        for value, (_, _, validations), node in stack[-1]:
+            children = []
+            for validation_fn, msg in validations:
+                if isinstance(validation_fn, NestedRule):
+                    errors, parts = validation_fn.failure_parts(value, node)
+                    result.extend(errors)
+                    children.append(parts)
+                elif not validation_fn(value):
+                    explain = getattr(validation_fn, "failures", None)
+                    details = explain(value, node) if explain is not None else None
+                    if not details and not getattr(validation_fn, "defers_failures", False):
+                        # a rule may fail without details, e.g. once a one-shot iterator was consumed
+                        details = [(node, msg)]
+                    result.extend(details)
+            if children:
+                stack.extend(reversed(children))
+                break
+        else:
+            stack.pop()
+    return result
+
+
+class FailureResult:
+    """Falsy result of a validation call carrying the failures it found.
+
+    Returned when the validated value cannot be read again to explain the failure;
+    :func:`explain_failure` reports ``failures`` instead of walking the value.
+    """
+
+    __slots__ = ("failures",)
+
+    def __init__(self, failures: list[Failure]):
+        """Store the ``(path, message)`` failures found by the call."""
+        self.failures = failures
+
+    def __bool__(self) -> bool:
+        """Return False: the validation did not pass."""
+        return False
+
+
+def explain_failure(
+    validation_fn: Callable[[Any], bool],
+    msg: Message,
+    obj: Any,
+    result: Any = False,
+) -> list[tuple[tuple, Message]]:
+    """Return ``[((), msg)]``, or the path-aware details for validations able to explain failures.
+
+    ``result`` is what ``validation_fn(obj)`` returned: a :class:`FailureResult`
+    already holds the details, e.g. for a one-shot iterator that cannot be read again.
+    """
+    if type(result) is FailureResult:
+        details = result.failures
+    else:
+        explain = getattr(validation_fn, "failures", None)
+        details = explain(obj) if explain is not None else None
+    if not details and not getattr(validation_fn, "defers_failures", False):
+        return [((), msg)]
+    return [(path_tuple(node), failure_msg) for node, failure_msg in details]
+
+
+class EachRule(NestedRule):
+    """Validation applying a spec to every item, key or value of a collection.
+
+    ``target="items"`` iterates the collection itself (failure paths use the item
+    index), ``"keys"`` and ``"values"`` iterate a mapping (paths use the key).
+    One-shot iterators cannot be walked again to explain a failure: they are read
+    up to their first failing item, and the call returns a :class:`FailureResult`
+    with the failures of that item.
+    """
+
+    __slots__ = ("_checks", "deep", "target")
+
+    def __init__(self, spec: "ValidatorSpec", target: Literal["items", "keys", "values"] = "items"):
+        """Compile ``spec`` for the parts selected by ``target``."""
+        if target not in ("items", "keys", "values"):
+            raise ValueError(f"Invalid value for 'target': {target}. Expected one of 'items', 'keys', 'values'.")
+        self.target = target
+        self._checks = compile_checks(spec)
+        self.deep = is_deep([self._checks])
+
+    def _iterate(self, obj: Any) -> Iterable[Any] | None:
+        if self.target == "items":
+            try:
+                return iter(obj)
+            except TypeError:
+                return None
+        if not isinstance(obj, Mapping):
+            return None
+        return obj.keys() if self.target == "keys" else obj.values()
+
+    def parts(self, obj: Any) -> Iterator[tuple[Any, Checks]] | None:
+        """Return ``(part, checks)`` pairs for the selected parts of ``obj``."""
+        values = self._iterate(obj)
+        if values is None:
+            return None
+        checks = self._checks
+        return ((value, checks) for value in values)
+
+    def failure_parts(
+        self,
+        obj: Any,
+        path: PathNode | None,
+    ) -> tuple[list[Failure], Iterator[tuple[Any, Checks, PathNode | None]]]:
+        """Return shape failures of ``obj`` and its parts keyed by index or mapping key."""
+        values = self._iterate(obj)
+        if values is None:
+            msg = (
+                NOT_ITERABLE_MSG
+                if self.target == "items"
+                else NOT_A_MAPPING_MSG.format(rule=f"each_{self.target[:-1]}")
+            )
+            return [(path, msg)], iter(())
+
+        checks = self._checks
+        if self.target == "items":
+            keyed: Iterable[tuple[Any, Any]] = enumerate(values)
+        elif self.target == "keys":
+            keyed = ((key, key) for key in values)
+        else:
+            keyed = obj.items()
+        return [], ((value, checks, PathNode(key, path)) for key, value in keyed)
+
+    def _check_iterator(self, values: Iterator[Any]) -> bool | FailureResult:
+        checks = self._checks
+        for index, value in enumerate(values):
+            if self.deep:
+                if run_checks(value, checks):
+                    continue
+            else:
+                for fn in checks[0]:
+                    if not fn(value):
+                        break
+                else:
+                    continue
+            # the failing item is still at hand: explain it now, the iterator cannot be read again
+            return FailureResult(collect_failures(value, checks, PathNode(index, None)))
+        return True
+
+    def __call__(self, obj: Any) -> bool | FailureResult:
+        """Return True if every selected part of ``obj`` passes the spec."""
+        values = self._iterate(obj)
+        if values is None:
+            return False
+        if values is obj:
+            return self._check_iterator(values)
+        if self.deep:
+            return run_checks(obj, ((), (self,), ()))
+        fns = self._checks[0]
+        if len(fns) == 1:
+            return all(map(fns[0], values))
+        return all(fn(value) for value in values for fn in fns)
@@ -0,0 +1,53 @@
+"""Failure paths for fluent_validator.
+
+Validations able to explain a failure inside a nested value (schemas, dataclass
+fields, ...) expose ``failures(obj, path=None)``. ``path`` is a :class:`PathNode`
+chain linking each key to its parent, so descending one level costs a single
+small object and the chain is only created on the failing branch; it is turned
+into a tuple such as ``("orders", 3, "sku")`` once, when the error is reported.
+"""
+
+from typing import Any
+
+
+def format_path(path: tuple) -> str:
+    """Render a path such as ``("orders", 3, "sku")`` as ``orders[3].sku``."""
+    parts: list[str] = []
+    for part in path:
+        if isinstance(part, int):
+            parts.append(f"[{part}]")
+        elif parts:
+            parts.append(f".{part}")
+        else:
+            parts.append(str(part))
+    return "".join(parts)
+
+
+class PathNode:
+    """One link of a failure path: ``key`` below ``parent`` (None for the root)."""
+
+    __slots__ = ("key", "parent")
+
+    def __init__(self, key: Any, parent: "PathNode | None" = None):
+        """Link ``key`` below ``parent``."""
+        self.key = key
+        self.parent = parent
+
+    def to_tuple(self) -> tuple:
+        """Return the keys from the root down to this node."""
+        keys = []
+        node: PathNode | None = self
+        while node is not None:
+            keys.append(node.key)
+            node = node.parent
+        keys.reverse()
+        return tuple(keys)
+
+    def __repr__(self) -> str:
+        """Return a debug representation with the rendered path."""
+        return f"PathNode({format_path(self.to_tuple())!r})"
+
+
+def path_tuple(node: PathNode | None) -> tuple:
+    """Return the path of ``node`` as a tuple (``()`` for the root)."""
+    return () if node is None else node.to_tuple()
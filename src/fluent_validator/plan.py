@@ -0,0 +1,304 @@
+"""Execution plans for fluent_validator.
+
+:func:`build_plan` walks the validations a spec actually runs (after OR fusions
+and nested-rule compilation, which :meth:`ValidatorSpec.describe` does not show)
+and returns a :class:`Plan`: a tree of :class:`PlanNode` in execution order with
+a cost class per node, the points where evaluation short-circuits, the rewrites
+applied while building the spec and, for instrumented specs, the per-rule stats.
+Both the walk and the rendering use an explicit stack, so very deep trees are fine.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from .cross_field import CrossFieldRule
+from .dataclass_fields import has_valid_fields
+from .expressions import ConditionGroup, Expression
+from .functions import _RangeLookup, _SortedLookup
+from .messages import Message
+from .nested import EachRule
+from .profiling import ProfiledRule, RuleStats
+from .schema import SchemaRule
+
+if TYPE_CHECKING:
+    from .validator_spec import ValidatorSpec
+
+# cost classes from cheapest to most expensive, in the size of the validated value
+COSTS = ("constant", "logarithmic", "linear", "superlinear", "unknown")
+
+_RULE_COSTS = {
+    "is_in_ranges": "logarithmic",
+    "is_not_in_ranges": "logarithmic",
+    "contains_any_of": "linear",
+    "contains_none_of": "linear",
+    "contains_at_least": "linear",
+    "contains_at_most": "linear",
+    "contains_exactly": "linear",
+    "has_unique_values": "linear",
+    "matches": "linear",
+    "does_not_match": "linear",
+    "fullmatches": "linear",
+    "does_not_fullmatch": "linear",
+    "cross_field": "unknown",
+    "has_invalid_fields": "unknown",
+}
+
+
+_EACH_TARGETS = {"items": "each", "keys": "each_key", "values": "each_value"}
+
+
+def builder_cost(name: str) -> str:
+    """Return the cost class of the check added by builder method ``name``."""
+    return _RULE_COSTS.get(name, "constant")
+
+
+def lookup_cost(lookup: Any) -> str:
+    """Return the cost class of ``obj in lookup`` for a container prepared by ``as_lookup``."""
+    lookup_type = type(lookup)
+    if lookup_type in (frozenset, _RangeLookup):
+        return "constant"
+    if lookup_type is _SortedLookup:
+        return "logarithmic"
+    if lookup_type in (tuple, str, bytes):
+        return "linear"
+    return "unknown"
+
+
+class PlanNode:
+    """One step of an execution plan.
+
+    ``kind`` is ``"rule"`` for a single check, or the combinator running the
+    children (``"and"``, ``"or"``, ``"not"``, ``"schema"``, ``"field"``, ``"each"``,
+    ...). ``notes`` describe short-circuits and rewrites; ``stats`` holds the
+    counters of an instrumented rule.
+    """
+
+    __slots__ = ("children", "cost", "kind", "label", "notes", "stats")
+
+    def __init__(self, kind: str, label: str = "", cost: str | None = None, notes: Iterable[str] = ()):
+        """Create a node; a ``cost`` of None is derived from the children."""
+        self.kind = kind
+        self.label = label
+        self.cost = cost
+        self.notes = list(notes)
+        self.stats: RuleStats | None = None
+        self.children: list[PlanNode] = []
+
+    def walk(self) -> Iterator[tuple[int, "PlanNode"]]:
+        """Yield ``(depth, node)`` for this node and its descendants, in execution order."""
+        stack = [(0, self)]
+        while stack:
+            depth, node = stack.pop()
+            yield depth, node
+            stack.extend((depth + 1, child) for child in reversed(node.children))
+
+    def render(self) -> str:
+        """Return the line describing this node alone."""
+        head = f"[{self.cost}]" if self.kind == "rule" else f"{self.kind.upper()} [{self.cost}]"
+        line = f"{head} {self.label}" if self.label else head
+        if self.notes:
+            line += " -- " + "; ".join(self.notes)
+        stats = self.stats
+        if stats is not None:
+            mean = "n/a" if stats.mean_time_ns is None else f"{stats.mean_time_ns:.0f}ns"
+            line += f" (calls={stats.calls}, failures={stats.failures}, mean={mean})"
+        return line
+
+    def __repr__(self) -> str:
+        """Return a debug representation with the rendered line."""
+        return f"PlanNode({self.render()!r})"
+
+
+class Plan:
+    """Execution plan of a spec, returned by :meth:`ValidatorSpec.explain`."""
+
+    __slots__ = ("rewrites", "root")
+
+    def __init__(self, root: PlanNode, rewrites: list[str]):
+        """Store the root node and the rewrites applied to the spec."""
+        self.root = root
+        self.rewrites = rewrites
+
+    def nodes(self) -> Iterator[tuple[int, PlanNode]]:
+        """Yield ``(depth, node)`` for every node, in execution order."""
+        return self.root.walk()
+
+    def __str__(self) -> str:
+        """Render the plan as an indented tree followed by the applied rewrites."""
+        lines = ["    " * depth + node.render() for depth, node in self.nodes()]
+        if self.rewrites:
+            lines.append("Rewrites:")
+            lines.extend(f"    - {rewrite}" for rewrite in self.rewrites)
+        return "\n".join(lines)
+
+
+def _expression_size(expression: Expression) -> int:
+    size = 0
+    stack = [expression]
+    while stack:
+        node = stack.pop()
+        size += 1
+        stack.extend(arg for arg in node.args if isinstance(arg, Expression))
+    return size
+
+
+def _builder_names(spec: "ValidatorSpec") -> dict[int, str]:
+    """Map the id of each check added by a builder method, in ``spec`` and its nested specs, to the builder name."""
+    names: dict[int, str] = {}
+    seen = {id(spec)}
+    stack = [spec._get_describe_tree()]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        kind = node[0]
+        if kind in ("and", "or"):
+            stack.extend(node[1])
+        elif kind == "not":
+            stack.append(node[1])
+        elif len(node) > 3:
+            name, args, kwargs = node[2]
+            names[id(node[3])] = name
+            # the specs of schema fields and each rules
+            for value in (*args, *kwargs.values()):
+                for nested in value.values() if type(value) is dict else (value,):
+                    if hasattr(nested, "_get_describe_tree") and id(nested) not in seen:
+                        seen.add(id(nested))
+                        stack.append(nested._get_describe_tree())
+    return names
+
+
+def _checks_order(checks: tuple, rewrites: list[str], where: str) -> list[tuple[Any, Message]]:
+    """Return the validations of compiled ``checks`` in the order they run: direct checks, then deep rules."""
+    _, nested, validations = checks
+    if not nested:
+        return list(validations)
+    deep = {id(rule) for rule in nested}
+    direct = [(fn, msg) for fn, msg in validations if id(fn) not in deep]
+    ordered = direct + [(fn, msg) for fn, msg in validations if id(fn) in deep]
+    if ordered != list(validations):
+        rewrites.append(f"{where}: nested rules reordered after the direct checks")
+    return ordered
+
+
+def _expand(
+    validation_fn: Any,
+    msg: Message,
+    rewrites: list[str],
+    builders: dict[int, str],
+) -> tuple[PlanNode, list[tuple[PlanNode, list[tuple[Any, Message]]]]]:
+    """Return the node of one validation and the ``(node, validations)`` groups still to expand."""
+    branches = getattr(validation_fn, "branches", None)
+    if branches is not None:
+        node = PlanNode("or", notes=["stops at the first passing branch"])
+        groups = []
+        for branch in branches:
+            child = PlanNode("and", notes=["stops at the first failing rule"] if len(branch) > 1 else ())
+            node.children.append(child)
+            groups.append((child, list(branch)))
+        return node, groups
+
+    negated = getattr(validation_fn, "negated", None)
+    if negated is not None:
+        node = PlanNode("not", notes=["inverts the result; the operand stops at its first failing rule"])
+        return node, [(node, list(negated._validations))]
+
+    if isinstance(validation_fn, SchemaRule):
+        node = PlanNode("schema", f"'{msg}'", notes=["reads each key once"])
+        if validation_fn._forbid_extra:
+            node.notes.append("rejects undeclared keys")
+        groups = []
+        for key, required, checks in validation_fn._checks:
+            field = PlanNode("field", repr(key), notes=[] if required else ["optional"])
+            node.children.append(field)
+            groups.append((field, _checks_order(checks, rewrites, f"field {key!r}")))
+        return node, groups
+
+    if isinstance(validation_fn, EachRule):
+        node = PlanNode(_EACH_TARGETS[validation_fn.target], f"'{msg}'", notes=["stops at the first failing item"])
+        return node, [(node, _checks_order(validation_fn._checks, rewrites, "each"))]
+
+    if isinstance(validation_fn, ConditionGroup):
+        node = PlanNode("conditions", f"'{msg}'", "unknown")
+        total = sum(_expression_size(condition) for condition, _ in validation_fn.conditions)
+        unique = len(validation_fn._nodes)
+        if unique < total:
+            rewrites.append(
+                f"{len(validation_fn.conditions)} conditions share one plan of {unique} nodes instead of {total}",
+            )
+        node.notes.append(f"evaluates {unique} shared nodes, stops at the first condition not holding")
+        return node, []
+
+    if isinstance(validation_fn, CrossFieldRule):
+        return PlanNode("rule", f"'{msg}'", "unknown", [f"reads fields {list(validation_fn.fields)}"]), []
+
+    if validation_fn is has_valid_fields:
+        return PlanNode("fields", f"'{msg}'", "unknown", ["dataclass field specs, compiled once per class"]), []
+
+    # fused rules and is_in lookups know their cost; other builders have a fixed one; custom rules are unknown
+    cost = getattr(validation_fn, "cost", None)
+    if cost not in COSTS:
+        name = builders.get(id(validation_fn))
+        cost = "unknown" if name is None else builder_cost(name)
+    node = PlanNode("rule", f"'{msg}'", cost)
+    rewrite = getattr(validation_fn, "rewrite", None)
+    if rewrite:
+        node.notes.append("fused")
+        rewrites.append(rewrite)
+    return node, []
+
+
+def _collapse_single_rule_groups(root: PlanNode) -> None:
+    """Replace the AND nodes of OR branches holding a single step by that step."""
+    for _, node in root.walk():
+        node.children = [
+            child.children[0] if child.kind == "and" and len(child.children) == 1 else child for child in node.children
+        ]
+
+
+def _derive_costs(root: PlanNode) -> None:
+    """Fill in the cost of composite nodes from their children, bottom-up."""
+    for _, node in reversed(list(root.walk())):
+        if node.cost is not None:
+            continue
+        ranks = [COSTS.index(child.cost) for child in node.children]
+        rank = max(ranks, default=0)
+        if node.kind in ("each", "each_key", "each_value") and COSTS[rank] != "unknown":
+            rank = COSTS.index("linear") if rank == 0 else COSTS.index("superlinear")
+        node.cost = COSTS[rank]
+
+
+def build_plan(spec: "ValidatorSpec") -> Plan:
+    """Return the execution plan of ``spec``."""
+    rewrites: list[str] = []
+    validations = list(spec._validations)
+    root = PlanNode("and", f"{len(validations)} rules" if len(validations) != 1 else "1 rule")
+    if len(validations) > 1:
+        root.notes.append('stops at the first failing rule unless strategy="raise_after_all_errors"')
+    if spec._cache is not None:
+        info = spec._cache.info()
+        root.notes.append(
+            f"outcomes memoized (maxsize={info.maxsize}, hits={info.hits}, misses={info.misses}, bypassed={info.bypassed})",
+        )
+
+    builders = _builder_names(spec)
+    stack: list[tuple[PlanNode, list[tuple[Any, Message]]]] = [(root, validations)]
+    while stack:
+        parent, pending = stack.pop()
+        expanded = []
+        for validation_fn, msg in pending:
+            stats = None
+            if isinstance(validation_fn, ProfiledRule):
+                validation_fn, stats = validation_fn.fn, validation_fn.stats
+            node, groups = _expand(validation_fn, msg, rewrites, builders)
+            node.stats = stats
+            parent.children.append(node)
+            expanded.extend(groups)
+        stack.extend(reversed(expanded))
+
+    for _, msg in spec._stream_rules:
+        root.children.append(PlanNode("stream", f"'{msg}'", "constant", ["runs across items in validate_each only"]))
+
+    _collapse_single_rule_groups(root)
+    _derive_costs(root)
+    return Plan(root, rewrites)
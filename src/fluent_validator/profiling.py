@@ -0,0 +1,149 @@
+"""Per-rule instrumentation for fluent_validator.
+
+An instrumented spec wraps each validation in a ProfiledRule that counts calls
+and failures and, for a sampled share of the calls, accumulates the time spent
+in the rule with ``time.perf_counter_ns``. Specs that are not instrumented run
+their validations directly and pay nothing.
+"""
+
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any
+
+from .messages import Message
+
+
+class RuleStats:
+    """Counters of a single rule, keyed by its describe leaf message."""
+
+    __slots__ = ("calls", "failures", "rule", "sampled_calls", "sampled_time_ns")
+
+    def __init__(self, rule: Message):
+        """Initialize zeroed counters for ``rule``."""
+        self.rule = rule
+        self.calls = 0
+        self.failures = 0
+        self.sampled_calls = 0
+        self.sampled_time_ns = 0
+
+    @property
+    def mean_time_ns(self) -> float | None:
+        """Return the mean time per sampled call, or None if no call was sampled."""
+        if not self.sampled_calls:
+            return None
+        return self.sampled_time_ns / self.sampled_calls
+
+    @property
+    def estimated_time_ns(self) -> float:
+        """Return the cumulative time extrapolated from the sampled calls to every call."""
+        if not self.sampled_calls:
+            return 0.0
+        return self.sampled_time_ns * self.calls / self.sampled_calls
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counters as a plain dict."""
+        return {
+            "rule": str(self.rule),
+            "calls": self.calls,
+            "failures": self.failures,
+            "sampled_calls": self.sampled_calls,
+            "sampled_time_ns": self.sampled_time_ns,
+            "estimated_time_ns": self.estimated_time_ns,
+        }
+
+
+class ProfiledRule:
+    """Validation wrapper updating a :class:`RuleStats` on every call.
+
+    Only one call in ``sample_every`` is timed; the other calls just bump the
+    call and failure counters. Counters are not synchronized across threads.
+    Other attributes (``failures``, ``branches``, ``literals``, ...) are read from
+    the wrapped validation, so explaining failures and plans work as without it;
+    code checking the type of a validation uses :func:`unwrap`.
+    """
+
+    __slots__ = ("_countdown", "fn", "sample_every", "stats")
+
+    def __init__(self, fn: Callable[[Any], bool], stats: RuleStats, sample_every: int = 1):
+        """Wrap ``fn`` so that its calls are recorded into ``stats``."""
+        self.fn = fn
+        self.stats = stats
+        self.sample_every = sample_every
+        self._countdown = 1
+
+    def __call__(self, obj: Any) -> bool:
+        """Call the wrapped validation and record the outcome."""
+        stats = self.stats
+        stats.calls += 1
+        self._countdown -= 1
+        if self._countdown:
+            result = self.fn(obj)
+        else:
+            self._countdown = self.sample_every
+            start = perf_counter_ns()
+            result = self.fn(obj)
+            stats.sampled_time_ns += perf_counter_ns() - start
+            stats.sampled_calls += 1
+        if not result:
+            stats.failures += 1
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        """Return attribute ``name`` of the wrapped validation."""
+        if name == "fn" or name.startswith("__"):
+            # not set yet (copy, pickle) or a protocol lookup the wrapper does not forward
+            raise AttributeError(name)
+        return getattr(self.fn, name)
+
+
+def unwrap(validation_fn: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Return the validation wrapped by a :class:`ProfiledRule`, or ``validation_fn`` itself."""
+    return validation_fn.fn if isinstance(validation_fn, ProfiledRule) else validation_fn
+
+
+class SpecStats:
+    """Per-rule counters of an instrumented spec, in rule order."""
+
+    def __init__(self, sample_rate: float):
+        """Initialize an empty set of counters sampling ``sample_rate`` of the calls."""
+        self.sample_rate = sample_rate
+        self.rules: dict[str, RuleStats] = {}
+
+    def _rule(self, msg: Message) -> RuleStats:
+        """Return the counters of ``msg``, shared by rules with the same message."""
+        key = str(msg)
+        stats = self.rules.get(key)
+        if stats is None:
+            stats = self.rules[key] = RuleStats(msg)
+        return stats
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        for stats in self.rules.values():
+            stats.calls = stats.failures = stats.sampled_calls = stats.sampled_time_ns = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a flat ``{"<rule>.<counter>": value}`` dict, e.g. for a metrics exporter."""
+        flat: dict[str, Any] = {}
+        for key, stats in self.rules.items():
+            for name, value in stats.to_dict().items():
+                if name != "rule":
+                    flat[f"{key}.{name}"] = value
+        return flat
+
+    def describe(self) -> str:
+        """Return one line per rule, the most expensive rules first."""
+        if not self.rules:
+            return "No rules"
+        lines = []
+        for stats in sorted(self.rules.values(), key=lambda s: -s.estimated_time_ns):
+            mean = "n/a" if stats.mean_time_ns is None else f"{stats.mean_time_ns:.0f}ns"
+            lines.append(
+                f"'{stats.rule}': {stats.calls} calls, {stats.failures} failures, "
+                f"~{stats.estimated_time_ns / 1e6:.3f}ms total, {mean} per call",
+            )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        """Return a short representation with the number of rules."""
+        return f"SpecStats(rules={len(self.rules)}, sample_rate={self.sample_rate})"
@@ -0,0 +1,118 @@
+"""Aggregated failure reports for fluent_validator.
+
+ValidationReport groups the failures of
+:meth:`~fluent_validator.validator_spec.ValidatorSpec.summarize_each` by rule,
+keeping counts, first/last failing index and a bounded reservoir of examples so
+memory stays fixed regardless of the input size.
+"""
+
+import random
+import reprlib
+from typing import Any
+
+from .messages import Message
+
+_example_repr = reprlib.Repr()
+_example_repr.maxstring = 60
+_example_repr.maxother = 60
+
+
+class RuleSummary:
+    """Failure statistics for a single rule."""
+
+    __slots__ = ("count", "examples", "first_index", "last_index", "rule")
+
+    def __init__(self, rule: Message):
+        """Initialize an empty summary for ``rule``."""
+        self.rule = rule
+        self.count = 0
+        self.first_index: int | None = None
+        self.last_index: int | None = None
+        self.examples: list[tuple[int, Any]] = []
+
+    def _record(self, index: int, value: Any, rng: random.Random, max_examples: int) -> None:
+        """Count a failure at ``index`` and keep it as a reservoir sample."""
+        self.count += 1
+        if self.first_index is None:
+            self.first_index = index
+        self.last_index = index
+
+        if len(self.examples) < max_examples:
+            self.examples.append((index, value))
+            return
+
+        slot = rng.randrange(self.count)
+        if slot < max_examples:
+            self.examples[slot] = (index, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary as a plain dict."""
+        return {
+            "rule": str(self.rule),
+            "count": self.count,
+            "first_index": self.first_index,
+            "last_index": self.last_index,
+            "examples": [{"index": index, "value": value} for index, value in sorted(self.examples)],
+        }
+
+
+class ValidationReport:
+    """Summary of the failures found while validating a stream of items.
+
+    Failures are grouped by rule message. Each group keeps at most
+    ``max_examples`` sampled ``(index, value)`` pairs (reservoir sampling), so
+    the report size depends on the number of rules, not on the number of items.
+    """
+
+    def __init__(self, *, max_examples: int = 5, seed: int | None = None):
+        """Initialize an empty report keeping up to ``max_examples`` examples per rule."""
+        if max_examples < 0:
+            raise ValueError(f"max_examples must be non-negative, got {max_examples}")
+        self.max_examples = max_examples
+        self.total = 0
+        self.failed = 0
+        self.rules: dict[Message, RuleSummary] = {}
+        self._rng = random.Random(seed)  # noqa: S311
+
+    @property
+    def ok(self) -> bool:
+        """Return True when no item failed validation."""
+        return self.failed == 0
+
+    def _record(self, index: int, value: Any, failed_rules: list[Message]) -> None:
+        """Record the rules that failed for the item at ``index``."""
+        self.failed += 1
+        for rule in failed_rules:
+            summary = self.rules.get(rule)
+            if summary is None:
+                summary = self.rules[rule] = RuleSummary(rule)
+            summary._record(index, value, self._rng, self.max_examples)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a plain, JSON-friendly dict (example values are kept as-is)."""
+        return {
+            "total": self.total,
+            "failed": self.failed,
+            "rules": [summary.to_dict() for summary in self.rules.values()],
+        }
+
+    def describe(self) -> str:
+        """Return a compact textual rendering of the report, one line per failing rule."""
+        if self.ok:
+            return f"All {self.total} items passed validation"
+
+        lines = [f"{self.failed} of {self.total} items failed validation"]
+        for summary in sorted(self.rules.values(), key=lambda s: -s.count):
+            examples = ", ".join(f"[{index}] {_example_repr.repr(value)}" for index, value in sorted(summary.examples))
+            line = (
+                f"'{summary.rule}': failed {summary.count} times "
+                f"(first index {summary.first_index}, last index {summary.last_index})"
+            )
+            if examples:
+                line += f"; examples: {examples}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        """Return a short representation with totals."""
+        return f"ValidationReport(total={self.total}, failed={self.failed}, rules={len(self.rules)})"
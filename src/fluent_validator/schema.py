@@ -0,0 +1,124 @@
+"""Record (mapping) schema validation for fluent_validator.
+
+SchemaRule compiles a ``{key: ValidatorSpec}`` mapping once into a flat list of
+checks so validating a record fetches each key a single time. Detailed,
+path-prefixed failure messages are only computed when a record fails.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, Literal
+
+from .nested import Checks, Failure, NestedRule, compile_checks, is_deep, run_checks
+from .paths import PathNode
+
+if TYPE_CHECKING:
+    from .validator_spec import ValidatorSpec
+
+_MISSING = object()
+
+MISSING_FIELD_MSG = "Missing required field (rule: schema)"
+UNEXPECTED_FIELD_MSG = "Unexpected field (rule: schema)"
+NOT_A_MAPPING_MSG = "Should be a mapping (rule: schema)"
+
+
+class SchemaRule(NestedRule):
+    """Validation function checking a mapping against per-key specs.
+
+    ``required`` lists the keys that must be present (default: every key of
+    ``fields``); ``extra="forbid"`` rejects keys not declared in ``fields``.
+    """
+
+    __slots__ = ("_checks", "_fields", "_forbid_extra", "_known", "_required", "deep")
+
+    def __init__(
+        self,
+        fields: Mapping[Any, "ValidatorSpec"],
+        *,
+        required: Iterable[Any] | None = None,
+        extra: Literal["forbid", "allow"] = "allow",
+    ):
+        """Compile ``fields`` into ``(key, required, checks)`` entries."""
+        if extra not in ("forbid", "allow"):
+            raise ValueError(f"Invalid value for 'extra': {extra}. Expected one of 'forbid', 'allow'.")
+        required_keys = set(fields) if required is None else set(required)
+        unknown = required_keys - set(fields)
+        if unknown:
+            raise ValueError(f"Required keys without a spec: {sorted(map(repr, unknown))}")
+
+        checks = []
+        for key, spec in fields.items():
+            if spec._stream_rules:
+                raise ValueError(f"Field {key!r} uses stream rules, which cannot run inside a schema")
+            checks.append((key, key in required_keys, compile_checks(spec)))
+
+        self._fields = dict(fields)
+        self._checks = tuple(checks)
+        self._known = frozenset(fields)
+        self._required = frozenset(required_keys)
+        self._forbid_extra = extra == "forbid"
+        self.deep = is_deep(field_checks for _, _, field_checks in checks)
+
+    @property
+    def fields(self) -> dict[Any, "ValidatorSpec"]:
+        """Return a copy of the ``{key: spec}`` mapping."""
+        return self._fields.copy()
+
+    def parts(self, obj: Any) -> Iterator[tuple[Any, Checks]] | None:
+        """Return ``(value, checks)`` pairs for the present fields, or None if a key check fails."""
+        if not isinstance(obj, Mapping):
+            return None
+        get = obj.get
+        parts = []
+        for key, required, checks in self._checks:
+            value = get(key, _MISSING)
+            if value is _MISSING:
+                if required:
+                    return None
+                continue
+            parts.append((value, checks))
+        if self._forbid_extra and len(obj) != len(parts):
+            return None
+        return iter(parts)
+
+    def failure_parts(
+        self,
+        obj: Any,
+        path: PathNode | None,
+    ) -> tuple[list[Failure], Iterator[tuple[Any, Checks, PathNode | None]]]:
+        """Return missing/unexpected key failures of ``obj`` and its present fields."""
+        if not isinstance(obj, Mapping):
+            return [(path, NOT_A_MAPPING_MSG)], iter(())
+
+        errors: list[Failure] = []
+        parts = []
+        for key, required, checks in self._checks:
+            value = obj.get(key, _MISSING)
+            if value is _MISSING:
+                if required:
+                    errors.append((PathNode(key, path), MISSING_FIELD_MSG))
+                continue
+            parts.append((value, checks, PathNode(key, path)))
+
+        if self._forbid_extra:
+            errors.extend((PathNode(key, path), UNEXPECTED_FIELD_MSG) for key in obj if key not in self._known)
+        return errors, iter(parts)
+
+    def __call__(self, obj: Any) -> bool:
+        """Return True if ``obj`` is a mapping satisfying every field spec."""
+        if self.deep:
+            return run_checks(obj, ((), (self,), ()))
+        if type(obj) is not dict and not isinstance(obj, Mapping):
+            return False
+        get = obj.get
+        present = 0
+        for key, required, (fns, _, _) in self._checks:
+            value = get(key, _MISSING)
+            if value is _MISSING:
+                if required:
+                    return False
+                continue
+            present += 1
+            for fn in fns:
+                if not fn(value):
+                    return False
+        return not (self._forbid_extra and len(obj) != present)
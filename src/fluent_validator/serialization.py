@@ -0,0 +1,435 @@
+"""Serialization of specs for fluent_validator.
+
+Builder methods record the call that added each rule (method name and
+arguments) in the describe tree of the spec. :func:`spec_to_dict` turns that
+tree into JSON-compatible data and :func:`spec_from_dict` rebuilds an equivalent
+spec by replaying the calls, so messages, fusions and compiled lookups come out
+exactly as if the spec had been built by hand. Both directions walk the data
+with an explicit stack, so specs nested thousands of levels deep are fine; specs
+pickle as a :func:`flatten` table of their nested specs, which keeps the pickled
+data shallow as well.
+
+Arguments that are not plain JSON values are tagged (``{"$tuple": [...]}``,
+``{"$pattern": ...}``, nested specs as ``{"$spec": ...}``, ...). Custom callables
+and types are stored by name and must be registered with :func:`register` in
+both the process saving the spec and the one loading it.
+"""
+
+import base64
+import builtins
+import datetime
+import functools
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from . import validator_spec
+from .expressions import Condition, Expression
+from .messages import LazyMessage, Message
+
+if TYPE_CHECKING:
+    from .validator_spec import ValidatorSpec
+
+FORMAT_VERSION = 1
+
+T = TypeVar("T")
+
+_REGISTRY: dict[str, Any] = {
+    name: getattr(builtins, name)
+    for name in ("bool", "int", "float", "complex", "str", "bytes", "list", "tuple", "dict", "set", "frozenset")
+}
+_REGISTRY.update(
+    {
+        "NoneType": type(None),
+        "decimal.Decimal": Decimal,
+        "datetime.date": datetime.date,
+        "datetime.datetime": datetime.datetime,
+        "datetime.time": datetime.time,
+        "datetime.timedelta": datetime.timedelta,
+    },
+)
+_NAMES: dict[int, str] = {id(obj): name for name, obj in _REGISTRY.items()}
+
+
+def register(obj: T, *, name: str | None = None) -> T:
+    """Register a custom predicate or type under ``name`` (default: its qualified name) and return it.
+
+    Usable as a decorator. Specs referencing ``obj`` (e.g. ``add_validation(fn, ...)``,
+    ``is_instance_of(MyClass)``, ``add_cross_field_validation(..., predicate)``) can
+    then be serialized, and loaded wherever the same name is registered.
+    """
+    name = name or f"{obj.__module__}.{obj.__qualname__}"
+    current = _REGISTRY.get(name)
+    if current is not None and current is not obj:
+        raise ValueError(f"{name!r} is already registered for {current!r}")
+    _REGISTRY[name] = obj
+    _NAMES[id(obj)] = name
+    return obj
+
+
+def _fold(root: Any, expand: Callable[[Any], tuple[Any, Callable[[list[Any]], Any] | None]]) -> Any:
+    """Return the result of ``root``, computed bottom-up with an explicit stack.
+
+    ``expand(item)`` returns ``(children, combine)``: ``combine`` builds the result of
+    ``item`` from the results of its ``children``; a None ``combine`` makes ``children``
+    the result itself. Nested specs, argument containers and expressions of any depth
+    are therefore encoded and decoded without recursion.
+    """
+    value, combine = expand(root)
+    if combine is None:
+        return value
+    # frames of (combine, iterator over the children, results of the children done so far)
+    stack: list[tuple[Callable[[list[Any]], Any], Iterator[Any], list[Any]]] = [(combine, iter(value), [])]
+    while True:
+        combine, children, results = stack[-1]
+        for child in children:
+            value, child_combine = expand(child)
+            if child_combine is None:
+                results.append(value)
+            else:
+                stack.append((child_combine, iter(value), []))
+                break
+        else:
+            stack.pop()
+            value = combine(results)
+            if not stack:
+                return value
+            stack[-1][2].append(value)
+
+
+# JSON values needing neither encoding nor decoding: containers of these are handled in one step
+_PLAIN_TYPES = frozenset({bool, int, float, str, type(None)})
+
+
+def _plain(values: Iterable[Any]) -> bool:
+    return all(map(_PLAIN_TYPES.__contains__, map(type, values)))
+
+
+# items walked by _fold: (_NODE, describe tree node or definition dict, ...) or (_VALUE, argument, ...)
+_NODE, _VALUE, _ARGS = "node", "value", "args"
+
+
+def _expand_node(node: tuple | None) -> tuple[Any, Callable[[list[Any]], Any] | None]:
+    if node is None:
+        return {"and": []}, None
+    kind = node[0]
+    if kind in ("and", "or"):
+        return [(_NODE, child, None) for child in node[1]], lambda children: {kind: children}
+    if kind == "not":
+        return [(_NODE, node[1], None)], lambda children: {"not": children[0]}
+
+    msg = node[1]
+    definition = node[2] if len(node) > 2 else None
+    if definition is None:
+        raise TypeError(f"Cannot serialize rule {str(msg)!r}: it was not added through a builder method")
+    if isinstance(definition, tuple):
+        name, args, kwargs = definition
+    else:
+        name, args, kwargs = "add_validation", (definition,), {"msg": msg}
+    if kwargs:
+        kwargs = {key: value for key, value in kwargs.items() if value is not None or key != "msg"}
+    if _plain(args) and _plain(kwargs.values()):
+        data: dict[str, Any] = {"rule": name}
+        if args:
+            data["args"] = list(args)
+        if kwargs:
+            data["kwargs"] = kwargs
+        return data, None
+
+    def combine(encoded: list[Any]) -> dict[str, Any]:
+        data: dict[str, Any] = {"rule": name}
+        if args:
+            data["args"] = encoded[: len(args)]
+        if kwargs:
+            data["kwargs"] = dict(zip(kwargs, encoded[len(args) :], strict=True))
+        return data
+
+    return [(_VALUE, value, msg) for value in (*args, *kwargs.values())], combine
+
+
+def _sorted(items: list[Any]) -> list[Any]:
+    try:
+        items.sort()
+    except TypeError:
+        pass
+    return items
+
+
+def _expand_value(value: Any, msg: Message | None) -> tuple[Any, Callable[[list[Any]], Any] | None]:
+    value_type = type(value)
+    if value is None or value_type in (bool, int, float, str):
+        return value, None
+    name = _NAMES.get(id(value))
+    if name is not None:
+        return {"$ref": name}, None
+    if value_type in (list, tuple, set, frozenset):
+        if value_type is list:
+            combine: Callable[[list[Any]], Any] = list
+        elif value_type is tuple:
+            combine = lambda encoded: {"$tuple": encoded}
+        else:
+            tag = f"${value_type.__name__}"
+            combine = lambda encoded: {tag: _sorted(encoded)}
+        if _plain(value):
+            return combine(list(value)), None
+        return [(_VALUE, item, msg) for item in value], combine
+    if value_type is dict:
+        if all(type(key) is str and not key.startswith("$") for key in value):
+            keys = list(value)
+            return [(_VALUE, item, msg) for item in value.values()], lambda encoded: dict(
+                zip(keys, encoded, strict=True),
+            )
+        pairs = [(_VALUE, part, msg) for pair in value.items() for part in pair]
+        return pairs, lambda encoded: {"$dict": [encoded[i : i + 2] for i in range(0, len(encoded), 2)]}
+    if value_type is re.RegexFlag:
+        return int(value), None
+    if value_type is range:
+        return {"$range": [value.start, value.stop, value.step]}, None
+    if isinstance(value, re.Pattern) and isinstance(value.pattern, str):
+        return {"$pattern": value.pattern, "flags": value.flags}, None
+    if value_type is Decimal:
+        return {"$decimal": str(value)}, None
+    if value_type is datetime.datetime:
+        return {"$datetime": value.isoformat()}, None
+    if value_type is datetime.date:
+        return {"$date": value.isoformat()}, None
+    if value_type is datetime.time:
+        return {"$time": value.isoformat()}, None
+    if value_type is bytes:
+        return {"$bytes": base64.b64encode(value).decode("ascii")}, None
+    if isinstance(value, validator_spec.ValidatorSpec):
+        return [(_NODE, value._get_describe_tree(), None)], lambda nodes: {"$spec": nodes[0]}
+    if isinstance(value, Expression):
+        condition = isinstance(value, Condition)
+        return [(_VALUE, arg, msg) for arg in value.args], lambda encoded: {
+            "$expression": value.op,
+            "args": encoded,
+            "condition": condition,
+        }
+    if isinstance(value, LazyMessage):
+        return str(value), None
+    if callable(value):
+        raise TypeError(f"{value!r} is not registered; register it with fluent_validator.serialization.register")
+    raise TypeError(f"values of type {value_type.__name__} are not supported")
+
+
+def _expand_encoded(item: tuple) -> tuple[Any, Callable[[list[Any]], Any] | None]:
+    kind, value, msg = item
+    if kind is _NODE:
+        return _expand_node(value)
+    try:
+        return _expand_value(value, msg)
+    except TypeError as e:
+        if msg is None:
+            raise
+        raise TypeError(f"Cannot serialize rule {str(msg)!r}: {e}") from None
+
+
+def _node_to_dict(node: tuple | None) -> dict[str, Any]:
+    return _fold((_NODE, node, None), _expand_encoded)
+
+
+def spec_to_dict(spec: "ValidatorSpec") -> dict[str, Any]:
+    """Return the JSON-compatible definition of ``spec``."""
+    return {"version": FORMAT_VERSION, "spec": _node_to_dict(spec._get_describe_tree())}
+
+
+def _lookup(name: str) -> Any:
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(
+            f"{name!r} is not registered; register it with fluent_validator.serialization.register",
+        ) from None
+
+
+_DECODERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "$ref": lambda data: _lookup(data["$ref"]),
+    "$range": lambda data: range(*data["$range"]),
+    "$pattern": lambda data: re.compile(data["$pattern"], data["flags"]),
+    "$decimal": lambda data: Decimal(data["$decimal"]),
+    "$datetime": lambda data: datetime.datetime.fromisoformat(data["$datetime"]),
+    "$date": lambda data: datetime.date.fromisoformat(data["$date"]),
+    "$time": lambda data: datetime.time.fromisoformat(data["$time"]),
+    "$bytes": lambda data: base64.b64decode(data["$bytes"]),
+}
+
+# tagged values holding encoded items, rebuilt from their decoded items
+_CONTAINER_DECODERS: dict[str, Callable[[list[Any]], Any]] = {
+    "$tuple": tuple,
+    "$set": set,
+    "$frozenset": frozenset,
+    "$dict": lambda items: dict(zip(items[::2], items[1::2], strict=True)),
+}
+
+
+def _apply(spec: "ValidatorSpec", call: tuple[str, list[Any], dict[str, Any]]) -> "ValidatorSpec":
+    name, args, kwargs = call
+    return getattr(spec, name)(*args, **kwargs)
+
+
+def _expression(data: dict[str, Any], args: list[Any]) -> Expression:
+    return (Condition if data["condition"] else Expression)(data["$expression"], tuple(args))
+
+
+def _expand_decoded_value(value: Any) -> tuple[Any, Callable[[list[Any]], Any] | None]:
+    if type(value) is list:
+        if _plain(value):
+            return list(value), None
+        return [(_VALUE, item, None) for item in value], list
+    if type(value) is not dict:
+        return value, None
+    for key in value:
+        if key.startswith("$"):
+            decoder = _DECODERS.get(key)
+            if decoder is not None:
+                return decoder(value), None
+            container = _CONTAINER_DECODERS.get(key)
+            if container is not None:
+                items = value[key]
+                if key == "$dict":
+                    items = [part for pair in items for part in pair]
+                if _plain(items):
+                    return container(items), None
+                return [(_VALUE, item, None) for item in items], container
+            if key == "$spec":
+                return [(_NODE, value["$spec"], validator_spec.ValidatorSpec)], lambda specs: specs[0]
+            if key == "$expression":
+                return [(_VALUE, arg, None) for arg in value["args"]], functools.partial(_expression, value)
+            raise ValueError(f"Unknown tagged value {key!r}")
+    keys = list(value)
+    return [(_VALUE, item, None) for item in value.values()], lambda items: dict(zip(keys, items, strict=True))
+
+
+def _expand_decoded(built: list["ValidatorSpec"] | None, item: tuple) -> tuple[Any, Callable[[list[Any]], Any] | None]:
+    """Expand ``item`` for :func:`_fold`; ``built`` holds the specs ``{"$node": position}`` refers to (flatten tables)."""
+    kind, data, cls = item
+    if built is not None and type(data) is dict and "$node" in data:
+        return built[data["$node"]], None
+    if kind is _VALUE:
+        return _expand_decoded_value(data)
+    if kind is _ARGS:
+        name = data["rule"]
+        if name not in validator_spec._BUILDERS and name != "add_validation":
+            raise ValueError(f"Unknown rule {name!r}")
+        args = data.get("args", ())
+        kwargs = data.get("kwargs", {})
+        keys = list(kwargs)
+        values = [*args, *kwargs.values()]
+        if _plain(values):
+            return (name, args, kwargs), None
+        return [(_VALUE, value, None) for value in values], lambda decoded: (
+            name,
+            decoded[: len(args)],
+            dict(zip(keys, decoded[len(args) :], strict=True)),
+        )
+    if "rule" in data:
+        return [(_ARGS, data, None)], lambda calls: _apply(cls(), calls[0])
+    if "or" in data:
+        return [(_NODE, child, cls) for child in data["or"]], lambda specs: specs[0] | specs[1]
+    if "not" in data:
+        return [(_NODE, data["not"], cls)], lambda specs: ~specs[0]
+    rules = ["rule" in child for child in data["and"]]
+
+    def combine(parts: list[Any]) -> "ValidatorSpec":
+        spec = cls()
+        for is_rule, part in zip(rules, parts, strict=True):
+            spec = _apply(spec, part) if is_rule else spec & part
+        return spec
+
+    return [
+        (_ARGS if is_rule else _NODE, child, cls) for is_rule, child in zip(rules, data["and"], strict=True)
+    ], combine
+
+
+def _build(node: dict[str, Any], cls: "type[ValidatorSpec]") -> "ValidatorSpec":
+    return _fold((_NODE, node, cls), functools.partial(_expand_decoded, None))
+
+
+def spec_from_dict(data: dict[str, Any], cls: "type[ValidatorSpec] | None" = None) -> "ValidatorSpec":
+    """Rebuild a spec (of class ``cls``, default ValidatorSpec) from :func:`spec_to_dict` data."""
+    version = data.get("version")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported spec format version: {version!r} (expected {FORMAT_VERSION})")
+    return _build(data["spec"], cls or validator_spec.ValidatorSpec)
+
+
+def flatten(nodes: Iterable[dict[str, Any]]) -> tuple[list[Any], list[int]]:
+    """Return the distinct spec nodes of ``nodes`` (dependencies first) and the table position of each node.
+
+    Nested specs ``{"$spec": node}`` and the AND/OR/NOT groups of a node are replaced
+    by ``{"$node": position}`` references, so table entries stay shallow however
+    deeply specs are nested.
+    """
+    table: list[Any] = []
+    index: dict[str, int] = {}
+
+    def intern(node: Any) -> int:
+        key = json.dumps(node, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        position = index.get(key)
+        if position is None:
+            position = index[key] = len(table)
+            table.append(node)
+        return position
+
+    def reference(node: dict[str, Any]) -> dict[str, Any]:
+        return node if "rule" in node else {"$node": intern(node)}
+
+    def expand(item: tuple[str, Any]) -> tuple[Any, Callable[[list[Any]], Any] | None]:
+        kind, value = item
+        if kind is _NODE and "rule" not in value:
+            group = next(iter(value))
+            if group == "not":
+                return [(_NODE, value["not"])], lambda nodes: {"not": reference(nodes[0])}
+            return [(_NODE, child) for child in value[group]], lambda nodes: {group: list(map(reference, nodes))}
+        if type(value) is list:
+            return [(_VALUE, item) for item in value], list
+        if type(value) is not dict:
+            return value, None
+        if "$spec" in value:
+            return [(_NODE, value["$spec"])], lambda nodes: {"$node": intern(nodes[0])}
+        keys = list(value)
+        return [(_VALUE, item) for item in value.values()], lambda items: dict(zip(keys, items, strict=True))
+
+    return table, [intern(_fold((_NODE, node), expand)) for node in nodes]
+
+
+def build_table(table: list[Any], cls: "type[ValidatorSpec] | None" = None) -> list["ValidatorSpec"]:
+    """Build the specs of a :func:`flatten` table in order, each one once; ``cls`` is used for the last one."""
+    built: list[ValidatorSpec] = []
+    expand = functools.partial(_expand_decoded, built)
+    last = len(table) - 1
+    for position, node in enumerate(table):
+        spec_cls = cls if cls is not None and position == last else validator_spec.ValidatorSpec
+        built.append(_fold((_NODE, node, spec_cls), expand))
+    return built
+
+
+def spec_to_table(spec: "ValidatorSpec") -> dict[str, Any]:
+    """Return the definition of ``spec`` as a :func:`flatten` table whose last entry is ``spec``.
+
+    Unlike :func:`spec_to_dict` the data nests no deeper than one rule, so it can be
+    pickled or marshalled however deeply specs are nested.
+    """
+    table, _ = flatten([_node_to_dict(spec._get_describe_tree())])
+    return {"version": FORMAT_VERSION, "table": table}
+
+
+def spec_from_table(data: dict[str, Any], cls: "type[ValidatorSpec] | None" = None) -> "ValidatorSpec":
+    """Rebuild a spec (of class ``cls``, default ValidatorSpec) from :func:`spec_to_table` data."""
+    version = data.get("version")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported spec format version: {version!r} (expected {FORMAT_VERSION})")
+    return build_table(data["table"], cls)[-1]
+
+
+def _encode(value: Any) -> Any:
+    """Return the JSON-compatible form of a builder argument."""
+    return _fold((_VALUE, value, None), _expand_encoded)
+
+
+def _decode(value: Any) -> Any:
+    """Return the builder argument encoded by :func:`_encode`."""
+    return _fold((_VALUE, value, None), functools.partial(_expand_decoded, None))
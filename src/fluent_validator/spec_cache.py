@@ -0,0 +1,144 @@
+"""On-disk cache of prepared spec definitions for fluent_validator.
+
+Loading many specs from their :meth:`~ValidatorSpec.to_dict` definitions spends
+most of its time building identical nested specs again and in the cyclic
+garbage collector, which keeps scanning the objects being created. SpecCache
+prepares a set of definitions once: nested specs and whole specs that are
+identical are stored a single time in a table ordered so that dependencies come
+first. The table is written with :mod:`marshal` under the content hash of the
+definitions, together with a digest of the payload. Later loads of the same
+definitions verify the file, build every distinct spec once (sharing it wherever
+it is used, since specs are immutable) and pause the collector meanwhile.
+"""
+
+import gc
+import hashlib
+import json
+import logging
+import marshal
+import os
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from .serialization import FORMAT_VERSION, _fold, build_table, flatten
+from .validator_spec import ValidatorSpec
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 2
+
+_MAGIC = b"FVSC"
+
+
+def _canonical_json(data: Any) -> str:
+    """Return ``json.dumps(data, sort_keys=True)`` in compact form, for data too deep for :mod:`json`."""
+
+    def expand(value: Any) -> tuple[Any, Any]:
+        if isinstance(value, list):
+            return value, lambda parts: f"[{','.join(parts)}]"
+        if isinstance(value, Mapping):
+            keys = sorted(value)
+
+            def combine(parts: list[str]) -> str:
+                members = (
+                    f"{json.dumps(key, ensure_ascii=False)}:{part}" for key, part in zip(keys, parts, strict=True)
+                )
+                return f"{{{','.join(members)}}}"
+
+            return [value[key] for key in keys], combine
+        return json.dumps(value, ensure_ascii=False), None
+
+    return _fold(data, expand)
+
+
+def definitions_key(definitions: Mapping[str, dict[str, Any]]) -> str:
+    """Return the content hash of ``{name: spec.to_dict()}`` definitions."""
+    try:
+        canonical = json.dumps(definitions, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except RecursionError:
+        canonical = _canonical_json(definitions)
+    return hashlib.sha256(f"{CACHE_FORMAT}:{FORMAT_VERSION}:{canonical}".encode()).hexdigest()
+
+
+def prepare(definitions: Mapping[str, dict[str, Any]]) -> tuple[list[Any], dict[str, int]]:
+    """Return ``(table, names)``: the distinct spec nodes, dependencies first, and the entry of each name.
+
+    Nested specs and AND/OR/NOT groups are replaced by ``{"$node": index}`` references into the table.
+    """
+    for name, data in definitions.items():
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported spec format version for {name!r}: {data.get('version')!r}")
+    table, positions = flatten(data["spec"] for data in definitions.values())
+    return table, dict(zip(definitions, positions, strict=True))
+
+
+def restore(table: list[Any], names: Mapping[str, int]) -> dict[str, ValidatorSpec]:
+    """Build every distinct spec of a prepared ``table`` once and return the specs by name."""
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        built = build_table(table)
+    finally:
+        if collecting:
+            gc.enable()
+    return {name: built[position] for name, position in names.items()}
+
+
+class SpecCache:
+    """Directory of prepared definition sets, one file per content hash.
+
+    ``load`` returns the specs of ``{name: spec.to_dict()}`` definitions, reading
+    the prepared file when it exists and is intact and writing it otherwise.
+    Files are written atomically, so concurrent workers may share the directory.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        """Use (and create if needed) ``directory`` for the cache files."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key: str) -> Path:
+        """Return the file holding the definitions with content hash ``key``."""
+        return self.directory / f"{key}.specs"
+
+    def _read(self, key: str) -> tuple[list[Any], dict[str, int]] | None:
+        path = self.path(key)
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        header, digest, payload = content[:4], content[4:36], content[36:]
+        if header != _MAGIC or hashlib.sha256(payload).digest() != digest:
+            logger.warning("Ignoring corrupted spec cache file %s", path)
+            return None
+        try:
+            cache_format, stored_key, table, names = marshal.loads(payload)  # noqa: S302 - digest checked above
+        except (EOFError, ValueError, TypeError):
+            logger.warning("Ignoring unreadable spec cache file %s", path)
+            return None
+        if cache_format != CACHE_FORMAT or stored_key != key:
+            return None
+        return table, names
+
+    def _write(self, key: str, prepared: tuple[list[Any], dict[str, int]]) -> None:
+        payload = marshal.dumps((CACHE_FORMAT, key, *prepared))
+        content = _MAGIC + hashlib.sha256(payload).digest() + payload
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".specs")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def load(self, definitions: Mapping[str, dict[str, Any]]) -> dict[str, ValidatorSpec]:
+        """Return the specs of ``definitions`` by name, preparing and storing them on a cache miss."""
+        key = definitions_key(definitions)
+        prepared = self._read(key)
+        if prepared is None:
+            prepared = prepare(definitions)
+            self._write(key, prepared)
+        return restore(*prepared)
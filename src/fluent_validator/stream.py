@@ -0,0 +1,131 @@
+"""Stream-level rules for fluent_validator.
+
+Stream rules hold state across the items of a single ``validate_each`` /
+``summarize_each`` run, e.g. to assert that a key is unique across a whole
+stream. Each run calls :meth:`StreamRule.start` to get a fresh checker.
+"""
+
+import math
+from collections.abc import Callable
+from typing import Any
+
+from .functions import _freeze
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for ``capacity`` items at ``false_positive_rate``.
+
+    Memory is ``-capacity * ln(p) / ln(2)**2`` bits regardless of how many items are
+    added; membership answers may be false positives but never false negatives.
+    """
+
+    __slots__ = ("_bits", "_hashes", "_size")
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001):
+        """Allocate the bit array for ``capacity`` items."""
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(f"false_positive_rate must be between 0 and 1, got {false_positive_rate}")
+        size = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self._size = size
+        self._hashes = max(1, round(size / capacity * math.log(2)))
+        self._bits = bytearray((size + 7) // 8)
+
+    def add(self, item: Any) -> bool:
+        """Add ``item`` and return True if it was (possibly) already present."""
+        item_hash = hash(item)
+        h1 = hash((item_hash, 0))
+        h2 = hash((item_hash, 1)) | 1
+        bits, size = self._bits, self._size
+        present = True
+        for i in range(self._hashes):
+            position = (h1 + i * h2) % size
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                present = False
+                bits[position >> 3] |= mask
+        return present
+
+
+class StreamRule:
+    """Base class for rules evaluated across the items of a stream."""
+
+    def start(self) -> Callable[[Any], bool]:
+        """Return a fresh checker returning False for items breaking the rule."""
+        raise NotImplementedError
+
+
+class UniqueKeyRule(StreamRule):
+    """Assert ``key(item)`` is unique across a stream.
+
+    In exact mode seen keys are kept in a set. In approximate mode they are kept in
+    a :class:`BloomFilter`, bounding memory at the cost of reporting false duplicates
+    with probability ``false_positive_rate`` once ``expected_items`` keys were seen.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Any], Any] | None = None,
+        *,
+        approximate: bool = False,
+        expected_items: int = 1_000_000,
+        false_positive_rate: float = 0.001,
+    ):
+        """Configure the key function and the tracking mode."""
+        self.key = key
+        self.approximate = approximate
+        self.expected_items = expected_items
+        self.false_positive_rate = false_positive_rate
+        if approximate:
+            # validate the sizing arguments at build time rather than on the first run
+            BloomFilter(1, false_positive_rate)
+            if expected_items <= 0:
+                raise ValueError(f"expected_items must be positive, got {expected_items}")
+
+    def start(self) -> Callable[[Any], bool]:
+        """Return a checker with empty key tracking state.
+
+        Keys that can be neither hashed nor frozen are compared pairwise among
+        themselves, in both modes.
+        """
+        key_fn = self.key
+        unfrozen: list = []
+
+        def check_unfrozen(key: Any) -> bool:
+            if any(key == other for other in unfrozen):
+                return False
+            unfrozen.append(key)
+            return True
+
+        if self.approximate:
+            bloom = BloomFilter(self.expected_items, self.false_positive_rate)
+
+            def check_approximate(item: Any) -> bool:
+                key = item if key_fn is None else key_fn(item)
+                try:
+                    return not bloom.add(key)
+                except TypeError:
+                    pass
+                try:
+                    return not bloom.add(_freeze(key))
+                except TypeError:
+                    return check_unfrozen(key)
+
+            return check_approximate
+
+        seen: set = set()
+
+        def check_exact(item: Any) -> bool:
+            key = item if key_fn is None else key_fn(item)
+            size = len(seen)
+            try:
+                seen.add(key)
+            except TypeError:
+                try:
+                    seen.add(_freeze(key))
+                except TypeError:
+                    return check_unfrozen(key)
+            return len(seen) != size
+
+        return check_exact
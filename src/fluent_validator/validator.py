@@ -5,9 +5,13 @@ create configured :class:`~fluent_validator.validator_spec.ValidatorSpec`
 instances for common validations.
 """
 
-from collections.abc import Callable, Iterable
+import re
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any, Literal
 
+from .expressions import Condition
+from .messages import Message
+from .stream import StreamRule
 from .validator_spec import ValidatorSpec
 
 
@@ -229,7 +233,7 @@ class Validator:
         cls,
         validation_fn: Callable[[Any], bool],
         *,
-        msg: str,
+        msg: Message,
     ) -> ValidatorSpec:
         """Create a ValidatorSpec that uses a custom validation function.
 
@@ -240,10 +244,39 @@ class Validator:
         """
         return cls.prepare().add_validation(validation_fn, msg=msg)
 
+    @classmethod
+    def add_cross_field_validation(
+        cls,
+        fields: Iterable[Any],
+        predicate: Callable[..., bool],
+        *,
+        msg: Message | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a predicate over several fields of a record.
+
+        Args:
+            fields: Names of the fields passed positionally to ``predicate``.
+            predicate: Callable returning True when the field values are valid.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().add_cross_field_validation(fields, predicate, msg=msg)
+
+    @classmethod
+    def satisfies(cls, *conditions: Condition, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks cross-field conditions on a record.
+
+        Args:
+            conditions: Conditions built with ``field``, e.g. ``field("start").lt(field("end"))``.
+            msg: Optional custom error message used for every condition.
+
+        """
+        return cls.prepare().satisfies(*conditions, msg=msg)
+
     @classmethod
     def add_validations(
         cls,
-        validations: list[tuple[Callable[[Any], bool], str]],
+        validations: list[tuple[Callable[[Any], bool], Message]],
     ) -> ValidatorSpec:
         """Create a ValidatorSpec and add multiple (fn, msg) validations.
 
@@ -253,6 +286,45 @@ class Validator:
         """
         return cls.prepare().add_validations(validations)
 
+    @classmethod
+    def add_stream_rule(cls, rule: StreamRule, *, msg: Message) -> ValidatorSpec:
+        """Create a ValidatorSpec with a stream-level rule checked by ``validate_each``.
+
+        Args:
+            rule: Stream rule providing a fresh checker per validation run.
+            msg: Error message used when the rule fails.
+
+        """
+        return cls.prepare().add_stream_rule(rule, msg=msg)
+
+    @classmethod
+    def is_unique_in_stream(
+        cls,
+        key: Callable[[Any], Any] | None = None,
+        *,
+        approximate: bool = False,
+        expected_items: int = 1_000_000,
+        false_positive_rate: float = 0.001,
+        msg: str | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks ``key(item)`` is unique across a ``validate_each`` stream.
+
+        Args:
+            key: Function extracting the key from each item; defaults to the item itself.
+            approximate: Track keys in a fixed-size Bloom filter instead of a set.
+            expected_items: Number of keys the Bloom filter is sized for.
+            false_positive_rate: Target false duplicate rate of the Bloom filter.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().is_unique_in_stream(
+            key,
+            approximate=approximate,
+            expected_items=expected_items,
+            false_positive_rate=false_positive_rate,
+            msg=msg,
+        )
+
     @classmethod
     def is_between(
         cls,
@@ -573,3 +645,274 @@ class Validator:
     def is_not_in(cls, collection: Iterable, *, msg: str | None = None) -> ValidatorSpec:
         """Create a ValidatorSpec that checks a value is not in the provided collection."""
         return cls.prepare().is_not_in(collection, msg=msg)
+
+    @classmethod
+    def matches(
+        cls,
+        pattern: str | re.Pattern,
+        *,
+        flags: int = 0,
+        msg: str | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a string matches ``pattern`` at its beginning.
+
+        Args:
+            pattern: Regular expression, compiled once through the shared pattern cache.
+            flags: ``re`` flags used to compile ``pattern``.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().matches(pattern, flags=flags, msg=msg)
+
+    @classmethod
+    def does_not_match(
+        cls,
+        pattern: str | re.Pattern,
+        *,
+        flags: int = 0,
+        msg: str | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a value does not match ``pattern`` at its beginning.
+
+        Args:
+            pattern: Regular expression, compiled once through the shared pattern cache.
+            flags: ``re`` flags used to compile ``pattern``.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().does_not_match(pattern, flags=flags, msg=msg)
+
+    @classmethod
+    def fullmatches(
+        cls,
+        pattern: str | re.Pattern,
+        *,
+        flags: int = 0,
+        msg: str | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a whole string matches ``pattern``.
+
+        Args:
+            pattern: Regular expression, compiled once through the shared pattern cache.
+            flags: ``re`` flags used to compile ``pattern``.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().fullmatches(pattern, flags=flags, msg=msg)
+
+    @classmethod
+    def does_not_fullmatch(
+        cls,
+        pattern: str | re.Pattern,
+        *,
+        flags: int = 0,
+        msg: str | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a value is not entirely matched by ``pattern``.
+
+        Args:
+            pattern: Regular expression, compiled once through the shared pattern cache.
+            flags: ``re`` flags used to compile ``pattern``.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().does_not_fullmatch(pattern, flags=flags, msg=msg)
+
+    @classmethod
+    def starts_with(cls, prefix: str | tuple[str, ...], *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a string starts with ``prefix``.
+
+        Args:
+            prefix: A string or a tuple of alternatives.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().starts_with(prefix, msg=msg)
+
+    @classmethod
+    def does_not_start_with(cls, prefix: str | tuple[str, ...], *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a value does not start with ``prefix``.
+
+        Args:
+            prefix: A string or a tuple of alternatives.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().does_not_start_with(prefix, msg=msg)
+
+    @classmethod
+    def ends_with(cls, suffix: str | tuple[str, ...], *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a string ends with ``suffix``.
+
+        Args:
+            suffix: A string or a tuple of alternatives.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().ends_with(suffix, msg=msg)
+
+    @classmethod
+    def does_not_end_with(cls, suffix: str | tuple[str, ...], *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a value does not end with ``suffix``.
+
+        Args:
+            suffix: A string or a tuple of alternatives.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().does_not_end_with(suffix, msg=msg)
+
+    @classmethod
+    def has_length_between(cls, min_length: int, max_length: int, *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks ``len(value)`` is between two bounds.
+
+        Args:
+            min_length: Minimum length (inclusive).
+            max_length: Maximum length (inclusive).
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().has_length_between(min_length, max_length, msg=msg)
+
+    @classmethod
+    def has_length_not_between(cls, min_length: int, max_length: int, *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks ``len(value)`` is not between two bounds.
+
+        Args:
+            min_length: Minimum length (inclusive).
+            max_length: Maximum length (inclusive).
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().has_length_not_between(min_length, max_length, msg=msg)
+
+    @classmethod
+    def contains_any_of(cls, keywords: Iterable[str], *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a string contains at least one of ``keywords``.
+
+        Args:
+            keywords: Substrings to look for; compiled once into an Aho-Corasick automaton.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().contains_any_of(keywords, msg=msg)
+
+    @classmethod
+    def contains_none_of(cls, keywords: Iterable[str], *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a string contains none of ``keywords``.
+
+        Args:
+            keywords: Substrings to reject; compiled once into an Aho-Corasick automaton.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().contains_none_of(keywords, msg=msg)
+
+    @classmethod
+    def is_in_ranges(
+        cls,
+        ranges: Iterable[tuple[Any, Any]],
+        *,
+        closed: Literal["both", "left", "right", "none"] = "both",
+        msg: str | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a value lies in any of ``ranges``.
+
+        Args:
+            ranges: ``(lower, upper)`` pairs, merged once into sorted bounds for O(log n) lookups.
+            closed: Which bounds are inclusive: 'both', 'left', 'right', or 'none'.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().is_in_ranges(ranges, closed=closed, msg=msg)
+
+    @classmethod
+    def is_not_in_ranges(
+        cls,
+        ranges: Iterable[tuple[Any, Any]],
+        *,
+        closed: Literal["both", "left", "right", "none"] = "both",
+        msg: str | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a value lies in none of ``ranges``.
+
+        Args:
+            ranges: ``(lower, upper)`` pairs, merged once into sorted bounds for O(log n) lookups.
+            closed: Which bounds are inclusive: 'both', 'left', 'right', or 'none'.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().is_not_in_ranges(ranges, closed=closed, msg=msg)
+
+    @classmethod
+    def schema(
+        cls,
+        fields: Mapping[Any, "ValidatorSpec"],
+        *,
+        required: Iterable[Any] | None = None,
+        extra: Literal["forbid", "allow"] = "allow",
+        msg: str | None = None,
+    ) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a mapping against per-key specs.
+
+        Args:
+            fields: Mapping of key to the spec its value must satisfy.
+            required: Keys that must be present; defaults to every key of ``fields``.
+            extra: 'forbid' to reject keys not declared in ``fields``, 'allow' to ignore them.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().schema(fields, required=required, extra=extra, msg=msg)
+
+    @classmethod
+    def each(cls, spec: "ValidatorSpec", *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks every item of an iterable against ``spec``.
+
+        Args:
+            spec: Spec each item must satisfy; may itself use each/each_key/each_value/schema.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().each(spec, msg=msg)
+
+    @classmethod
+    def each_key(cls, spec: "ValidatorSpec", *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks every key of a mapping against ``spec``.
+
+        Args:
+            spec: Spec each key must satisfy.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().each_key(spec, msg=msg)
+
+    @classmethod
+    def each_value(cls, spec: "ValidatorSpec", *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks every value of a mapping against ``spec``.
+
+        Args:
+            spec: Spec each value must satisfy; may itself use each/each_key/each_value/schema.
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().each_value(spec, msg=msg)
+
+    @classmethod
+    def has_valid_fields(cls, *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a dataclass instance against its field specs.
+
+        Args:
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().has_valid_fields(msg=msg)
+
+    @classmethod
+    def has_invalid_fields(cls, *, msg: str | None = None) -> ValidatorSpec:
+        """Create a ValidatorSpec that checks a dataclass instance has a field failing its spec.
+
+        Args:
+            msg: Optional custom error message.
+
+        """
+        return cls.prepare().has_invalid_fields(msg=msg)
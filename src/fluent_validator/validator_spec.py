@@ -3,12 +3,287 @@
 Provides ValidatorSpec, a composable builder for validation rules.
 """
 
-from collections.abc import Callable, Iterable
+import copy
+import functools
+import math
+import re
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any, Literal, Self
 
 from fluent_validator import functions as F
 
+from .automaton import KeywordAutomaton
+from .cache import CacheInfo, ResultCache
+from .cross_field import CrossFieldRule
+from .dataclass_fields import has_invalid_fields, has_valid_fields
+from .events import FailureEvents
 from .exceptions import ValidationError
+from .expressions import Condition, ConditionGroup, condition_message
+from .incremental import IncrementalValidation
+from .intervals import IntervalSet
+from .messages import LazyMessage, Message, format_value, snapshot
+from .nested import EachRule, explain_failure
+from .paths import format_path
+from .plan import Plan, build_plan, lookup_cost
+from .profiling import ProfiledRule, SpecStats, unwrap
+from .report import ValidationReport
+from .schema import SchemaRule
+from .serialization import spec_from_dict, spec_from_table, spec_to_dict, spec_to_table
+from .stream import StreamRule, UniqueKeyRule
+
+_STRING_CHECKS: dict[str, Callable[[Any, Any], bool]] = {
+    "match": F.matches,
+    "fullmatch": F.fullmatches,
+    "startswith": F.starts_with,
+    "endswith": F.ends_with,
+}
+
+_STRING_FUSIONS = {
+    "match": ("matches", "one alternation regex"),
+    "fullmatch": ("fullmatches", "one alternation regex"),
+    "startswith": ("starts_with", "one str.startswith call"),
+    "endswith": ("ends_with", "one str.endswith call"),
+}
+
+# backreferences and conditionals by group number would point elsewhere once patterns are merged
+_NUMBERED_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+class _StringRule:
+    """Prefix/suffix/pattern check that can be merged with a sibling under OR.
+
+    ``starts_with("a") | starts_with("b")`` becomes one ``str.startswith`` call with a
+    tuple of prefixes and ``matches(p1) | matches(p2)`` one ``(?:p1)|(?:p2)`` regex.
+    """
+
+    __slots__ = ("_check", "kind", "operand", "sources")
+
+    def __init__(self, kind: str, operand: re.Pattern | tuple[str, ...], sources: int = 1):
+        self.kind = kind
+        self.operand = operand
+        self.sources = sources
+        self._check = _STRING_CHECKS[kind]
+
+    @property
+    def cost(self) -> str:
+        """Return the cost class shown by ``explain``: patterns scan the string, prefixes do not."""
+        return "linear" if self.kind in ("match", "fullmatch") else "constant"
+
+    @property
+    def rewrite(self) -> str | None:
+        """Describe the OR fusion that produced this rule, if any (shown by ``explain``)."""
+        if self.sources == 1:
+            return None
+        rule, target = _STRING_FUSIONS[self.kind]
+        return f"{self.sources} {rule} rules under OR fused into {target}"
+
+    def merge(self, other: "_StringRule") -> "_StringRule | None":
+        """Return a single rule equivalent to ``self OR other``, or None if they cannot be merged."""
+        if self.kind != other.kind:
+            return None
+        if self.kind in ("startswith", "endswith"):
+            return _StringRule(self.kind, self.operand + other.operand, self.sources + other.sources)
+
+        left, right = self.operand, other.operand
+        if left.flags != right.flags or not isinstance(left.pattern, str) or not isinstance(right.pattern, str):
+            return None
+        if _NUMBERED_GROUP_REFERENCE.search(left.pattern) or _NUMBERED_GROUP_REFERENCE.search(right.pattern):
+            return None
+        try:
+            merged = F.compile_pattern(f"(?:{left.pattern})|(?:{right.pattern})", left.flags)
+        except re.error:
+            # e.g. duplicated group names or inline global flags
+            return None
+        return _StringRule(self.kind, merged, self.sources + other.sources)
+
+    def __call__(self, obj: Any) -> bool:
+        return self._check(obj, self.operand)
+
+
+_LITERAL_TYPES = frozenset({str, bytes, int, float, bool, type(None)})
+
+
+class _MembershipRule:
+    """Equality/membership checks over plain literals merged under OR into one frozenset lookup.
+
+    ``is_equal("a") | is_equal("b") | is_in(["c", "d"])`` becomes a single lookup, and
+    so does the same disjunction with every branch behind the same ``guard`` check
+    (e.g. ``is_string().is_equal("a") | is_string().is_equal("b")``). The checks of
+    ``is_equal`` / ``is_in`` stay plain functions carrying their ``literals``.
+
+    Only objects of the literal types themselves are looked up by hash: other objects
+    may define an ``__eq__`` that disagrees with their hash, so they are compared with
+    ``==`` against each literal, as the unfused ``is_equal`` checks would.
+    """
+
+    __slots__ = ("guard", "sources", "values")
+
+    # one frozenset lookup, or a scan of the literals for values of other types
+    cost = "constant"
+
+    def __init__(self, values: frozenset, guard: Callable[[Any], bool] | None = None, sources: int = 1):
+        self.values = values
+        self.guard = guard
+        self.sources = sources
+
+    @property
+    def rewrite(self) -> str:
+        """Describe the OR fusion that produced this rule (shown by ``explain``)."""
+        guarded = " behind one shared type check" if self.guard is not None else ""
+        return f"{self.sources} is_equal/is_in rules under OR fused into one frozenset lookup{guarded}"
+
+    @classmethod
+    def of(cls, validations: list[tuple[Callable[[Any], bool], Message]]) -> "_MembershipRule | None":
+        """Return the membership rule ``validations`` amount to, or None.
+
+        That is a single literal check (or merged rule), or any check followed by a literal check.
+        """
+        if len(validations) == 1:
+            rule = unwrap(validations[0][0])
+            if isinstance(rule, cls):
+                return rule
+            literals = getattr(rule, "literals", None)
+            return None if literals is None else cls(literals)
+        if len(validations) == 2:
+            guard, rule = unwrap(validations[0][0]), unwrap(validations[1][0])
+            literals = getattr(rule, "literals", None)
+            if literals is not None and not isinstance(guard, cls):
+                return cls(literals, guard)
+        return None
+
+    def merge(self, other: "_MembershipRule") -> "_MembershipRule | None":
+        """Return a single rule equivalent to ``self OR other``, or None if they cannot be merged."""
+        if self.guard is not other.guard:
+            return None
+        return _MembershipRule(self.values | other.values, self.guard, self.sources + other.sources)
+
+    def __call__(self, obj: Any) -> bool:
+        if self.guard is not None and not self.guard(obj):
+            return False
+        if type(obj) in _LITERAL_TYPES:
+            return obj in self.values
+        return any(obj == value for value in self.values)
+
+
+def _with_literals(check: Callable[[Any], bool], values: Any) -> Callable[[Any], bool]:
+    """Mark ``check`` (true iff the object equals one of ``values``) as mergeable into a :class:`_MembershipRule`.
+
+    ``values`` is a tuple or frozenset of literals; other containers leave ``check`` unmarked.
+    """
+    # hashing and equality agree for these types, except for NaN (never equal, but found by identity)
+    if type(values) in (tuple, frozenset) and all(
+        type(value) in _LITERAL_TYPES and not (type(value) is float and math.isnan(value)) for value in values
+    ):
+        check.literals = frozenset(values)
+    return check
+
+
+# names of the builder methods recording their calls, the only ones spec_from_dict replays
+_BUILDERS: set[str] = set()
+
+
+# containers copied when a builder call is recorded; other arguments (specs, patterns, callables) are shared
+_COPIED_ARGUMENT_TYPES = frozenset({list, tuple, dict, set, frozenset})
+
+
+def _argument_children(container: Any) -> Iterable[Any]:
+    return container.values() if type(container) is dict else container
+
+
+def _is_flat(container: Any) -> bool:
+    # set items and dict keys are hashable, so they never hold a list, dict or set to copy
+    return type(container) in (set, frozenset) or _COPIED_ARGUMENT_TYPES.isdisjoint(
+        map(type, _argument_children(container)),
+    )
+
+
+def _shallow_copy(container: Any) -> Any:
+    return container if type(container) in (tuple, frozenset) else type(container)(container)
+
+
+def _copy_argument(value: Any) -> Any:
+    """Return ``value`` with the lists, dicts and sets inside it copied, walking it with an explicit stack.
+
+    The recorded call must not follow later changes to the caller's containers, whose
+    contents the builder already prepared. A container holding itself keeps referring to the original.
+    """
+    if type(value) not in _COPIED_ARGUMENT_TYPES:
+        return value
+    if _is_flat(value):
+        return _shallow_copy(value)
+    # one frame per open container: (container, remaining children, copied children)
+    stack = [(value, iter(_argument_children(value)), [])]
+    open_ids = {id(value)}
+    while True:
+        container, children, copied = stack[-1]
+        for child in children:
+            if type(child) not in _COPIED_ARGUMENT_TYPES or id(child) in open_ids:
+                copied.append(child)
+            elif _is_flat(child):
+                copied.append(_shallow_copy(child))
+            else:
+                open_ids.add(id(child))
+                stack.append((child, iter(_argument_children(child)), []))
+                break
+        else:
+            stack.pop()
+            open_ids.discard(id(container))
+            if type(container) is dict:
+                result = dict(zip(container, copied, strict=True))
+            else:
+                result = copied if type(container) is list else tuple(copied)
+            if not stack:
+                return result
+            stack[-1][2].append(result)
+
+
+def _recorded_leaf(leaf: tuple, definition: tuple) -> tuple:
+    """Return ``leaf`` recording ``definition``, keeping its check (stream rules have none) for ``explain``."""
+    checks = [part for part in leaf[2:] if type(part) is not tuple]
+    return ("leaf", leaf[1], definition, *checks[-1:])
+
+
+def _without_checks(tree: tuple) -> tuple:
+    """Return ``tree`` with the checks dropped from its builder leaves, down to its first combinator."""
+    if tree[0] == "leaf":
+        return tree[:3]
+    if tree[0] == "and":
+        return ("and", [child[:3] if child[0] == "leaf" else child for child in tree[1]])
+    return tree
+
+
+def _declarative(method: Callable[..., "ValidatorSpec"]) -> Callable[..., "ValidatorSpec"]:
+    """Decorate a builder method so the describe leaf it adds records the call, for :meth:`ValidatorSpec.to_dict`.
+
+    The method receives copies of its container arguments, taken when the spec is
+    built, and the leaf records the same copies.
+    """
+    name = method.__name__
+    _BUILDERS.add(name)
+
+    @functools.wraps(method)
+    def builder(self: "ValidatorSpec", *args: Any, **kwargs: Any) -> "ValidatorSpec":
+        if not _COPIED_ARGUMENT_TYPES.isdisjoint(map(type, args)):
+            args = tuple(map(_copy_argument, args))
+        if not _COPIED_ARGUMENT_TYPES.isdisjoint(map(type, kwargs.values())):
+            kwargs = {key: _copy_argument(value) for key, value in kwargs.items()}
+        spec = method(self, *args, **kwargs)
+        definition = (name, args, kwargs)
+        tree = spec._describe_tree
+        if tree[0] == "leaf":
+            spec._describe_tree = _recorded_leaf(tree, definition)
+        else:
+            # the children list was just created for ``spec``; its last item is the new leaf
+            children = tree[1]
+            children[-1] = _recorded_leaf(children[-1], definition)
+        return spec
+
+    return builder
+
+
+def _format_failures(failures: list[tuple[tuple, Message]]) -> str:
+    """Join ``(path, message)`` failures as ``path: message`` (bare message for the root)."""
+    return "; ".join(f"{format_path(path)}: {msg}" if path else str(msg) for path, msg in failures)
 
 
 class ValidatorSpec:
@@ -19,27 +294,60 @@ class ValidatorSpec:
 
     def __init__(
         self,
-        validations: list[tuple[Callable[[Any], bool], str]] | None = None,
+        validations: list[tuple[Callable[[Any], bool], Message]] | None = None,
         _describe_tree: tuple | None = None,
+        _stream_rules: list[tuple[StreamRule, Message]] | None = None,
     ):
-        """Initialize the ValidatorSpec with optional validations and describe tree."""
+        """Initialize the ValidatorSpec with optional validations, describe tree and stream rules."""
         self._validations = validations or []
         self._describe_tree = _describe_tree
+        self._stream_rules = _stream_rules or []
+        self._cache: ResultCache | None = None
+        self._stats: SpecStats | None = None
+        self._events: FailureEvents | None = None
+        self._spec_id = ""
+        self._descriptions: dict[bool, str] = {}
+
+    def __copy__(self) -> Self:
+        """Return a shallow copy sharing the validations (and cache, stats and events)."""
+        spec = type(self).__new__(type(self))
+        spec.__dict__.update(self.__dict__)
+        return spec
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        """Return a shallow copy: specs are immutable once built."""
+        return self.__copy__()
 
     @classmethod
     def from_validations(
         cls,
-        validations: list[tuple[Callable[[Any], bool], str]],
+        validations: list[tuple[Callable[[Any], bool], Message]],
         _describe_tree: tuple | None = None,
+        _stream_rules: list[tuple[StreamRule, Message]] | None = None,
     ) -> Self:
         """Create a ValidatorSpec from a list of (validation_fn, msg) pairs and optional describe tree."""
-        return cls(validations=validations, _describe_tree=_describe_tree)
+        return cls(validations=validations, _describe_tree=_describe_tree, _stream_rules=_stream_rules)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Rebuild a spec from the data returned by :meth:`to_dict`."""
+        return spec_from_dict(data, cls)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible definition of this spec, loadable with :meth:`from_dict`.
 
-    def validations(self) -> list[tuple[Callable[[Any], bool], str]]:
+        Every rule added through a builder method is covered, including AND/OR/NOT
+        structure and nested specs; custom predicates and types must be registered
+        with :func:`fluent_validator.serialization.register`. Memoization,
+        instrumentation and failure events are not part of the definition.
+        """
+        return spec_to_dict(self)
+
+    def validations(self) -> list[tuple[Callable[[Any], bool], Message]]:
         """Return a shallow copy of the validations list."""
         return self._validations.copy()
 
-    def add_validation(self, validation_fn: Callable[[Any], bool], *, msg: str) -> Self:
+    def add_validation(self, validation_fn: Callable[[Any], bool], *, msg: Message) -> Self:
         """Add a single validation and return a new ValidatorSpec."""
         return self.add_validations([(validation_fn, msg)])
 
@@ -47,33 +355,122 @@ class ValidatorSpec:
         """Return the internal describe tree, constructing it from validations if necessary."""
         if self._describe_tree is not None:
             return self._describe_tree
-        if not self._validations:
+        if not self._validations and not self._stream_rules:
             return None
-        leaves = [("leaf", msg) for _, msg in self._validations]
+        leaves = [("leaf", msg, fn) for fn, msg in self._validations]
+        leaves.extend(("leaf", msg) for _, msg in self._stream_rules)
         if len(leaves) == 1:
             return leaves[0]
         return ("and", leaves)
 
+    def _extend_describe_tree(self, new_leaves: list[tuple]) -> tuple | None:
+        """Return the describe tree with ``new_leaves`` appended to the top-level AND."""
+        current_tree = self._get_describe_tree()
+
+        if not new_leaves:
+            return current_tree
+        if current_tree is None:
+            return new_leaves[0] if len(new_leaves) == 1 else ("and", new_leaves)
+        if current_tree[0] == "and":
+            return ("and", list(current_tree[1]) + new_leaves)
+        return ("and", [current_tree, *new_leaves])
+
     def add_validations(
         self,
-        validations: list[tuple[Callable[[Any], bool], str]],
+        validations: list[tuple[Callable[[Any], bool], Message]],
     ) -> Self:
         """Add multiple validations and return a new ValidatorSpec."""
         new_validations = self.validations() + validations
-        current_tree = self._get_describe_tree()
-        new_leaves = [("leaf", msg) for _, msg in validations]
+        new_tree = self._extend_describe_tree([("leaf", msg, fn) for fn, msg in validations])
+        return self.from_validations(new_validations, _describe_tree=new_tree, _stream_rules=self._stream_rules)
 
-        if not new_leaves:
-            new_tree = current_tree
-        elif current_tree is None:
-            new_tree = new_leaves[0] if len(new_leaves) == 1 else ("and", new_leaves)
-        elif current_tree[0] == "and":
-            new_tree = ("and", list(current_tree[1]) + new_leaves)
-        else:
-            new_tree = ("and", [current_tree, *new_leaves])
+    @_declarative
+    def add_cross_field_validation(
+        self,
+        fields: Iterable[Any],
+        predicate: Callable[..., bool],
+        *,
+        msg: Message | None = None,
+    ) -> Self:
+        """Add a validation calling ``predicate(*values)`` with the values of ``fields`` of a record.
+
+        The record may be a mapping or an object such as a dataclass; the rule fails
+        when a field is missing. Declaring the fields lets :meth:`incremental` recheck
+        the rule only when one of them changes.
+        """
+        rule = CrossFieldRule(fields, predicate)
+        msg = msg or LazyMessage(
+            "Fields {fields} should satisfy {predicate} (rule: cross_field)",
+            fields=list(rule.fields),
+            predicate=getattr(predicate, "__name__", predicate),
+        )
+        return self.add_validation(rule, msg=msg)
+
+    @_declarative
+    def satisfies(self, *conditions: Condition, msg: str | None = None) -> Self:
+        """Add a validation that asserts the record satisfies cross-field ``conditions``.
+
+        Conditions are built with :func:`~fluent_validator.expressions.field`, e.g.
+        ``field("start").lt(field("end"))``. Conditions passed in one call share a
+        plan: each field is read once per record and identical sub-expressions are
+        evaluated once. Conditions reading a field that fails this spec's ``schema``
+        checks are not reported, and ``msg`` replaces the message of every condition.
+        """
+        field_checks: dict[Any, list] = {}
+        for validation_fn, _ in self._validations:
+            validation_fn = unwrap(validation_fn)
+            if isinstance(validation_fn, SchemaRule):
+                for key, required, checks in validation_fn._checks:
+                    field_checks.setdefault(key, []).append((required, checks))
+        group = ConditionGroup(
+            [(condition, msg or condition_message(condition)) for condition in conditions],
+            field_checks,
+        )
+        group_msg = msg or LazyMessage.join(" AND ", (condition_msg for _, condition_msg in group.conditions))
+        return self.add_validation(group, msg=group_msg)
+
+    def add_stream_rule(self, rule: StreamRule, *, msg: Message) -> Self:
+        """Add a stream-level rule, checked across the items of ``validate_each`` / ``summarize_each``.
+
+        Stream rules only run for items that passed the per-item validations and are
+        ignored by :meth:`validate`, since a single value cannot break them.
+        """
+        new_tree = self._extend_describe_tree([("leaf", msg)])
+        return self.from_validations(
+            self.validations(),
+            _describe_tree=new_tree,
+            _stream_rules=[*self._stream_rules, (rule, msg)],
+        )
 
-        return self.from_validations(new_validations, _describe_tree=new_tree)
+    @_declarative
+    def is_unique_in_stream(
+        self,
+        key: Callable[[Any], Any] | None = None,
+        *,
+        approximate: bool = False,
+        expected_items: int = 1_000_000,
+        false_positive_rate: float = 0.001,
+        msg: str | None = None,
+    ) -> Self:
+        """Add a stream rule asserting ``key(item)`` (default: the item) is unique across the stream.
+
+        Exact mode keeps every seen key in a set. With ``approximate=True`` keys go into a
+        Bloom filter sized for ``expected_items``, so memory is fixed but a unique item may
+        be reported as a duplicate with probability ``false_positive_rate``.
+
+        There is no negative counterpart: per item it would reject every first
+        occurrence, and stream rules cannot be negated with ``~`` either.
+        """
+        msg = msg or "Should be unique across all items (rule: is_unique_in_stream)"
+        rule = UniqueKeyRule(
+            key,
+            approximate=approximate,
+            expected_items=expected_items,
+            false_positive_rate=false_positive_rate,
+        )
+        return self.add_stream_rule(rule, msg=msg)
 
+    @_declarative
     def is_instance_of(
         self,
         types: type | tuple[type, ...],
@@ -81,12 +478,13 @@ class ValidatorSpec:
         msg: str | None = None,
     ) -> Self:
         """Add a validation that asserts the object is instance of."""
-        msg = msg or f"Should be an instance of {types} (rule: is_instance_of)"
+        msg = msg or LazyMessage("Should be an instance of {types} (rule: is_instance_of)", types=types)
         return self.add_validation(
             lambda obj: F.is_instance_of(obj, types),
             msg=msg,
         )
 
+    @_declarative
     def is_not_instance_of(
         self,
         types: type | tuple[type, ...],
@@ -94,196 +492,237 @@ class ValidatorSpec:
         msg: str | None = None,
     ) -> Self:
         """Add a validation that asserts the object is not instance of."""
-        msg = msg or f"Should not be an instance of {types} (rule: is_not_instance_of)"
+        msg = msg or LazyMessage("Should not be an instance of {types} (rule: is_not_instance_of)", types=types)
         return self.add_validation(
             lambda obj: F.is_not_instance_of(obj, types),
             msg=msg,
         )
 
+    @_declarative
     def is_callable(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is callable."""
         msg = msg or "Should be callable (rule: is_callable)"
-        return self.add_validation(lambda obj: F.is_callable(obj), msg=msg)
+        return self.add_validation(F.is_callable, msg=msg)
 
+    @_declarative
     def is_not_callable(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not callable."""
         msg = msg or "Should not be callable (rule: is_not_callable)"
         return self.add_validation(
-            lambda obj: F.is_not_callable(obj),
+            F.is_not_callable,
             msg=msg,
         )
 
+    @_declarative
     def is_iterable(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is iterable."""
         msg = msg or "Should be iterable (rule: is_iterable)"
-        return self.add_validation(lambda obj: F.is_iterable(obj), msg=msg)
+        return self.add_validation(F.is_iterable, msg=msg)
 
+    @_declarative
     def is_not_iterable(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not iterable."""
         msg = msg or "Should not be iterable (rule: is_not_iterable)"
         return self.add_validation(
-            lambda obj: F.is_not_iterable(obj),
+            F.is_not_iterable,
             msg=msg,
         )
 
+    @_declarative
     def is_dataclass(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is dataclass."""
         msg = msg or "Should be a dataclass (rule: is_dataclass)"
-        return self.add_validation(lambda obj: F.is_dataclass(obj), msg=msg)
+        return self.add_validation(F.is_dataclass, msg=msg)
 
+    @_declarative
     def is_not_dataclass(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not dataclass."""
         msg = msg or "Should not be a dataclass (rule: is_not_dataclass)"
         return self.add_validation(
-            lambda obj: F.is_not_dataclass(obj),
+            F.is_not_dataclass,
             msg=msg,
         )
 
+    @_declarative
     def is_string(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is string."""
         msg = msg or "Should be a string (rule: is_string)"
-        return self.add_validation(lambda obj: F.is_string(obj), msg=msg)
+        return self.add_validation(F.is_string, msg=msg)
 
+    @_declarative
     def is_not_string(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not string."""
         msg = msg or "Should not be a string (rule: is_not_string)"
-        return self.add_validation(lambda obj: F.is_not_string(obj), msg=msg)
+        return self.add_validation(F.is_not_string, msg=msg)
 
+    @_declarative
     def is_number(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is number."""
         msg = msg or "Should be a number (rule: is_number)"
-        return self.add_validation(lambda obj: F.is_number(obj), msg=msg)
+        return self.add_validation(F.is_number, msg=msg)
 
+    @_declarative
     def is_not_number(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not number."""
         msg = msg or "Should not be a number (rule: is_not_number)"
-        return self.add_validation(lambda obj: F.is_not_number(obj), msg=msg)
+        return self.add_validation(F.is_not_number, msg=msg)
 
+    @_declarative
     def is_bool(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is bool."""
         msg = msg or "Should be a boolean (rule: is_bool)"
-        return self.add_validation(lambda obj: F.is_bool(obj), msg=msg)
+        return self.add_validation(F.is_bool, msg=msg)
 
+    @_declarative
     def is_not_bool(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not bool."""
         msg = msg or "Should not be a boolean (rule: is_not_bool)"
-        return self.add_validation(lambda obj: F.is_not_bool(obj), msg=msg)
+        return self.add_validation(F.is_not_bool, msg=msg)
 
+    @_declarative
     def is_none(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is none."""
         msg = msg or "Should be None (rule: is_none)"
-        return self.add_validation(lambda obj: F.is_none(obj), msg=msg)
+        return self.add_validation(F.is_none, msg=msg)
 
+    @_declarative
     def is_not_none(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not none."""
         msg = msg or "Should not be None (rule: is_not_none)"
-        return self.add_validation(lambda obj: F.is_not_none(obj), msg=msg)
+        return self.add_validation(F.is_not_none, msg=msg)
 
+    @_declarative
     def is_greater_than(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is greater than."""
-        msg = msg or f"Should be greater than {value} (rule: is_greater_than)"
+        msg = msg or LazyMessage("Should be greater than {value} (rule: is_greater_than)", value=value)
         return self.add_validation(
             lambda obj: F.is_greater_than(obj, value),
             msg=msg,
         )
 
+    @_declarative
     def is_not_greater_than(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not greater than."""
-        msg = msg or f"Should not be greater than {value} (rule: is_not_greater_than)"
+        msg = msg or LazyMessage("Should not be greater than {value} (rule: is_not_greater_than)", value=value)
         return self.add_validation(lambda obj: F.is_not_greater_than(obj, value), msg=msg)
 
+    @_declarative
     def is_gt(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is gt."""
         return self.is_greater_than(value, msg=msg)
 
+    @_declarative
     def is_not_gt(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not gt."""
         return self.is_not_greater_than(value, msg=msg)
 
+    @_declarative
     def is_greater_or_equal(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is greater or equal."""
-        msg = msg or f"Should be greater than or equal to {value} (rule: is_greater_or_equal)"
+        msg = msg or LazyMessage("Should be greater than or equal to {value} (rule: is_greater_or_equal)", value=value)
         return self.add_validation(
             lambda obj: F.is_greater_or_equal(obj, value),
             msg=msg,
         )
 
+    @_declarative
     def is_not_greater_or_equal(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not greater or equal."""
-        msg = msg or f"Should not be greater than or equal to {value} (rule: is_not_greater_or_equal)"
+        msg = msg or LazyMessage(
+            "Should not be greater than or equal to {value} (rule: is_not_greater_or_equal)",
+            value=value,
+        )
         return self.add_validation(lambda obj: F.is_not_greater_or_equal(obj, value), msg=msg)
 
+    @_declarative
     def is_gte(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is gte."""
         return self.is_greater_or_equal(value, msg=msg)
 
+    @_declarative
     def is_not_gte(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not gte."""
         return self.is_not_greater_or_equal(value, msg=msg)
 
+    @_declarative
     def is_equal(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is equal."""
-        msg = msg or f"Should be equal to {value} (rule: is_equal)"
+        msg = msg or LazyMessage("Should be equal to {value} (rule: is_equal)", value=value)
         return self.add_validation(
-            lambda obj: F.is_equal(obj, value),
+            _with_literals(lambda obj: F.is_equal(obj, value), (value,)),
             msg=msg,
         )
 
+    @_declarative
     def is_not_equal(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not equal."""
-        msg = msg or f"Should not be equal to {value} (rule: is_not_equal)"
+        msg = msg or LazyMessage("Should not be equal to {value} (rule: is_not_equal)", value=value)
         return self.add_validation(lambda obj: F.is_not_equal(obj, value), msg=msg)
 
+    @_declarative
     def is_eq(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is eq."""
         return self.is_equal(value, msg=msg)
 
+    @_declarative
     def is_not_eq(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not eq."""
         return self.is_not_equal(value, msg=msg)
 
+    @_declarative
     def is_less_than(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is less than."""
-        msg = msg or f"Should be less than {value} (rule: is_less_than)"
+        msg = msg or LazyMessage("Should be less than {value} (rule: is_less_than)", value=value)
         return self.add_validation(
             lambda obj: F.is_less_than(obj, value),
             msg=msg,
         )
 
+    @_declarative
     def is_not_less_than(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not less than."""
-        msg = msg or f"Should not be less than {value} (rule: is_not_less_than)"
+        msg = msg or LazyMessage("Should not be less than {value} (rule: is_not_less_than)", value=value)
         return self.add_validation(lambda obj: F.is_not_less_than(obj, value), msg=msg)
 
+    @_declarative
     def is_lt(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is lt."""
         return self.is_less_than(value, msg=msg)
 
+    @_declarative
     def is_not_lt(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not lt."""
         return self.is_not_less_than(value, msg=msg)
 
+    @_declarative
     def is_less_or_equal(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is less or equal."""
-        msg = msg or f"Should be less than or equal to {value} (rule: is_less_or_equal)"
+        msg = msg or LazyMessage("Should be less than or equal to {value} (rule: is_less_or_equal)", value=value)
         return self.add_validation(
             lambda obj: F.is_less_or_equal(obj, value),
             msg=msg,
         )
 
+    @_declarative
     def is_not_less_or_equal(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not less or equal."""
-        msg = msg or f"Should not be less than or equal to {value} (rule: is_not_less_or_equal)"
+        msg = msg or LazyMessage(
+            "Should not be less than or equal to {value} (rule: is_not_less_or_equal)",
+            value=value,
+        )
         return self.add_validation(lambda obj: F.is_not_less_or_equal(obj, value), msg=msg)
 
+    @_declarative
     def is_lte(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is lte."""
         return self.is_less_or_equal(value, msg=msg)
 
+    @_declarative
     def is_not_lte(self, value: Any, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not lte."""
         return self.is_not_less_or_equal(value, msg=msg)
 
+    @_declarative
     def is_between(
         self,
         lower_bound: Any,
@@ -293,12 +732,18 @@ class ValidatorSpec:
         msg: str | None = None,
     ) -> Self:
         """Add a validation that asserts the object is between."""
-        msg = msg or f"Should be between {lower_bound} and {upper_bound} (closed='{closed}') (rule: is_between)"
+        msg = msg or LazyMessage(
+            "Should be between {lower_bound} and {upper_bound} (closed='{closed}') (rule: is_between)",
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            closed=closed,
+        )
         return self.add_validation(
             lambda obj: F.is_between(obj, lower_bound, upper_bound, closed),
             msg=msg,
         )
 
+    @_declarative
     def is_not_between(
         self,
         lower_bound: Any,
@@ -308,130 +753,373 @@ class ValidatorSpec:
         msg: str | None = None,
     ) -> Self:
         """Add a validation that asserts the object is not between."""
-        msg = msg or f"Should not be between {lower_bound} and {upper_bound} (closed='{closed}') (rule: is_not_between)"
+        msg = msg or LazyMessage(
+            "Should not be between {lower_bound} and {upper_bound} (closed='{closed}') (rule: is_not_between)",
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            closed=closed,
+        )
         return self.add_validation(lambda obj: F.is_not_between(obj, lower_bound, upper_bound, closed), msg=msg)
 
+    @_declarative
     def contains_at_least(self, value: int, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the iterable contains at least ``value`` elements."""
-        msg = msg or f"Should contain at least {value} elements (rule: contains_at_least)"
+        msg = msg or LazyMessage("Should contain at least {value} elements (rule: contains_at_least)", value=value)
         return self.add_validation(lambda obj: F.contains_at_least(obj, value), msg=msg)
 
+    @_declarative
     def contains_at_most(self, value: int, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the iterable contains at most ``value`` elements."""
-        msg = msg or f"Should contain at most {value} elements (rule: contains_at_most)"
+        msg = msg or LazyMessage("Should contain at most {value} elements (rule: contains_at_most)", value=value)
         return self.add_validation(lambda obj: F.contains_at_most(obj, value), msg=msg)
 
+    @_declarative
     def contains_exactly(self, value: int, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the iterable contains exactly ``value`` elements."""
-        msg = msg or f"Should contain exactly {value} elements (rule: contains_exactly)"
+        msg = msg or LazyMessage("Should contain exactly {value} elements (rule: contains_exactly)", value=value)
         return self.add_validation(lambda obj: F.contains_exactly(obj, value), msg=msg)
 
+    @_declarative
     def has_unique_values(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the iterable has unique values."""
         msg = msg or "Should have unique values (rule: has_unique_values)"
-        return self.add_validation(lambda obj: F.has_unique_values(obj), msg=msg)
+        return self.add_validation(F.has_unique_values, msg=msg)
 
+    @_declarative
     def is_empty(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is empty (or None)."""
         msg = msg or "Should be empty (rule: is_empty)"
-        return self.add_validation(lambda obj: F.is_empty(obj), msg=msg)
+        return self.add_validation(F.is_empty, msg=msg)
 
+    @_declarative
     def is_not_empty(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not empty."""
         msg = msg or "Should not be empty (rule: is_not_empty)"
-        return self.add_validation(lambda obj: F.is_not_empty(obj), msg=msg)
+        return self.add_validation(F.is_not_empty, msg=msg)
 
+    @_declarative
     def is_false(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is the boolean False."""
         msg = msg or "Should be False (rule: is_false)"
-        return self.add_validation(lambda obj: F.is_false(obj), msg=msg)
+        return self.add_validation(F.is_false, msg=msg)
 
+    @_declarative
     def is_not_false(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not the boolean False."""
         msg = msg or "Should not be False (rule: is_not_false)"
-        return self.add_validation(lambda obj: F.is_not_false(obj), msg=msg)
+        return self.add_validation(F.is_not_false, msg=msg)
 
+    @_declarative
     def is_true(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is the boolean True."""
         msg = msg or "Should be True (rule: is_true)"
-        return self.add_validation(lambda obj: F.is_true(obj), msg=msg)
+        return self.add_validation(F.is_true, msg=msg)
 
+    @_declarative
     def is_not_true(self, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not the boolean True."""
         msg = msg or "Should not be True (rule: is_not_true)"
-        return self.add_validation(lambda obj: F.is_not_true(obj), msg=msg)
+        return self.add_validation(F.is_not_true, msg=msg)
 
+    @_declarative
     def is_in(self, collection: Iterable, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is in the provided collection."""
-        msg = msg or f"Should be in {collection} (rule: is_in)"
-        return self.add_validation(lambda obj: F.is_in(obj, collection), msg=msg)
+        msg = msg or LazyMessage("Should be in {collection} (rule: is_in)", collection=snapshot(collection))
+        lookup = F.as_lookup(collection)
+        check = _with_literals(lambda obj: F.is_in(obj, lookup), lookup)
+        check.cost = lookup_cost(lookup)
+        return self.add_validation(check, msg=msg)
 
+    @_declarative
     def is_not_in(self, collection: Iterable, *, msg: str | None = None) -> Self:
         """Add a validation that asserts the object is not in the provided collection."""
-        msg = msg or f"Should not be in {collection} (rule: is_not_in)"
-        return self.add_validation(lambda obj: F.is_not_in(obj, collection), msg=msg)
-
-    def _render_pretty(self, node: tuple | None, indent: int = 0, *, is_top_level: bool = True) -> str:
-        """Render the describe tree into a human-friendly string with indentation."""
-        if node is None:
-            return "No validations"
-
-        pad = "    " * indent
-        inner_pad = "    " * (indent + 1)
-        node_type = node[0]
-
-        if node_type == "leaf":
-            return f"{pad}'{node[1]}'"
-
-        if node_type == "and":
-            children = node[1]
-            if len(children) == 1:
-                return self._render_pretty(children[0], indent, is_top_level=is_top_level)
-
-            if is_top_level:
-                parts = []
-                for i, child in enumerate(children):
-                    child_str = self._render_pretty(child, indent, is_top_level=False)
-                    if i > 0:
-                        parts.append(f"{pad}AND {child_str.lstrip()}")
-                    else:
-                        parts.append(child_str)
-                return "\n".join(parts)
-
-            parts = [f"{pad}("]
-            for i, child in enumerate(children):
-                child_str = self._render_pretty(child, indent + 1, is_top_level=False)
-                if i < len(children) - 1:
-                    parts.append(f"{child_str} AND")
-                else:
-                    parts.append(child_str)
-            parts.append(f"{pad})")
-            return "\n".join(parts)
-
-        if node_type == "or":
-            left, right = node[1]
-            parts = [f"{pad}("]
-            parts.append(self._render_pretty(left, indent + 1, is_top_level=False))
-            parts.append(f"{inner_pad}OR")
-            parts.append(self._render_pretty(right, indent + 1, is_top_level=False))
-            parts.append(f"{pad})")
-            return "\n".join(parts)
-
-        if node_type == "not":
-            child_str = self._render_pretty(node[1], indent, is_top_level=False)
-            child_lines = child_str.split("\n")
-            child_lines[0] = f"{pad}not {child_lines[0].lstrip()}"
-            return "\n".join(child_lines)
-
-        return ""
+        msg = msg or LazyMessage("Should not be in {collection} (rule: is_not_in)", collection=snapshot(collection))
+        lookup = F.as_lookup(collection)
+        check = lambda obj: F.is_not_in(obj, lookup)
+        check.cost = lookup_cost(lookup)
+        return self.add_validation(check, msg=msg)
+
+    @_declarative
+    def matches(self, pattern: str | re.Pattern, *, flags: int = 0, msg: str | None = None) -> Self:
+        """Add a validation that asserts the string matches ``pattern`` at its beginning."""
+        compiled = F.compile_pattern(pattern, flags)
+        msg = msg or LazyMessage("Should match {pattern} (rule: matches)", pattern=compiled.pattern)
+        return self.add_validation(_StringRule("match", compiled), msg=msg)
+
+    @_declarative
+    def does_not_match(self, pattern: str | re.Pattern, *, flags: int = 0, msg: str | None = None) -> Self:
+        """Add a validation that asserts the string does not match ``pattern`` at its beginning."""
+        compiled = F.compile_pattern(pattern, flags)
+        msg = msg or LazyMessage("Should not match {pattern} (rule: does_not_match)", pattern=compiled.pattern)
+        return self.add_validation(lambda obj: F.does_not_match(obj, compiled), msg=msg)
+
+    @_declarative
+    def fullmatches(self, pattern: str | re.Pattern, *, flags: int = 0, msg: str | None = None) -> Self:
+        """Add a validation that asserts the whole string matches ``pattern``."""
+        compiled = F.compile_pattern(pattern, flags)
+        msg = msg or LazyMessage("Should fully match {pattern} (rule: fullmatches)", pattern=compiled.pattern)
+        return self.add_validation(_StringRule("fullmatch", compiled), msg=msg)
+
+    @_declarative
+    def does_not_fullmatch(self, pattern: str | re.Pattern, *, flags: int = 0, msg: str | None = None) -> Self:
+        """Add a validation that asserts the whole string does not match ``pattern``."""
+        compiled = F.compile_pattern(pattern, flags)
+        msg = msg or LazyMessage(
+            "Should not fully match {pattern} (rule: does_not_fullmatch)",
+            pattern=compiled.pattern,
+        )
+        return self.add_validation(lambda obj: F.does_not_fullmatch(obj, compiled), msg=msg)
+
+    @_declarative
+    def starts_with(self, prefix: str | tuple[str, ...], *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the string starts with ``prefix``."""
+        msg = msg or LazyMessage("Should start with {prefix} (rule: starts_with)", prefix=prefix)
+        prefixes = prefix if isinstance(prefix, tuple) else (prefix,)
+        return self.add_validation(_StringRule("startswith", prefixes), msg=msg)
+
+    @_declarative
+    def does_not_start_with(self, prefix: str | tuple[str, ...], *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the string does not start with ``prefix``."""
+        msg = msg or LazyMessage("Should not start with {prefix} (rule: does_not_start_with)", prefix=prefix)
+        return self.add_validation(lambda obj: F.does_not_start_with(obj, prefix), msg=msg)
+
+    @_declarative
+    def ends_with(self, suffix: str | tuple[str, ...], *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the string ends with ``suffix``."""
+        msg = msg or LazyMessage("Should end with {suffix} (rule: ends_with)", suffix=suffix)
+        suffixes = suffix if isinstance(suffix, tuple) else (suffix,)
+        return self.add_validation(_StringRule("endswith", suffixes), msg=msg)
+
+    @_declarative
+    def does_not_end_with(self, suffix: str | tuple[str, ...], *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the string does not end with ``suffix``."""
+        msg = msg or LazyMessage("Should not end with {suffix} (rule: does_not_end_with)", suffix=suffix)
+        return self.add_validation(lambda obj: F.does_not_end_with(obj, suffix), msg=msg)
+
+    @_declarative
+    def has_length_between(self, min_length: int, max_length: int, *, msg: str | None = None) -> Self:
+        """Add a validation that asserts ``len(obj)`` is between the bounds (inclusive)."""
+        msg = msg or LazyMessage(
+            "Should have length between {min_length} and {max_length} (rule: has_length_between)",
+            min_length=min_length,
+            max_length=max_length,
+        )
+        return self.add_validation(lambda obj: F.has_length_between(obj, min_length, max_length), msg=msg)
+
+    @_declarative
+    def has_length_not_between(self, min_length: int, max_length: int, *, msg: str | None = None) -> Self:
+        """Add a validation that asserts ``len(obj)`` is not between the bounds (inclusive)."""
+        msg = msg or LazyMessage(
+            "Should not have length between {min_length} and {max_length} (rule: has_length_not_between)",
+            min_length=min_length,
+            max_length=max_length,
+        )
+        return self.add_validation(lambda obj: F.has_length_not_between(obj, min_length, max_length), msg=msg)
+
+    @_declarative
+    def is_in_ranges(
+        self,
+        ranges: Iterable[tuple[Any, Any]],
+        *,
+        closed: Literal["both", "left", "right", "none"] = "both",
+        msg: str | None = None,
+    ) -> Self:
+        """Add a validation that asserts the object lies in any of the ``(lower, upper)`` ranges."""
+        msg = msg or LazyMessage(
+            "Should be in ranges {ranges} (closed='{closed}') (rule: is_in_ranges)",
+            ranges=snapshot(ranges),
+            closed=closed,
+        )
+        intervals = IntervalSet(ranges, closed)
+        return self.add_validation(lambda obj: F.is_in_ranges(obj, intervals), msg=msg)
+
+    @_declarative
+    def is_not_in_ranges(
+        self,
+        ranges: Iterable[tuple[Any, Any]],
+        *,
+        closed: Literal["both", "left", "right", "none"] = "both",
+        msg: str | None = None,
+    ) -> Self:
+        """Add a validation that asserts the object lies in none of the ``(lower, upper)`` ranges."""
+        msg = msg or LazyMessage(
+            "Should not be in ranges {ranges} (closed='{closed}') (rule: is_not_in_ranges)",
+            ranges=snapshot(ranges),
+            closed=closed,
+        )
+        intervals = IntervalSet(ranges, closed)
+        return self.add_validation(lambda obj: F.is_not_in_ranges(obj, intervals), msg=msg)
+
+    @_declarative
+    def contains_any_of(self, keywords: Iterable[str], *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the string contains at least one of ``keywords``."""
+        msg = msg or LazyMessage(
+            "Should contain any of {keywords} (rule: contains_any_of)",
+            keywords=snapshot(keywords),
+        )
+        automaton = KeywordAutomaton(keywords)
+        return self.add_validation(lambda obj: F.contains_any_of(obj, automaton), msg=msg)
+
+    @_declarative
+    def contains_none_of(self, keywords: Iterable[str], *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the string contains none of ``keywords``."""
+        msg = msg or LazyMessage(
+            "Should contain none of {keywords} (rule: contains_none_of)",
+            keywords=snapshot(keywords),
+        )
+        automaton = KeywordAutomaton(keywords)
+        return self.add_validation(lambda obj: F.contains_none_of(obj, automaton), msg=msg)
+
+    @_declarative
+    def schema(
+        self,
+        fields: Mapping[Any, "ValidatorSpec"],
+        *,
+        required: Iterable[Any] | None = None,
+        extra: Literal["forbid", "allow"] = "allow",
+        msg: str | None = None,
+    ) -> Self:
+        """Add a validation that asserts the object is a mapping whose values satisfy ``fields``.
+
+        ``fields`` maps each key to the spec its value must satisfy. ``required`` lists
+        the keys that must be present (default: all of them) and ``extra="forbid"``
+        rejects undeclared keys. Errors report the failing field path.
+
+        Being a combinator of specs, it has no ``is_not_*`` counterpart: negate it with ``~``.
+        """
+        msg = msg or LazyMessage("Should match schema with fields {fields} (rule: schema)", fields=list(fields))
+        return self.add_validation(SchemaRule(fields, required=required, extra=extra), msg=msg)
+
+    @_declarative
+    def each(self, spec: "ValidatorSpec", *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the object is iterable and every item satisfies ``spec``.
+
+        ``each``, ``each_key``, ``each_value`` and ``schema`` nest to any depth: nested
+        levels are walked with an explicit stack instead of recursion. Errors report
+        the index of the failing item.
+
+        Like ``schema``, the ``each*`` combinators have no ``is_not_*`` counterpart: negate them with ``~``.
+        """
+        msg = msg or LazyMessage("Each item should satisfy: {inner} (rule: each)", inner=_inner_message(spec))
+        return self.add_validation(EachRule(spec, "items"), msg=msg)
+
+    @_declarative
+    def each_key(self, spec: "ValidatorSpec", *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the object is a mapping whose keys all satisfy ``spec``."""
+        msg = msg or LazyMessage("Each key should satisfy: {inner} (rule: each_key)", inner=_inner_message(spec))
+        return self.add_validation(EachRule(spec, "keys"), msg=msg)
+
+    @_declarative
+    def each_value(self, spec: "ValidatorSpec", *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the object is a mapping whose values all satisfy ``spec``."""
+        msg = msg or LazyMessage("Each value should satisfy: {inner} (rule: each_value)", inner=_inner_message(spec))
+        return self.add_validation(EachRule(spec, "values"), msg=msg)
+
+    @_declarative
+    def has_valid_fields(self, *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the object is a dataclass instance whose fields pass their specs.
+
+        Field specs come from ``field(metadata={"validator": spec})`` and the
+        :func:`~fluent_validator.dataclass_fields.validated` decorator; they are
+        compiled once per class. Errors report the failing field path.
+        """
+        msg = msg or "Should be a dataclass with valid fields (rule: has_valid_fields)"
+        return self.add_validation(has_valid_fields, msg=msg)
+
+    @_declarative
+    def has_invalid_fields(self, *, msg: str | None = None) -> Self:
+        """Add a validation that asserts the object is a dataclass instance with a field failing its spec."""
+        msg = msg or "Should be a dataclass with invalid fields (rule: has_invalid_fields)"
+        return self.add_validation(has_invalid_fields, msg=msg)
+
+    @staticmethod
+    def _render_pretty(tree: tuple | None) -> str:
+        """Render the describe tree into a human-friendly string with indentation.
+
+        The tree is walked with an explicit stack of frames and literal lines, so very
+        deep trees do not recurse. A frame is ``(node, indent, is_top_level, lead, tail)``:
+        ``lead`` replaces the indentation of the node's first line (``None`` keeps it)
+        and ``tail`` is appended to its last line.
+        """
+        lines: list[str] = []
+        stack: list[tuple | str] = [(tree, 0, True, None, "")]
+        while stack:
+            item = stack.pop()
+            if type(item) is str:
+                lines.append(item)
+                continue
+            node, indent, is_top_level, lead, tail = item
+
+            if node is None:
+                lines.append(f"{lead or ''}No validations{tail}")
+                continue
+
+            pad = "    " * indent
+            node_type = node[0]
+
+            if node_type == "leaf":
+                lines.append(f"{pad if lead is None else lead}'{node[1]}'{tail}")
+            elif node_type == "and" and len(node[1]) == 1:
+                stack.append((node[1][0], indent, is_top_level, lead, tail))
+            elif node_type == "and" and is_top_level:
+                children = node[1]
+                last = len(children) - 1
+                stack.extend(
+                    (child, indent, False, lead if i == 0 else f"{pad}AND ", tail if i == last else "")
+                    for i, child in reversed(list(enumerate(children)))
+                )
+            elif node_type == "and":
+                children = node[1]
+                last = len(children) - 1
+                lines.append(f"{pad if lead is None else lead}(")
+                stack.append(f"{pad}){tail}")
+                stack.extend(
+                    (child, indent + 1, False, None, "" if i == last else " AND")
+                    for i, child in reversed(list(enumerate(children)))
+                )
+            elif node_type == "or":
+                left, right = node[1]
+                lines.append(f"{pad if lead is None else lead}(")
+                stack.append(f"{pad}){tail}")
+                stack.append((right, indent + 1, False, None, ""))
+                stack.append(f"{pad}    OR")
+                stack.append((left, indent + 1, False, None, ""))
+            elif node_type == "not":
+                stack.append((node[1], indent, False, f"{pad if lead is None else lead}not ", tail))
+            else:
+                lines.append(f"{lead or ''}{tail}")
+        return "\n".join(lines)
+
+    def explain(self) -> Plan:
+        """Return the execution plan of this spec; ``str(plan)`` renders it.
+
+        Unlike :meth:`describe`, the plan shows what actually runs: the validations in
+        execution order (after OR fusions and nested-rule compilation), the cost class
+        of each step in the size of the validated value, where evaluation
+        short-circuits and which rewrites were applied. For an :meth:`instrumented`
+        spec each top-level rule also shows its calls, failures and mean time.
+        """
+        return build_plan(self)
 
     def describe(self, pretty: bool = False) -> str:
-        """Return a textual description of the validations; pretty formatting if requested."""
-        if pretty:
-            return self._render_pretty(self._get_describe_tree())
-        if not self._validations:
-            return "No validations"
-        return " AND ".join(msg for _, msg in self._validations)
+        """Return a textual description of the validations; pretty formatting if requested.
+
+        Specs are immutable once built, so the description is computed once per format.
+        """
+        description = self._descriptions.get(pretty)
+        if description is None:
+            if pretty:
+                description = self._render_pretty(self._get_describe_tree())
+            elif not self._validations and not self._stream_rules:
+                description = "No validations"
+            else:
+                description = " AND ".join(str(msg) for _, msg in self._validations + self._stream_rules)
+            self._descriptions[pretty] = description
+        return description
+
+    def _passes(self, obj: Any) -> bool:
+        """Return True if ``obj`` passes every validation."""
+        return all(validation_fn(obj) for validation_fn, _ in self._validations)
 
     def validate(
         self,
@@ -444,21 +1132,121 @@ class ValidatorSpec:
         ] = "raise_after_first_error",
     ) -> bool:
         """Validate the given object using the configured validations and provided strategy; may raise ValidationError."""
-        errors = []
+        if self._cache is not None:
+            if self._cache.lookup(obj, self._passes):
+                return True
+            if strategy == "return_result" and self._events is None:
+                return False
+
+        errors: list[tuple[tuple, Message]] = []
         for validation_fn, msg in self._validations:
-            if not validation_fn(obj):
+            result = validation_fn(obj)
+            if not result:
+                if self._events is not None:
+                    self._events.emit(self._spec_id, msg, None, obj)
+                if strategy == "return_result":
+                    return False
+                failures = explain_failure(validation_fn, msg, obj, result)
                 if strategy == "raise_after_first_error":
-                    raise ValidationError(f"The value {obj!r} failed validation: {msg}")
-                errors.append(msg)
-
-            if strategy == "return_result" and errors:
-                return False
+                    raise ValidationError(
+                        f"The value {format_value(obj)} failed validation: {_format_failures(failures)}",
+                        errors=failures,
+                    )
+                errors.extend(failures)
 
         if strategy == "raise_after_all_errors" and errors:
-            raise ValidationError(f"The value {obj!r} failed validation: {'; '.join(errors)}")
+            raise ValidationError(
+                f"The value {format_value(obj)} failed validation: {_format_failures(errors)}",
+                errors=errors,
+            )
 
         return not errors
 
+    def cached(self, maxsize: int | None = 1024) -> Self:
+        """Return a copy of this spec memoizing validation outcomes in an LRU cache.
+
+        Only values of immutable built-in types (numbers, strings, bytes, dates, enums
+        and tuples/frozensets of them) are cached, keyed with their type so ``1``,
+        ``1.0`` and ``True`` do not share an entry; other values are validated as usual.
+        Failures are still explained in full when raising. Building on the returned
+        spec (``.is_...()``, ``&``, ``|``) yields an uncached spec. An :meth:`instrumented`
+        spec keeps its counters, which then only see the calls missing the cache.
+        """
+        spec = self.from_validations(self.validations(), self._describe_tree, self._stream_rules)
+        spec._cache, spec._stats = ResultCache(maxsize), self._stats
+        spec._events, spec._spec_id = self._events, self._spec_id
+        return spec
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit/miss statistics of a spec created by :meth:`cached`."""
+        if self._cache is None:
+            raise ValueError("This spec is not cached; create one with .cached()")
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Drop the outcomes memoized by a spec created by :meth:`cached`."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def instrumented(self, sample_rate: float = 1.0) -> Self:
+        """Return a copy of this spec recording per-rule calls, failures and time.
+
+        Counters are keyed by each rule's describe message and read with :meth:`stats`.
+        Every call is counted, but only a ``sample_rate`` share of them is timed with
+        ``perf_counter_ns``. Specs that are not instrumented are not affected. A
+        :meth:`cached` spec stays cached, starting with an empty cache.
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}")
+        stats = SpecStats(sample_rate)
+        sample_every = max(1, round(1 / sample_rate))
+        validations = [
+            (ProfiledRule(unwrap(validation_fn), stats._rule(msg), sample_every), msg)
+            for validation_fn, msg in self._validations
+        ]
+        spec = self.from_validations(validations, self._describe_tree, self._stream_rules)
+        spec._cache = None if self._cache is None else ResultCache(self._cache.maxsize)
+        spec._stats = stats
+        spec._events, spec._spec_id = self._events, self._spec_id
+        return spec
+
+    def stats(self) -> SpecStats:
+        """Return the per-rule counters of a spec created by :meth:`instrumented`."""
+        if self._stats is None:
+            raise ValueError("This spec is not instrumented; create one with .instrumented()")
+        return self._stats
+
+    def on_failure(self, events: FailureEvents, *, spec_id: str | None = None) -> Self:
+        """Return a copy of this spec emitting a failure event for every failing rule.
+
+        Events are ``(spec_id, rule, index, value)`` tuples queued in ``events``, a
+        :class:`~fluent_validator.events.FailureEvents` ring buffer delivered to its
+        sinks by a background thread; ``index`` is set by ``validate_each``.
+        """
+        spec = self.from_validations(self.validations(), self._describe_tree, self._stream_rules)
+        spec._cache, spec._stats = self._cache, self._stats
+        spec._events = events
+        spec._spec_id = spec_id if spec_id is not None else f"spec-{id(spec):x}"
+        return spec
+
+    def _without_events(self) -> Self:
+        """Return a shallow copy of this spec not emitting failure events."""
+        spec = copy.copy(self)
+        spec._events = None
+        return spec
+
+    def _emit_item_failures(self, item: Any, index: int, *, first_only: bool) -> None:
+        """Emit the failure events of ``item`` at ``index``, checking its rules again."""
+        for validation_fn, msg in self._validations:
+            if not validation_fn(item):
+                self._events.emit(self._spec_id, msg, index, item)
+                if first_only:
+                    return
+
+    def _start_stream_rules(self) -> list[tuple[Callable[[Any], bool], Message]]:
+        """Return fresh (check, msg) pairs for the stream rules of one validation run."""
+        return [(rule.start(), msg) for rule, msg in self._stream_rules]
+
     def validate_each(
         self,
         iterable: Iterable[Any],
@@ -469,24 +1257,113 @@ class ValidatorSpec:
             "return_result",
         ] = "raise_after_first_error",
     ) -> bool:
-        """Validate each item in an iterable using the configured validations; may raise ValidationError with index info."""
-        errors = []
-        if strategy in ["return_result", "raise_after_first_error"]:
+        """Validate each item in an iterable using the configured validations; may raise ValidationError with index info.
+
+        Error paths are prefixed with the index of the failing item.
+        """
+        if not self._stream_rules and strategy == "return_result" and self._events is None:
             return all(self.validate(item, strategy=strategy) for item in iterable)
 
-        errors = []
+        messages = []
+        errors: list[tuple[tuple, Message]] = []
+        stream_checks = self._start_stream_rules()
+        events = self._events
+        checked = self if events is None else self._without_events()
 
         for index, item in enumerate(iterable):
             try:
-                self.validate(item, strategy=strategy)
+                if not checked.validate(item, strategy=strategy):
+                    if events is not None:
+                        self._emit_item_failures(item, index, first_only=True)
+                    return False
             except ValidationError as e:
-                errors.append(f"Item at index {index} failed validation: {e!r}")
+                if events is not None:
+                    self._emit_item_failures(item, index, first_only=strategy == "raise_after_first_error")
+                item_errors = [((index, *path), msg) for path, msg in e.errors]
+                if strategy == "raise_after_first_error":
+                    raise ValidationError(f"Item at index {index} failed validation: {e}", errors=item_errors) from e
+                messages.append(f"Item at index {index} failed validation: {e}")
+                errors.extend(item_errors)
+                continue
+
+            for check, msg in stream_checks:
+                if check(item):
+                    continue
+                if events is not None:
+                    events.emit(self._spec_id, msg, index, item)
+                if strategy == "return_result":
+                    return False
+                message = (
+                    f"Item at index {index} failed validation: The value {format_value(item)} failed validation: {msg}"
+                )
+                if strategy == "raise_after_first_error":
+                    raise ValidationError(message, errors=[((index,), msg)])
+                messages.append(message)
+                errors.append(((index,), msg))
 
-        if errors:
-            raise ValidationError("; ".join(errors))
+        if messages:
+            raise ValidationError("; ".join(messages), errors=errors)
 
         return True
 
+    def incremental(self, record: Any) -> IncrementalValidation:
+        """Validate ``record`` and return a handle revalidating only the fields that change.
+
+        See :class:`~fluent_validator.incremental.IncrementalValidation`.
+        """
+        return IncrementalValidation(self, record)
+
+    def summarize_each(
+        self,
+        iterable: Iterable[Any],
+        *,
+        max_examples: int = 5,
+        seed: int | None = None,
+    ) -> ValidationReport:
+        """Validate each item and return a :class:`ValidationReport` grouping failures by rule.
+
+        Unlike ``validate_each(strategy="raise_after_all_errors")`` no per-item message is
+        kept: each rule only tracks its failure count, first/last failing index and up to
+        ``max_examples`` sampled examples, so memory does not grow with the input.
+        """
+        report = ValidationReport(max_examples=max_examples, seed=seed)
+        validations = self._validations
+        stream_checks = self._start_stream_rules()
+        total = 0
+
+        for index, item in enumerate(iterable):
+            total += 1
+            failed_rules = [msg for validation_fn, msg in validations if not validation_fn(item)]
+            if not failed_rules:
+                failed_rules = [msg for check, msg in stream_checks if not check(item)]
+            if failed_rules:
+                report._record(index, item, failed_rules)
+
+        report.total = total
+        return report
+
+    def _require_no_stream_rules(self, operation: str) -> None:
+        """Raise ValueError if this spec has stream rules, which only compose with AND."""
+        if self._stream_rules:
+            raise ValueError(f"Stream rules cannot be combined with {operation}; combine them with '&' instead")
+
+    def _merge_string_rules(self, other: "ValidatorSpec") -> _StringRule | None:
+        """Return one rule for ``self | other`` when both are single mergeable string rules."""
+        if len(self._validations) != 1 or len(other._validations) != 1:
+            return None
+        left_fn, right_fn = unwrap(self._validations[0][0]), unwrap(other._validations[0][0])
+        if isinstance(left_fn, _StringRule) and isinstance(right_fn, _StringRule):
+            return left_fn.merge(right_fn)
+        return None
+
+    def _merge_membership_rules(self, other: "ValidatorSpec") -> _MembershipRule | None:
+        """Return one rule for ``self | other`` when both are (equally guarded) equality/membership checks."""
+        left = _MembershipRule.of(self._validations)
+        right = _MembershipRule.of(other._validations) if left is not None else None
+        if right is None:
+            return None
+        return left.merge(right)
+
     def __and__(self, other: "ValidatorSpec") -> Self:
         """Combine this ValidatorSpec with another using logical AND and return a new ValidatorSpec."""
         if not isinstance(other, ValidatorSpec):
@@ -506,38 +1383,54 @@ class ValidatorSpec:
             other_children = list(other_tree[1]) if other_tree[0] == "and" else [other_tree]
             new_tree = ("and", self_children + other_children)
 
-        return self.from_validations(new_validations, _describe_tree=new_tree)
+        return self.from_validations(
+            new_validations,
+            _describe_tree=new_tree,
+            _stream_rules=self._stream_rules + other._stream_rules,
+        )
 
     def __or__(self, other: "ValidatorSpec") -> Self:
         """Combine this ValidatorSpec with another using logical OR and return a new ValidatorSpec."""
         if not isinstance(other, ValidatorSpec):
             return NotImplemented
+        self._require_no_stream_rules("'|'")
+        other._require_no_stream_rules("'|'")
 
         def combined_validation_factory(
-            validations1: list[tuple[Callable[[Any], bool], str]],
-            validations2: list[tuple[Callable[[Any], bool], str]],
+            validations1: list[tuple[Callable[[Any], bool], Message]],
+            validations2: list[tuple[Callable[[Any], bool], Message]],
         ) -> Callable[[Any], bool]:
             def combined_validation(obj: Any) -> bool:
                 return all(validation_fn(obj) for validation_fn, _ in validations1) or all(
                     validation_fn(obj) for validation_fn, _ in validations2
                 )
 
+            combined_validation.branches = (validations1, validations2)  # read by explain()
             return combined_validation
 
-        combined_validation_fn = combined_validation_factory(
+        fused = self._merge_string_rules(other) or self._merge_membership_rules(other)
+        combined_validation_fn = fused or combined_validation_factory(
             self.validations(),
             other.validations(),
         )
-        combined_msg = f"({' and '.join(msg for _, msg in self.validations())}) OR ({' and '.join(msg for _, msg in other.validations())})"
+        combined_msg = LazyMessage(
+            "({left}) OR ({right})",
+            left=LazyMessage.join(" and ", (msg for _, msg in self._validations)),
+            right=LazyMessage.join(" and ", (msg for _, msg in other._validations)),
+        )
 
         self_tree = self._get_describe_tree()
         other_tree = other._get_describe_tree()
+        if fused is not None:
+            # the fused rule replaces the checks of both sides; their leaves need not keep them alive
+            self_tree, other_tree = _without_checks(self_tree), _without_checks(other_tree)
         new_tree = ("or", [self_tree, other_tree])
 
         return self.from_validations([(combined_validation_fn, combined_msg)], _describe_tree=new_tree)
 
     def __invert__(self) -> Self:
         """Return a ValidatorSpec representing the logical negation of this spec."""
+        self._require_no_stream_rules("'~'")
 
         def inverted_factory(validator: Self):
             validator = validator.from_validations(validator.validations())
@@ -545,10 +1438,28 @@ class ValidatorSpec:
             def inverted(obj: Any) -> bool:
                 return not validator.validate(obj, strategy="return_result")
 
-            msg = f"NOT({validator.describe()})"
+            inverted.negated = validator  # read by explain()
+
+            inner = (
+                LazyMessage.join(" AND ", (msg for _, msg in validator._validations))
+                if validator._validations
+                else "No validations"
+            )
+            msg = LazyMessage("NOT({inner})", inner=inner)
             return inverted, msg
 
         current_tree = self._get_describe_tree()
         new_tree = ("not", current_tree)
 
         return self.from_validations([inverted_factory(self)], _describe_tree=new_tree)
+
+    def __reduce__(self) -> tuple:
+        """Pickle the spec as its definition, flattened so that deeply nested specs pickle too."""
+        return spec_from_table, (spec_to_table(self), type(self))
+
+
+def _inner_message(spec: ValidatorSpec) -> Message:
+    """Return the ``A AND B`` description of the validations of a nested ``spec``."""
+    if not spec._validations:
+        return "No validations"
+    return LazyMessage.join(" AND ", (msg for _, msg in spec._validations))
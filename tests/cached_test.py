@@ -0,0 +1,125 @@
+import datetime
+import threading
+from decimal import Decimal
+
+import pytest
+
+from fluent_validator import ValidationError
+from fluent_validator import Validator as vb
+
+
+def counting_spec(calls):
+    def fn(value):
+        calls.append(value)
+        return value in ("BR", "US", 1)
+
+    return vb.add_validation(fn, msg="Should be a known code")
+
+
+def test_cached_memoizes_outcomes():
+    calls = []
+    spec = counting_spec(calls).cached(maxsize=16)
+
+    for _ in range(3):
+        assert spec.validate("BR", strategy="return_result") is True
+        assert spec.validate("XX", strategy="return_result") is False
+
+    assert calls == ["BR", "XX"]
+    info = spec.cache_info()
+    assert (info.hits, info.misses, info.bypassed, info.currsize) == (4, 2, 0, 2)
+
+
+def test_cached_keys_include_the_type():
+    calls = []
+    spec = counting_spec(calls).cached()
+
+    assert spec.validate(1, strategy="return_result") is True
+    assert spec.validate(1.0, strategy="return_result") is True
+    assert spec.validate(True, strategy="return_result") is True
+    assert spec.validate((1, True), strategy="return_result") is False
+    assert spec.validate((True, 1), strategy="return_result") is False
+    assert len(calls) == 5
+
+
+def test_cached_bypasses_unhashable_and_mutable_values():
+    spec = vb.is_iterable().cached()
+
+    assert spec.validate([1], strategy="return_result") is True
+    assert spec.validate({"a": 1}, strategy="return_result") is True
+    assert spec.validate(([1], 2), strategy="return_result") is True
+    assert spec.cache_info().bypassed == 3
+    assert spec.cache_info().currsize == 0
+
+
+def test_cached_evicts_least_recently_used():
+    calls = []
+    spec = counting_spec(calls).cached(maxsize=2)
+
+    spec.validate("BR", strategy="return_result")
+    spec.validate("US", strategy="return_result")
+    spec.validate("BR", strategy="return_result")
+    spec.validate("XX", strategy="return_result")  # evicts "US"
+    spec.validate("BR", strategy="return_result")
+    spec.validate("US", strategy="return_result")
+
+    assert calls == ["BR", "US", "XX", "US"]
+
+
+def test_cached_still_raises_detailed_errors():
+    spec = vb.is_string().is_not_empty().cached()
+
+    assert spec.validate("a") is True
+    for _ in range(2):
+        with pytest.raises(ValidationError, match=r"Should not be empty \(rule: is_not_empty\)"):
+            spec.validate("")
+
+    spec.cache_clear()
+    assert spec.cache_info().currsize == 0
+
+
+def test_cache_info_requires_a_cached_spec():
+    with pytest.raises(ValueError, match="not cached"):
+        vb.is_string().cache_info()
+    assert vb.is_string().cached().is_not_empty()._cache is None
+
+
+def test_cached_keeps_equal_values_rendering_differently_apart():
+    calls = []
+    spec = vb.add_validation(lambda value: calls.append(value) or str(value).startswith("-"), msg="negative").cached()
+
+    assert spec.validate(0.0, strategy="return_result") is False
+    assert spec.validate(-0.0, strategy="return_result") is True
+    assert spec.validate(Decimal(1), strategy="return_result") is False
+    assert spec.validate(Decimal("1.0"), strategy="return_result") is False
+    utc = datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.UTC)
+    spec.validate(utc, strategy="return_result")
+    spec.validate(utc.astimezone(datetime.timezone(datetime.timedelta(hours=1))), strategy="return_result")
+    assert len(calls) == 6
+    assert spec.cache_info().currsize == 6
+
+
+def test_cached_bypasses_nan():
+    spec = vb.is_not_none().cached(maxsize=4)
+
+    for nan in [float("nan"), complex("nan"), Decimal("NaN"), Decimal("sNaN"), (1, float("nan"))] * 3:
+        assert spec.validate(nan, strategy="return_result") is True
+    info = spec.cache_info()
+    assert (info.bypassed, info.currsize) == (15, 0)
+
+
+def test_cached_is_consistent_across_threads():
+    spec = vb.is_number().cached(maxsize=8)
+    values = list(range(32)) * 50
+
+    def run():
+        for value in values:
+            assert spec.validate(value, strategy="return_result") is True
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = spec.cache_info()
+    assert info.hits + info.misses == 8 * len(values)
+    assert info.currsize == 8
@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+
+import pytest
+
+from fluent_validator import ValidationError, validated, validated_field
+from fluent_validator import Validator as vb
+
+
+@validated
+@dataclass
+class Address:
+    city: str = field(metadata={"validator": vb.is_string().has_length_between(1, 50)})
+
+
+@validated(fields={"age": vb.is_instance_of(int).is_greater_or_equal(0)})
+@dataclass
+class Person:
+    name: str = validated_field(vb.is_string().is_not_empty())
+    age: int = 0
+
+
+@dataclass
+class Shipment:
+    address: Address = validated_field(vb.has_valid_fields())
+
+
+@dataclass
+class Plain:
+    value: int = field(metadata={"validator": vb.is_number()})
+
+
+def test_validated_checks_fields_on_init():
+    assert Person("Ada", 36).age == 36
+
+    with pytest.raises(ValidationError) as exc_info:
+        Person("", -1)
+
+    message = str(exc_info.value)
+    assert "name: Should not be empty (rule: is_not_empty)" in message
+    assert "age: " in message
+
+
+def test_validated_compiles_once_per_class():
+    rule = Person.__fluent_validator_rule__
+    Person("Ada", 1)
+    Person("Bob", 2)
+    assert Person.__fluent_validator_rule__ is rule
+
+
+def test_validated_keeps_user_post_init():
+    @validated
+    @dataclass
+    class Slug:
+        text: str = validated_field(vb.is_string().fullmatches(r"[a-z-]+"))
+
+        def __post_init__(self):
+            self.text = self.text.lower()
+
+    assert Slug("Hello-World").text == "hello-world"
+    with pytest.raises(ValidationError):
+        Slug("hello world")
+
+
+def test_validated_calls_inherited_post_init():
+    calls = []
+
+    @dataclass
+    class Base:
+        text: str = validated_field(vb.is_string().is_not_empty())
+
+        def __post_init__(self):
+            calls.append("base")
+            self.text = self.text.strip()
+
+    @validated
+    @dataclass
+    class Child(Base):
+        pass
+
+    assert Child("  hi ").text == "hi"
+    assert calls == ["base"]
+    with pytest.raises(ValidationError):
+        Child("   ")
+
+    @validated
+    @dataclass
+    class GrandChild(Child):
+        count: int = validated_field(vb.is_greater_than(0), default=1)
+
+    calls.clear()
+    assert GrandChild(" a ").text == "a"
+    assert calls == ["base"]
+    with pytest.raises(ValidationError):
+        GrandChild("a", 0)
+
+
+def test_validated_subclass_gets_own_rule():
+    @dataclass
+    class Employee(Person):
+        badge: int = validated_field(vb.is_greater_than(0), default=1)
+
+    Employee("Ada", 1, badge=3)
+    with pytest.raises(ValidationError):
+        Employee("Ada", 1, badge=0)
+    with pytest.raises(ValidationError):
+        Employee("", 1)
+
+
+def test_validated_rejects_unknown_field_names():
+    with pytest.raises(ValueError, match="no dataclass fields"):
+
+        @validated(fields={"missing": vb.is_number()})
+        @dataclass
+        class Broken:
+            value: int = 0
+
+
+def test_has_valid_fields():
+    validator = vb.has_valid_fields()
+
+    assert validator.validate(Plain(1), strategy="return_result") is True
+    assert validator.validate(Plain("x"), strategy="return_result") is False
+    assert validator.validate({"value": 1}, strategy="return_result") is False
+    assert validator.validate(Plain, strategy="return_result") is False
+
+
+def test_has_valid_fields_reports_nested_paths():
+    shipment = Shipment(Address("Lisbon"))
+    shipment.address.city = ""
+    validator = vb.has_valid_fields()
+
+    assert validator.validate(Shipment(Address("Porto")), strategy="return_result") is True
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate(shipment)
+
+    assert "address.city: Should have length between" in str(exc_info.value)
@@ -112,3 +112,22 @@ def test_describe_pretty_not_inside_or():
         ")"
     )
     assert validator.describe(pretty=True) == expected
+
+
+def test_describe_very_deep_or_and_not_chains():
+    validator = vb.is_none()
+    for _ in range(3000):
+        validator = ~(validator | vb.is_number())
+
+    pretty = validator.describe(pretty=True)
+    assert pretty.startswith("not (\n    not (\n")
+    assert pretty.count("OR") == 3000
+    assert validator.describe().startswith("NOT((NOT((")
+
+
+def test_describe_is_computed_once():
+    validator = vb.is_number() | vb.is_string()
+
+    assert validator.describe(pretty=True) is validator.describe(pretty=True)
+    assert validator.describe() is validator.describe()
+    assert validator.describe() != validator.describe(pretty=True)
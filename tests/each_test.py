@@ -0,0 +1,119 @@
+import sys
+
+import pytest
+
+from fluent_validator import ValidationError
+from fluent_validator import Validator as vb
+
+
+def test_each_validates_every_item():
+    validator = vb.each(vb.is_number().is_gt(0))
+
+    assert validator.validate([1, 2, 3], strategy="return_result") is True
+    assert validator.validate([], strategy="return_result") is True
+    assert validator.validate([1, -2, 3], strategy="return_result") is False
+    assert validator.validate(3, strategy="return_result") is False
+
+
+def test_each_key_and_each_value():
+    validator = vb.each_key(vb.is_string()).each_value(vb.is_number())
+
+    assert validator.validate({"a": 1, "b": 2.5}, strategy="return_result") is True
+    assert validator.validate({"a": 1, 2: 2}, strategy="return_result") is False
+    assert validator.validate({"a": "1"}, strategy="return_result") is False
+    assert validator.validate([("a", 1)], strategy="return_result") is False
+
+
+def test_each_nests_with_schema_and_reports_paths():
+    validator = vb.schema({"orders": vb.each(vb.schema({"items": vb.each(vb.schema({"sku": vb.is_string()}))}))})
+    document = {"orders": [{"items": [{"sku": "a"}]}, {"items": [{"sku": "b"}, {"sku": 7}]}]}
+
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate(document)
+
+    assert exc_info.value.paths == [("orders", 1, "items", 1, "sku")]
+    assert "orders[1].items[1].sku: Should be a string (rule: is_string)" in str(exc_info.value)
+
+
+def test_each_value_paths_use_mapping_keys():
+    validator = vb.each_value(vb.each(vb.is_number()))
+
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate({"a": [1, 2], "b": [3, "x"], "c": 5}, strategy="raise_after_all_errors")
+
+    assert exc_info.value.paths == [("b", 1), ("c",)]
+
+
+def test_each_handles_nesting_deeper_than_the_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    validator = vb.is_number()
+    document: object = 1
+    for _ in range(depth):
+        validator = vb.each(validator)
+        document = [document]
+
+    assert validator.validate(document, strategy="return_result") is True
+
+    leaf = document
+    for _ in range(depth - 1):
+        leaf = leaf[0]
+    leaf[0] = "x"
+
+    assert validator.validate(document, strategy="return_result") is False
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate(document)
+    assert exc_info.value.paths == [(0,) * depth]
+
+
+def test_each_rejects_stream_rules():
+    with pytest.raises(ValueError, match="Stream rules"):
+        vb.each(vb.is_unique_in_stream())
+
+
+def test_each_reports_failures_of_one_shot_iterators():
+    validator = vb.each(vb.is_number())
+
+    assert validator.validate((value for value in [1, "a"]), strategy="return_result") is False
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate((value for value in [1, "a", "b"]), strategy="raise_after_all_errors")
+    assert exc_info.value.paths == [(1,)]
+    with pytest.raises(ValidationError) as exc_info:
+        vb.each(vb.each(vb.is_number())).validate(iter([[1], [2, "x", "y"], ["z"]]))
+    assert exc_info.value.paths == [(1, 1), (1, 2)]
+
+
+def test_each_reads_one_shot_iterators_up_to_the_first_failure():
+    consumed = []
+
+    def values():
+        for value in [1, "a", 2, "b"]:
+            consumed.append(value)
+            yield value
+
+    validator = vb.each(vb.is_number())
+
+    assert validator.validate(values(), strategy="return_result") is False
+    assert consumed == [1, "a"]
+
+
+def test_failures_that_cannot_be_explained_report_the_rule():
+    validator = vb.schema({"a": vb.each(vb.schema({"b": vb.is_number()}))})
+
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate({"a": iter([{"b": 1}, {"b": "x"}])}, strategy="raise_after_all_errors")
+    assert exc_info.value.errors == [((), "Should match schema with fields ['a'] (rule: schema)")]
+    with pytest.raises(ValidationError) as exc_info:
+        vb.schema({"a": vb.each(vb.is_number())}).validate({"a": iter([1, "q"])})
+    assert exc_info.value.errors == [((), "Should match schema with fields ['a'] (rule: schema)")]
+
+
+def test_each_negation():
+    validator_positive = vb.each(vb.is_number())
+    validator_negative = ~vb.each(vb.is_number())
+
+    assert validator_positive.validate([1, 2], strategy="return_result") is True
+    assert validator_negative.validate([1, 2], strategy="return_result") is False
+    assert validator_positive.validate([1, "a"], strategy="return_result") is False
+    assert validator_negative.validate([1, "a"], strategy="return_result") is True
+    assert (~vb.each_key(vb.is_string())).validate({1: "a"}, strategy="return_result") is True
+    assert (~vb.each_value(vb.is_string())).validate({1: "a"}, strategy="return_result") is False
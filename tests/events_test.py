@@ -0,0 +1,94 @@
+import json
+import logging
+
+import pytest
+
+from fluent_validator import ValidationError
+from fluent_validator import Validator as vb
+from fluent_validator.events import FailureEvent, FailureEvents, jsonl_sink, logging_sink
+
+NOT_EMPTY = "Should not be empty (rule: is_not_empty)"
+IN_CODES = "Should be in ['ab', 'cd'] (rule: is_in)"
+
+
+def test_on_failure_emits_one_event_per_failing_rule():
+    received: list[FailureEvent] = []
+    with FailureEvents([received.extend]) as events:
+        spec = vb.is_not_empty().is_in(["ab", "cd"]).on_failure(events, spec_id="code")
+        assert spec.validate("ab")
+        assert not spec.validate("xy", strategy="return_result")
+        with pytest.raises(ValidationError):
+            spec.validate("", strategy="raise_after_all_errors")
+
+    assert [(event.spec_id, event.rule, event.index, event.value) for event in received] == [
+        ("code", IN_CODES, None, "'xy'"),
+        ("code", NOT_EMPTY, None, "''"),
+        ("code", IN_CODES, None, "''"),
+    ]
+    assert events.delivered == 3
+
+
+def test_validate_each_events_carry_the_item_index():
+    received: list[FailureEvent] = []
+    with FailureEvents([received.extend]) as events:
+        spec = vb.is_string().on_failure(events, spec_id="names")
+        assert not spec.validate_each(["a", 1, "b", 2], strategy="return_result")
+        with pytest.raises(ValidationError):
+            spec.validate_each(["a", 1, "b", 2], strategy="raise_after_all_errors")
+
+    assert [event.index for event in received] == [1, 1, 3]
+
+
+def test_on_failure_returns_a_copy():
+    with FailureEvents() as events:
+        base = vb.is_string()
+        spec = base.on_failure(events)
+        base.validate(1, strategy="return_result")
+        spec.validate(1, strategy="return_result")
+        assert len(events._buffer) == 1
+        assert spec._spec_id.startswith("spec-")
+
+
+def test_full_buffer_drops_the_oldest_events():
+    events = FailureEvents(capacity=2, flush_interval=60)
+    spec = vb.is_string().on_failure(events)
+    for value in range(5):
+        spec.validate(value, strategy="return_result")
+
+    received: list[FailureEvent] = []
+    events.add_sink(received.extend)
+    events.close()
+
+    assert events.dropped == 3
+    assert [event.value for event in received] == ["3", "4"]
+
+
+def test_sink_errors_are_counted_and_do_not_stop_delivery(caplog):
+    def broken(batch):
+        raise RuntimeError("down")
+
+    received: list[FailureEvent] = []
+    with caplog.at_level(logging.ERROR), FailureEvents([broken, received.extend], batch_size=2) as events:
+        spec = vb.is_string().on_failure(events)
+        for value in range(3):
+            spec.validate(value, strategy="return_result")
+
+    assert events.sink_errors == 2
+    assert len(received) == 3
+    assert "down" in caplog.text
+
+
+def test_jsonl_and_logging_sinks(tmp_path, caplog):
+    path = tmp_path / "failures.jsonl"
+    with caplog.at_level(logging.WARNING), FailureEvents([jsonl_sink(path), logging_sink()]) as events:
+        vb.is_string().on_failure(events, spec_id="s").validate_each(["a", 7], strategy="return_result")
+
+    assert [json.loads(line) for line in path.read_text().splitlines()] == [
+        {"spec_id": "s", "rule": "Should be a string (rule: is_string)", "index": 1, "value": "7"},
+    ]
+    assert "s failed Should be a string (rule: is_string) at index 1: 7" in caplog.text
+
+
+def test_invalid_buffer_settings():
+    with pytest.raises(ValueError, match="positive"):
+        FailureEvents(capacity=0)
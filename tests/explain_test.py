@@ -0,0 +1,124 @@
+from fluent_validator import Validator as vb
+from fluent_validator import field
+
+
+def plan_lines(spec):
+    return str(spec.explain()).splitlines()
+
+
+def test_explain_renders_execution_order_costs_and_short_circuits():
+    spec = vb.is_number().is_in_ranges([(0, 10)]) & ~vb.is_none()
+
+    assert plan_lines(spec) == [
+        'AND [logarithmic] 3 rules -- stops at the first failing rule unless strategy="raise_after_all_errors"',
+        "    [constant] 'Should be a number (rule: is_number)'",
+        "    [logarithmic] 'Should be in ranges [(0, 10)] (closed='both') (rule: is_in_ranges)'",
+        "    NOT [constant] -- inverts the result; the operand stops at its first failing rule",
+        "        [constant] 'Should be None (rule: is_none)'",
+    ]
+
+
+def test_explain_shows_or_branches():
+    spec = vb.is_number().is_gt(0) | vb.is_string()
+
+    root = spec.explain().root
+    (or_node,) = root.children
+    assert or_node.kind == "or"
+    assert [child.kind for child in or_node.children] == ["and", "rule"]
+    assert "stops at the first passing branch" in or_node.notes
+
+
+def test_explain_lists_fusions_as_rewrites():
+    spec = vb.starts_with("a") | vb.starts_with("b") | vb.starts_with("c")
+
+    plan = spec.explain()
+    assert plan.rewrites == ["3 starts_with rules under OR fused into one str.startswith call"]
+    assert plan.root.children[0].notes == ["fused"]
+    assert str(plan).endswith("Rewrites:\n    - 3 starts_with rules under OR fused into one str.startswith call")
+
+
+def test_explain_nested_rules_and_conditions():
+    spec = vb.schema(
+        {"items": vb.each(vb.schema({"n": vb.is_number()})).is_not_empty(), "code": vb.matches("[a-z]+")},
+        required=["items"],
+    ).satisfies(field("items").len().gt(0), field("items").len().lt(10))
+
+    plan = spec.explain()
+    kinds = [(depth, node.kind) for depth, node in plan.nodes()]
+    assert kinds == [
+        (0, "and"),
+        (1, "schema"),
+        (2, "field"),
+        (3, "rule"),
+        (3, "each"),
+        (4, "schema"),
+        (5, "field"),
+        (6, "rule"),
+        (2, "field"),
+        (3, "rule"),
+        (1, "conditions"),
+    ]
+    assert plan.rewrites == [
+        "field 'items': nested rules reordered after the direct checks",
+        "2 conditions share one plan of 6 nodes instead of 8",
+    ]
+    schema = plan.root.children[0]
+    assert schema.cost == "linear"
+    assert schema.children[1].notes == ["optional"]
+
+
+def test_explain_includes_runtime_stats_of_instrumented_specs():
+    spec = vb.is_number().is_gt(0).instrumented()
+    for value in [1, -1, "a"]:
+        spec.validate(value, strategy="return_result")
+
+    number, positive = spec.explain().root.children
+    assert (number.stats.calls, number.stats.failures) == (3, 1)
+    assert (positive.stats.calls, positive.stats.failures) == (2, 1)
+    assert "(calls=3, failures=1, mean=" in number.render()
+
+
+def test_explain_custom_rules_have_unknown_cost():
+    spec = vb.add_validation(lambda obj: obj == 1, msg="Should be one")
+
+    assert plan_lines(spec) == ["AND [unknown] 1 rule", "    [unknown] 'Should be one'"]
+
+
+def test_explain_costs_do_not_depend_on_messages():
+    spec = vb.is_in_ranges([(0, 10)], msg="Out of range").has_unique_values(msg="Duplicates")
+
+    costs = [node.cost for node in spec.explain().root.children]
+    assert costs == ["logarithmic", "linear"]
+
+    nested = vb.schema({"a": vb.matches("a", msg="Bad a")}).each(vb.has_unique_values(msg="Duplicates"))
+    costs = [node.cost for _, node in nested.explain().nodes() if node.kind == "rule"]
+    assert costs == ["linear", "linear"]
+
+
+def test_explain_costs_of_is_in_follow_the_prepared_lookup():
+    def cost(spec):
+        return spec.explain().root.children[0].cost
+
+    assert cost(vb.is_in(["a", "b"])) == "constant"
+    assert cost(vb.is_in(range(10))) == "constant"
+    assert cost(vb.is_in([[1], [2]])) == "logarithmic"
+    assert cost(vb.is_not_in([{1}, {"a"}])) == "linear"
+    assert cost(vb.is_in("abc")) == "linear"
+
+
+def test_explain_deep_trees_without_recursion():
+    spec = vb.is_none()
+    for _ in range(3000):
+        spec = ~spec
+
+    assert len(list(spec.explain().nodes())) == 3002
+
+
+def test_explain_shows_equalities_fused_into_one_lookup():
+    validator = vb.is_string().is_equal("a") | vb.is_string().is_equal("b") | vb.is_string().is_equal("c")
+
+    plan = validator.explain()
+    assert plan.rewrites == [
+        "3 is_equal/is_in rules under OR fused into one frozenset lookup behind one shared type check",
+    ]
+    assert plan.root.children[0].notes == ["fused"]
@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+
+import pytest
+
+from fluent_validator import ValidationError, field
+from fluent_validator import Validator as vb
+from fluent_validator.expressions import ConditionGroup
+
+
+def test_satisfies_compares_fields():
+    validator = vb.satisfies(field("start").lt(field("end")))
+
+    assert validator.validate({"start": 1, "end": 2}, strategy="return_result") is True
+    assert validator.validate({"start": 2, "end": 2}, strategy="return_result") is False
+    assert validator.validate({"start": 1}, strategy="return_result") is False
+
+
+def test_satisfies_works_on_objects():
+    @dataclass
+    class Invoice:
+        total: float
+        items: list
+
+    validator = vb.satisfies(field("total").eq(field("items").sum("price")), field("items").len().gt(0))
+
+    assert validator.validate(Invoice(3, [{"price": 1}, {"price": 2}]), strategy="return_result") is True
+    assert validator.validate(Invoice(4, [{"price": 1}, {"price": 2}]), strategy="return_result") is False
+    assert validator.validate(Invoice(0, []), strategy="return_result") is False
+
+
+def test_satisfies_reads_each_field_once_and_shares_subexpressions():
+    reads = []
+
+    class Record(dict):
+        def get(self, key, default=None):
+            reads.append(key)
+            return super().get(key, default)
+
+    calls = []
+
+    def net(value):
+        calls.append(value)
+        return value * 0.9
+
+    discounted = field("gross").apply(net)
+    validator = vb.satisfies(
+        discounted.le(field("limit")),
+        discounted.gt(0),
+        (field("gross") - field("limit")).lt(100),
+    )
+
+    assert validator.validate(Record(gross=100, limit=200), strategy="return_result") is True
+    assert sorted(reads) == ["gross", "limit"]
+    assert calls == [100]
+
+
+def test_satisfies_reports_each_failing_condition():
+    validator = vb.satisfies(
+        field("start").lt(field("end")),
+        (field("a") + field("b")).eq(10) | field("force"),
+        ~field("end").gt(100),
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate({"start": 5, "end": 1000, "a": 1, "b": 2, "force": False})
+
+    assert [str(msg) for _, msg in exc_info.value.errors] == [
+        "Should satisfy ((a + b) == 10) OR force (rule: satisfies)",
+        "Should satisfy NOT (end > 100) (rule: satisfies)",
+    ]
+
+
+def test_satisfies_skips_conditions_on_fields_failing_their_spec():
+    validator = vb.schema({"start": vb.is_number(), "end": vb.is_number()}).satisfies(field("start").lt(field("end")))
+
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate({"start": "x", "end": 3}, strategy="raise_after_all_errors")
+
+    assert exc_info.value.errors == [(("start",), "Should be a number (rule: is_number)")]
+
+
+def test_satisfies_uses_the_truthiness_of_comparisons():
+    class Version:
+        def __init__(self, number):
+            self.number = number
+
+        def __lt__(self, other):
+            # like numpy.bool_, the result is truthy or falsy but not a bool
+            return int(self.number < other.number)
+
+    validator = vb.satisfies(field("start").lt(field("end")))
+
+    assert validator.validate({"start": Version(1), "end": Version(2)}, strategy="return_result") is True
+    assert validator.validate({"start": Version(2), "end": Version(1)}, strategy="return_result") is False
+    group = ConditionGroup([(field("start").lt(field("end")), "msg")])
+    assert group.failures({"start": Version(1), "end": Version(2)}) == []
+    assert group.failures({"start": Version(2), "end": Version(1)}) == [(None, "msg")]
+
+
+def test_satisfies_custom_message():
+    validator = vb.satisfies(field("start").lt(field("end")), msg="Invalid period")
+
+    with pytest.raises(ValidationError, match="Invalid period"):
+        validator.validate({"start": 2, "end": 1})
+
+
+def test_conditions_refuse_truth_testing():
+    with pytest.raises(TypeError):
+        bool(field("a").lt(field("b")))
+    with pytest.raises(TypeError, match="condition"):
+        ConditionGroup([(field("a") + 1, "msg")])
+
+
+def test_satisfies_with_incremental_validation():
+    spec = vb.schema({"start": vb.is_number(), "end": vb.is_number()}).satisfies(field("start").lt(field("end")))
+    handle = spec.incremental({"start": 1, "end": 2})
+
+    assert handle.update(end=0) is False
+    assert handle.errors == [((), "Should satisfy start < end (rule: satisfies)")]
+    assert handle.update(start=-1) is True
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+
+from fluent_validator import Validator as vb
+from fluent_validator import validated_field
+
+
+class CountingSpec:
+    """Build field specs recording which fields were checked."""
+
+    def __init__(self):
+        self.calls = []
+
+    def check(self, name):
+        def fn(value):
+            self.calls.append(name)
+            return isinstance(value, int)
+
+        return vb.add_validation(fn, msg=f"{name} should be an int")
+
+
+def test_incremental_rechecks_only_changed_fields():
+    counter = CountingSpec()
+    spec = vb.schema({f"f{i}": counter.check(f"f{i}") for i in range(300)})
+    record = {f"f{i}": i for i in range(300)}
+
+    handle = spec.incremental(record)
+    assert handle.ok is True
+    assert len(counter.calls) == 300
+
+    counter.calls.clear()
+    assert handle.update(f7="x") is False
+    assert set(counter.calls) == {"f7"}
+    assert handle.errors == [(("f7",), "f7 should be an int")]
+    assert record["f7"] == "x"
+
+    assert handle.update({"f7": 7}) is True
+    assert handle.errors == []
+
+
+def test_incremental_cross_field_rules_follow_their_fields():
+    spec = vb.schema(
+        {"start": vb.is_number(), "end": vb.is_number(), "note": vb.is_string()},
+    ).add_cross_field_validation(["start", "end"], lambda start, end: start < end, msg="start should precede end")
+    handle = spec.incremental({"start": 1, "end": 5, "note": ""})
+    assert handle.ok is True
+
+    assert handle.update(end=0) is False
+    assert handle.errors == [((), "start should precede end")]
+
+    # a failing field suspends the cross-field rules reading it
+    assert handle.update(end="x") is False
+    assert handle.errors == [(("end",), "Should be a number (rule: is_number)")]
+
+    assert handle.update(end=9) is True
+
+
+def test_incremental_tracks_missing_and_extra_keys():
+    spec = vb.schema({"id": vb.is_number(), "name": vb.is_string()}, required=["id"], extra="forbid")
+    record = {"id": 1, "name": "a"}
+    handle = spec.incremental(record)
+
+    del record["id"]
+    record["other"] = 1
+    handle.mark_changed("id", "other")
+    assert handle.revalidate() is False
+    assert handle.errors == [
+        (("id",), "Missing required field (rule: schema)"),
+        (("other",), "Unexpected field (rule: schema)"),
+    ]
+
+
+def test_incremental_dataclass_records():
+    @dataclass
+    class Interval:
+        low: int = validated_field(vb.is_number())
+        high: int = validated_field(vb.is_number())
+
+    spec = vb.has_valid_fields().add_cross_field_validation(["low", "high"], lambda low, high: low <= high)
+    interval = Interval(1, 2)
+    handle = spec.incremental(interval)
+
+    assert handle.update(high=0) is False
+    assert interval.high == 0
+    assert str(handle.errors[0][1]) == "Fields ['low', 'high'] should satisfy <lambda> (rule: cross_field)"
+    assert handle.update(low=None) is False
+    assert handle.field_errors("low") == [(("low",), "Should be a number (rule: is_number)")]
@@ -0,0 +1,93 @@
+import pytest
+
+from fluent_validator import ValidationError
+from fluent_validator import Validator as vb
+from fluent_validator.messages import MAX_PARAM_ITEMS, MAX_PARAM_LENGTH, LazyMessage, format_value
+
+
+class CountingStr:
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "counted"
+
+
+def test_messages_are_rendered_lazily_and_cached():
+    value = CountingStr()
+    validator = vb.is_equal(value)
+
+    assert value.calls == 0
+    assert validator.validate(value, strategy="return_result") is True
+    assert value.calls == 0
+
+    assert validator.describe() == "Should be equal to counted (rule: is_equal)"
+    assert validator.describe(pretty=True) == "'Should be equal to counted (rule: is_equal)'"
+    assert value.calls == 1
+
+
+def test_long_collection_params_are_truncated():
+    validator = vb.is_in(list(range(1_000_000)))
+
+    description = validator.describe()
+    assert description.startswith("Should be in [0, 1, 2,")
+    assert description.endswith("...] (rule: is_in)")
+    assert len(description) < MAX_PARAM_LENGTH + 50
+
+
+def test_short_params_render_like_str():
+    assert vb.is_in(["a", "b"]).describe() == "Should be in ['a', 'b'] (rule: is_in)"
+    assert vb.is_equal("x" * (MAX_PARAM_LENGTH + 10)).describe().count("x") == MAX_PARAM_LENGTH - 3
+
+
+def test_lazy_message_behaves_like_str():
+    message = LazyMessage("Should be {value}", value=1)
+
+    assert message == "Should be 1"
+    assert hash(message) == hash("Should be 1")
+    assert f"{message}!" == "Should be 1!"
+    assert LazyMessage.join(" and ", ["a", message]) == "a and Should be 1"
+
+
+def test_error_messages_are_rendered_on_failure():
+    validator = (vb.is_greater_than(5) | vb.is_none()) & ~vb.is_equal(7)
+
+    with pytest.raises(ValidationError, match=r"\(Should be greater than 5 \(rule: is_greater_than\)\) OR"):
+        validator.validate(1)
+    with pytest.raises(ValidationError, match=r"NOT\(Should be equal to 7 \(rule: is_equal\)\)"):
+        validator.validate(7, strategy="raise_after_all_errors")
+
+
+def test_deeply_nested_messages_render_without_recursion():
+    msg = LazyMessage("leaf")
+    for _ in range(10_000):
+        msg = LazyMessage("NOT({inner})", inner=LazyMessage.join(" AND ", [msg, "x"]))
+
+    assert str(msg) == "NOT(" * 10_000 + "leaf" + " AND x)" * 10_000
+
+
+def test_collection_params_are_snapshotted_at_build_time():
+    allowed = ["a", "b"]
+    validator = vb.is_in(allowed)
+    allowed.append("zzz")
+
+    assert validator.validate("zzz", strategy="return_result") is False
+    assert validator.describe() == "Should be in ['a', 'b'] (rule: is_in)"
+
+
+def test_large_collection_params_keep_only_the_shown_items():
+    validator = vb.is_in(list(range(1_000_000)))
+
+    ((_, msg),) = validator.validations()
+    assert len(msg._params["collection"]) == MAX_PARAM_ITEMS + 1
+    assert validator.describe() == f"Should be in {list(range(MAX_PARAM_ITEMS))}"[:-1] + ", ...] (rule: is_in)"
+
+
+def test_large_values_keep_their_order_when_abbreviated():
+    keys = [f"k{i}" for i in reversed(range(MAX_PARAM_ITEMS * 2))]
+    with pytest.raises(ValidationError) as exc_info:
+        vb.is_none().validate(dict.fromkeys(keys, 0))
+    assert f"{{'k{MAX_PARAM_ITEMS * 2 - 1}': 0, 'k{MAX_PARAM_ITEMS * 2 - 2}': 0," in str(exc_info.value)
+    assert format_value({3, 1, 2}) == repr({3, 1, 2})
+    assert format_value(frozenset(range(MAX_PARAM_ITEMS + 5))).endswith(", ...})")
@@ -0,0 +1,89 @@
+import pytest
+
+from fluent_validator import ValidationError, field
+from fluent_validator import Validator as vb
+
+
+def test_instrumented_counts_calls_and_failures_per_rule():
+    spec = vb.is_number().is_greater_than(0).instrumented()
+
+    for value in [1, 2, -1, "a"]:
+        spec.validate(value, strategy="return_result")
+
+    stats = spec.stats()
+    number = stats.rules["Should be a number (rule: is_number)"]
+    positive = stats.rules["Should be greater than 0 (rule: is_greater_than)"]
+    assert (number.calls, number.failures) == (4, 1)
+    assert (positive.calls, positive.failures) == (3, 1)
+    assert number.sampled_calls == 4
+    assert number.sampled_time_ns > 0
+
+
+def test_instrumented_sampling_times_a_share_of_the_calls():
+    spec = vb.is_number().instrumented(sample_rate=0.25)
+
+    for value in range(100):
+        spec.validate(value, strategy="return_result")
+
+    rule = spec.stats().rules["Should be a number (rule: is_number)"]
+    assert rule.calls == 100
+    assert rule.sampled_calls == 25
+    assert rule.estimated_time_ns == pytest.approx(rule.sampled_time_ns * 4)
+
+
+def test_stats_flat_dict_export_and_reset():
+    spec = vb.is_string().instrumented()
+    spec.validate(1, strategy="return_result")
+
+    exported = spec.stats().to_dict()
+    assert exported["Should be a string (rule: is_string).calls"] == 1
+    assert exported["Should be a string (rule: is_string).failures"] == 1
+    assert set(exported) == {
+        f"Should be a string (rule: is_string).{name}"
+        for name in ("calls", "failures", "sampled_calls", "sampled_time_ns", "estimated_time_ns")
+    }
+
+    spec.stats().reset()
+    assert spec.stats().to_dict()["Should be a string (rule: is_string).calls"] == 0
+    assert "1 calls" not in spec.stats().describe()
+
+
+def test_instrumented_keeps_failure_details():
+    spec = vb.schema({"id": vb.is_number()}).instrumented()
+
+    with pytest.raises(ValidationError, match=r"id: Should be a number"):
+        spec.validate({"id": "x"})
+
+
+def test_stats_requires_an_instrumented_spec():
+    with pytest.raises(ValueError, match="not instrumented"):
+        vb.is_number().stats()
+    with pytest.raises(ValueError, match="sample_rate"):
+        vb.is_number().instrumented(sample_rate=0)
+
+
+def test_instrumented_specs_keep_or_fusions_and_explanations():
+    fused = vb.is_equal("a").instrumented() | vb.is_in(["b", "c"]).instrumented()
+    assert fused.explain().rewrites == ["2 is_equal/is_in rules under OR fused into one frozenset lookup"]
+    strings = vb.starts_with("a").instrumented() | vb.starts_with("b").instrumented()
+    assert len(strings.explain().rewrites) == 1
+
+    spec = vb.schema({"start": vb.is_number(), "end": vb.is_number()}).instrumented()
+    spec = spec.satisfies(field("start").lt(field("end"))).instrumented()
+    with pytest.raises(ValidationError) as exc_info:
+        spec.validate({"start": "x", "end": 1}, strategy="raise_after_all_errors")
+    assert exc_info.value.paths == [("start",)]
+
+
+def test_cached_and_instrumented_combine_in_any_order():
+    spec = vb.is_number().instrumented().cached()
+    for _ in range(3):
+        spec.validate(1, strategy="return_result")
+    assert spec.stats().rules["Should be a number (rule: is_number)"].calls == 1
+    assert spec.cache_info().hits == 2
+
+    spec = vb.is_number().cached().instrumented().instrumented()
+    for _ in range(3):
+        spec.validate(1, strategy="return_result")
+    assert spec.stats().rules["Should be a number (rule: is_number)"].calls == 1
+    assert (spec.cache_info().hits, spec.cache_info().misses) == (2, 1)
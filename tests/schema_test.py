@@ -0,0 +1,94 @@
+import pytest
+
+from fluent_validator import ValidationError
+from fluent_validator import Validator as vb
+
+user_spec = vb.schema(
+    {
+        "id": vb.is_instance_of(int).is_greater_than(0),
+        "email": vb.is_string().matches(r"[^@]+@[^@]+"),
+        "nickname": vb.is_string(),
+    },
+    required=["id", "email"],
+)
+
+
+def test_schema_valid_records():
+    assert user_spec.validate({"id": 1, "email": "a@b"}, strategy="return_result") is True
+    assert user_spec.validate({"id": 1, "email": "a@b", "nickname": "x", "other": 1}, strategy="return_result") is True
+
+
+def test_schema_invalid_records():
+    assert user_spec.validate({"id": 0, "email": "a@b"}, strategy="return_result") is False
+    assert user_spec.validate({"email": "a@b"}, strategy="return_result") is False
+    assert user_spec.validate({"id": 1, "email": "a@b", "nickname": 3}, strategy="return_result") is False
+    assert user_spec.validate([("id", 1)], strategy="return_result") is False
+
+
+def test_schema_negation():
+    validator_positive = user_spec
+    validator_negative = ~user_spec
+
+    assert validator_positive.validate({"id": 1, "email": "a@b"}, strategy="return_result") is True
+    assert validator_negative.validate({"id": 1, "email": "a@b"}, strategy="return_result") is False
+    assert validator_positive.validate({"id": 0, "email": "a@b"}, strategy="return_result") is False
+    assert validator_negative.validate({"id": 0, "email": "a@b"}, strategy="return_result") is True
+    assert validator_negative.validate(None, strategy="return_result") is True
+
+
+def test_schema_errors_report_field_paths():
+    with pytest.raises(ValidationError) as exc_info:
+        user_spec.validate({"email": 3, "nickname": None})
+
+    message = str(exc_info.value)
+    assert "id: Missing required field (rule: schema)" in message
+    assert "email: Should be a string (rule: is_string)" in message
+    assert "nickname: Should be a string (rule: is_string)" in message
+
+
+def test_schema_extra_forbid():
+    validator = vb.schema({"id": vb.is_number()}, extra="forbid")
+
+    assert validator.validate({"id": 1}, strategy="return_result") is True
+    assert validator.validate({"id": 1, "x": 2}, strategy="return_result") is False
+    with pytest.raises(ValidationError, match=r"x: Unexpected field \(rule: schema\)"):
+        validator.validate({"id": 1, "x": 2})
+
+
+def test_nested_schema_errors_use_full_path():
+    validator = vb.schema({"customer": vb.schema({"address": vb.schema({"city": vb.is_string()})})})
+
+    assert validator.validate({"customer": {"address": {"city": "X"}}}, strategy="return_result") is True
+    with pytest.raises(ValidationError, match=r"customer\.address\.city: Should be a string"):
+        validator.validate({"customer": {"address": {"city": 1}}}, strategy="raise_after_all_errors")
+
+
+def test_schema_invalid_arguments():
+    with pytest.raises(ValueError, match="extra"):
+        vb.schema({"id": vb.is_number()}, extra="ignore")
+    with pytest.raises(ValueError, match="Required keys"):
+        vb.schema({"id": vb.is_number()}, required=["other"])
+
+
+def test_schema_errors_carry_structured_paths():
+    validator = vb.schema({"orders": vb.schema({"sku": vb.is_string(), "qty": vb.is_gt(0)})})
+
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate({"orders": {"sku": 1, "qty": 0}}, strategy="raise_after_all_errors")
+
+    assert exc_info.value.paths == [("orders", "sku"), ("orders", "qty")]
+    assert str(exc_info.value.errors[0][1]) == "Should be a string (rule: is_string)"
+
+
+def test_validate_each_prefixes_paths_with_the_item_index():
+    with pytest.raises(ValidationError) as exc_info:
+        user_spec.validate_each([{"id": 1, "email": "a@b"}, {"id": 2, "email": 3}])
+
+    assert exc_info.value.paths == [(1, "email"), (1, "email")]
+    assert str(exc_info.value).startswith("Item at index 1 failed validation: ")
+
+    with pytest.raises(ValidationError) as exc_info:
+        vb.is_number().validate_each([1, "a", 2, "b"], strategy="raise_after_all_errors")
+
+    assert exc_info.value.paths == [(1,), (3,)]
+    assert "ValidationError(" not in str(exc_info.value)
@@ -0,0 +1,184 @@
+import datetime
+import json
+import pickle
+import re
+from dataclasses import dataclass
+
+import pytest
+
+from fluent_validator import ValidationError, ValidatorSpec, field
+from fluent_validator import Validator as vb
+from fluent_validator.serialization import register
+
+
+def roundtrip(spec):
+    return ValidatorSpec.from_dict(json.loads(json.dumps(spec.to_dict())))
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        vb.is_number().is_between(0, 10, closed="left").is_not_equal(5),
+        vb.is_string().matches(r"^[a-z]+$", flags=re.IGNORECASE).has_length_between(1, 3),
+        vb.starts_with(("a", "b")) | vb.ends_with("z"),
+        ~(vb.is_in(range(10)) | vb.is_in(("x", "y"))) & vb.is_not_in({"q"}),
+        vb.is_in_ranges([(0, 1), (5, 6)], closed="none").is_instance_of((int, float)),
+        vb.contains_any_of(["foo", "bar"]),
+        vb.is_string(msg="custom message"),
+    ],
+)
+def test_roundtrip_preserves_behavior_and_description(spec):
+    loaded = roundtrip(spec)
+
+    assert loaded.describe() == spec.describe()
+    assert loaded.describe(pretty=True) == spec.describe(pretty=True)
+    assert str(loaded.explain()) == str(spec.explain())
+    for value in [None, 0, 1, 5, 9.5, 10, "a", "abc", "Abc", "xyz", "z", "foo bar", "q", "x"]:
+        assert loaded.validate(value, strategy="return_result") == spec.validate(value, strategy="return_result")
+
+
+def test_roundtrip_nested_specs_and_conditions():
+    spec = vb.schema(
+        {"id": vb.is_gt(0), "tags": vb.each(vb.is_string()), "meta": vb.each_value(vb.is_number())},
+        required=["id"],
+        extra="forbid",
+    ).satisfies(field("tags").len().le(field("id")))
+
+    loaded = roundtrip(spec)
+
+    assert loaded.describe() == spec.describe()
+    assert loaded.validate({"id": 2, "tags": ["a"], "meta": {"w": 1}})
+    with pytest.raises(ValidationError) as error:
+        loaded.validate({"id": 1, "tags": ["a", 2]}, strategy="raise_after_all_errors")
+    assert error.value.paths == [("tags", 1)]
+
+
+def test_to_dict_is_plain_json():
+    data = (vb.is_in(("a", "b")) | ~vb.is_none()).to_dict()
+
+    assert data == {
+        "version": 1,
+        "spec": {
+            "or": [
+                {"rule": "is_in", "args": [{"$tuple": ["a", "b"]}]},
+                {"not": {"rule": "is_none"}},
+            ],
+        },
+    }
+
+
+def test_pickle_roundtrip():
+    spec = vb.is_string().is_not_empty() | vb.is_number().is_gte(0)
+
+    loaded = pickle.loads(pickle.dumps(spec))  # noqa: S301 - trusted data
+
+    assert isinstance(loaded, ValidatorSpec)
+    assert loaded.describe() == spec.describe()
+    assert loaded.validate("a")
+    assert not loaded.validate(-1, strategy="return_result")
+
+
+def test_roundtrips_use_the_arguments_as_they_were_at_build_time():
+    codes = ["a", "b"]
+    pairs = [["x", 1]]
+    spec = vb.is_in(codes) | vb.is_in(pairs)
+    codes.append("zzz")
+    pairs[0].append(2)
+
+    assert spec.to_dict()["spec"]["or"] == [
+        {"rule": "is_in", "args": [["a", "b"]]},
+        {"rule": "is_in", "args": [[["x", 1]]]},
+    ]
+    for loaded in (roundtrip(spec), pickle.loads(pickle.dumps(spec))):  # noqa: S301 - trusted data
+        for value in ("a", "zzz", ["x", 1], ["x", 1, 2]):
+            assert loaded.validate(value, strategy="return_result") is spec.validate(value, strategy="return_result")
+    assert spec.validate("zzz", strategy="return_result") is False
+    assert spec.validate(["x", 1], strategy="return_result") is True
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+@dataclass
+class Point:
+    x: int
+
+
+def test_registered_predicates_and_types():
+    register(is_even, name="tests.is_even")
+    register(Point, name="tests.Point")
+    spec = vb.is_instance_of(Point) | vb.add_validation(is_even, msg="Should be even")
+
+    data = spec.to_dict()
+    loaded = ValidatorSpec.from_dict(data)
+
+    assert data["spec"]["or"][1] == {
+        "rule": "add_validation",
+        "args": [{"$ref": "tests.is_even"}],
+        "kwargs": {"msg": "Should be even"},
+    }
+    assert loaded.validate(Point(1))
+    assert loaded.validate(4)
+    assert not loaded.validate(3, strategy="return_result")
+
+
+def test_unregistered_callables_are_rejected():
+    spec = vb.add_validation(lambda value: value == 1, msg="Should be one")
+
+    with pytest.raises(TypeError, match=r"Cannot serialize rule 'Should be one'.*register"):
+        spec.to_dict()
+    with pytest.raises(TypeError):
+        pickle.dumps(spec)
+
+
+def test_from_dict_rejects_unknown_rules_and_versions():
+    with pytest.raises(ValueError, match="Unknown rule 'validate'"):
+        ValidatorSpec.from_dict({"version": 1, "spec": {"rule": "validate", "args": [1]}})
+    with pytest.raises(ValueError, match="version"):
+        ValidatorSpec.from_dict({"version": 99, "spec": {"and": []}})
+    with pytest.raises(ValueError, match="not registered"):
+        ValidatorSpec.from_dict({"version": 1, "spec": {"rule": "is_instance_of", "args": [{"$ref": "nope"}]}})
+
+
+def test_roundtrip_bytes_and_times():
+    opening = datetime.time(9, 30, tzinfo=datetime.UTC)
+    spec = vb.is_in([b"a", b"\xff"]) | vb.is_between(opening, datetime.time(17, tzinfo=datetime.UTC))
+
+    data = json.loads(json.dumps(spec.to_dict()))
+    loaded = ValidatorSpec.from_dict(data)
+
+    assert data["spec"]["or"][0]["args"] == [[{"$bytes": "YQ=="}, {"$bytes": "/w=="}]]
+    assert data["spec"]["or"][1]["args"][0] == {"$time": "09:30:00+00:00"}
+    assert loaded.describe() == spec.describe()
+    assert loaded.validate(b"\xff")
+    assert loaded.validate(datetime.time(12, tzinfo=datetime.UTC))
+    assert loaded.validate(datetime.time(8, tzinfo=datetime.UTC), strategy="return_result") is False
+
+
+def test_deeply_nested_specs_roundtrip_without_recursion():
+    spec = vb.is_string()
+    for depth in range(3000):
+        spec = vb.each(spec) if depth % 2 else vb.schema({"a": spec})
+
+    loaded = ValidatorSpec.from_dict(spec.to_dict())
+    unpickled = pickle.loads(pickle.dumps(spec))  # noqa: S301 - trusted data
+
+    assert loaded.describe() == unpickled.describe() == spec.describe()
+    value = "x"
+    for depth in range(3000):
+        value = [value] if depth % 2 else {"a": value}
+    assert loaded.validate(value)
+    assert unpickled.validate(value)
+
+
+def test_long_or_chains_pickle_without_recursion():
+    spec = vb.is_string().is_equal("0")
+    for value in range(1, 2000):
+        spec = spec | vb.is_string().is_equal(str(value))
+
+    loaded = pickle.loads(pickle.dumps(spec))  # noqa: S301 - trusted data
+
+    assert loaded.describe() == spec.describe()
+    assert loaded.validate("1999")
+    assert not loaded.validate(1999, strategy="return_result")
@@ -0,0 +1,82 @@
+import logging
+
+import pytest
+
+from fluent_validator import Validator as vb
+from fluent_validator import spec_cache
+from fluent_validator.spec_cache import SpecCache, definitions_key
+
+
+def definitions():
+    tags = vb.each(vb.is_string().is_not_empty())
+    return {
+        "user": vb.schema({"id": vb.is_gt(0), "tags": tags}).to_dict(),
+        "group": vb.schema({"name": vb.is_string(), "tags": tags}).to_dict(),
+        "code": (vb.starts_with("a") | vb.is_in(range(3))).to_dict(),
+        "code_copy": (vb.starts_with("a") | vb.is_in(range(3))).to_dict(),
+    }
+
+
+def test_load_prepares_once_then_reads_the_cache(tmp_path, monkeypatch):
+    cache = SpecCache(tmp_path)
+    data = definitions()
+
+    first = cache.load(data)
+    assert cache.path(definitions_key(data)).exists()
+
+    monkeypatch.setattr(spec_cache, "prepare", pytest.fail)
+    second = cache.load(data)
+
+    assert first.keys() == second.keys() == data.keys()
+    for name, spec in second.items():
+        assert spec.describe() == first[name].describe()
+        assert spec.to_dict() == data[name]
+    assert second["user"].validate({"id": 1, "tags": ["a"]})
+    assert not second["group"].validate({"name": "g", "tags": [""]}, strategy="return_result")
+
+
+def test_identical_specs_are_built_once(tmp_path):
+    table, names = spec_cache.prepare(definitions())
+
+    assert names["code"] == names["code_copy"]
+    # id, tags item, tags, user, name, group and code: the shared specs are stored once
+    assert len(table) == 7
+
+    specs = SpecCache(tmp_path).load(definitions())
+    assert specs["code"] is specs["code_copy"]
+
+
+def test_corrupted_files_are_rebuilt(tmp_path, caplog):
+    cache = SpecCache(tmp_path)
+    data = definitions()
+    cache.load(data)
+    path = cache.path(definitions_key(data))
+    path.write_bytes(path.read_bytes()[:-1] + b"x")
+
+    with caplog.at_level(logging.WARNING):
+        specs = cache.load(data)
+
+    assert "corrupted" in caplog.text
+    assert specs["code"].validate("abc")
+    assert cache._read(definitions_key(data)) is not None
+
+
+def test_key_depends_on_the_content():
+    data = definitions()
+    changed = {**data, "code": vb.starts_with("b").to_dict()}
+
+    assert definitions_key(data) == definitions_key(dict(reversed(data.items())))
+    assert definitions_key(data) != definitions_key(changed)
+
+
+def test_deeply_nested_definitions_are_cached(tmp_path):
+    spec = vb.is_number()
+    for _ in range(3000):
+        spec = vb.each(spec)
+    definitions = {"deep": spec.to_dict()}
+
+    first = SpecCache(tmp_path).load(definitions)
+    second = SpecCache(tmp_path).load(definitions)
+
+    assert first["deep"].describe() == second["deep"].describe() == spec.describe()
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,94 @@
+from operator import itemgetter
+
+import pytest
+
+from fluent_validator import ValidationError
+from fluent_validator import Validator as vb
+from fluent_validator.stream import BloomFilter
+
+
+def test_is_unique_in_stream_exact():
+    validator = vb.is_instance_of(dict).is_unique_in_stream(itemgetter("id"))
+    rows = [{"id": 1}, {"id": 2}, {"id": 1}, {"id": 3}]
+
+    assert validator.validate_each(rows[:2], strategy="return_result") is True
+    assert validator.validate_each(rows, strategy="return_result") is False
+    # state is reset between runs
+    assert validator.validate_each(rows[:2], strategy="return_result") is True
+
+    with pytest.raises(ValidationError, match="at index 2 failed validation"):
+        validator.validate_each(rows)
+
+
+def test_is_unique_in_stream_collects_all_duplicates():
+    validator = vb.is_unique_in_stream()
+
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate_each([1, 2, 1, 2, 3], strategy="raise_after_all_errors")
+
+    message = str(exc_info.value)
+    assert "Item at index 2" in message
+    assert "Item at index 3" in message
+    assert "Item at index 4" not in message
+
+
+def test_is_unique_in_stream_skips_invalid_items():
+    validator = vb.is_number().is_unique_in_stream()
+
+    report = validator.summarize_each([1, "a", "a", 2, 1])
+
+    summaries = {str(rule): summary for rule, summary in report.rules.items()}
+    assert summaries["Should be a number (rule: is_number)"].count == 2
+    duplicates = summaries["Should be unique across all items (rule: is_unique_in_stream)"]
+    assert (duplicates.count, duplicates.first_index) == (1, 4)
+
+
+def test_is_unique_in_stream_approximate():
+    validator = vb.is_unique_in_stream(approximate=True, expected_items=1000, false_positive_rate=1e-6)
+
+    assert validator.validate_each(range(500), strategy="return_result") is True
+    assert validator.validate_each([*range(500), 7], strategy="return_result") is False
+    assert validator.validate_each([[1], [2], [1]], strategy="return_result") is False
+
+
+class Point:
+    def __init__(self, x):
+        self.x = x
+
+    def __eq__(self, other):
+        return isinstance(other, Point) and other.x == self.x
+
+    __hash__ = None
+
+
+@pytest.mark.parametrize("approximate", [False, True])
+def test_is_unique_in_stream_compares_unfreezable_keys(approximate):
+    validator = vb.is_unique_in_stream(approximate=approximate)
+
+    assert validator.validate_each([Point(1), Point(2), 1], strategy="return_result") is True
+    with pytest.raises(ValidationError, match="at index 2 failed validation"):
+        validator.validate_each([Point(1), Point(2), Point(1)])
+
+
+def test_is_unique_in_stream_ignored_by_validate():
+    validator = vb.is_unique_in_stream()
+
+    assert validator.validate(1, strategy="return_result") is True
+    assert validator.describe() == "Should be unique across all items (rule: is_unique_in_stream)"
+
+
+def test_stream_rules_only_combine_with_and():
+    validator = vb.is_number() & vb.is_unique_in_stream()
+
+    assert validator.validate_each([1, 1], strategy="return_result") is False
+    with pytest.raises(ValueError, match="Stream rules"):
+        _ = validator | vb.is_none()
+    with pytest.raises(ValueError, match="Stream rules"):
+        _ = ~validator
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(10_000, 0.01)
+
+    assert sum(bloom.add(i) for i in range(10_000)) < 100
+    assert all(bloom.add(i) for i in range(10_000))
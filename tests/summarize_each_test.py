@@ -0,0 +1,63 @@
+from fluent_validator import ValidationReport
+from fluent_validator import Validator as vb
+
+
+def test_summarize_each_groups_failures_by_rule():
+    validator = vb.is_number().is_not_none()
+
+    report = validator.summarize_each([1, -1, "a", 2, -5, None], max_examples=10)
+
+    assert isinstance(report, ValidationReport)
+    assert report.ok is False
+    assert report.total == 6
+    assert report.failed == 2
+
+    summaries = {str(rule): summary for rule, summary in report.rules.items()}
+    is_number = summaries["Should be a number (rule: is_number)"]
+    assert is_number.count == 2
+    assert (is_number.first_index, is_number.last_index) == (2, 5)
+    assert sorted(is_number.examples, key=lambda example: example[0]) == [(2, "a"), (5, None)]
+    assert summaries["Should not be None (rule: is_not_none)"].count == 1
+
+
+def test_summarize_each_keeps_bounded_examples():
+    validator = vb.is_greater_than(0)
+
+    report = validator.summarize_each(range(-10_000, 1), max_examples=3, seed=1)
+
+    (summary,) = report.rules.values()
+    assert summary.count == 10_001
+    assert summary.first_index == 0
+    assert summary.last_index == 10_000
+    assert len(summary.examples) == 3
+    assert all(-10_000 + index == value for index, value in summary.examples)
+
+
+def test_summarize_each_all_valid():
+    report = vb.is_number().summarize_each([1, 2, 3])
+
+    assert report.ok is True
+    assert report.rules == {}
+    assert report.describe() == "All 3 items passed validation"
+
+
+def test_summarize_each_describe_and_to_dict():
+    report = vb.is_string().summarize_each(["a", 1, "b", 2])
+
+    assert report.describe() == (
+        "2 of 4 items failed validation\n"
+        "'Should be a string (rule: is_string)': failed 2 times (first index 1, last index 3); examples: [1] 1, [3] 2"
+    )
+    assert report.to_dict() == {
+        "total": 4,
+        "failed": 2,
+        "rules": [
+            {
+                "rule": "Should be a string (rule: is_string)",
+                "count": 2,
+                "first_index": 1,
+                "last_index": 3,
+                "examples": [{"index": 1, "value": 1}, {"index": 3, "value": 2}],
+            },
+        ],
+    }
@@ -0,0 +1,42 @@
+import random
+
+from fluent_validator import Validator as vb
+from fluent_validator.automaton import SMALL_KEYWORD_SET, KeywordAutomaton
+
+
+def test_contains_any_of():
+    validator_positive = vb.contains_any_of(["foo", "bar"])
+    validator_negative = vb.contains_none_of(["foo", "bar"])
+
+    assert validator_positive.validate("a barrel", strategy="return_result") is True
+    assert validator_positive.validate("fo ba", strategy="return_result") is False
+    assert validator_positive.validate(None, strategy="return_result") is False
+    assert validator_negative.validate("fo ba", strategy="return_result") is True
+    assert validator_negative.validate("food", strategy="return_result") is False
+
+
+def test_contains_any_of_large_keyword_set():
+    keywords = ["he", "she", "his", "hers", "usher", "shop", "hip", "ship", "sip", "pies"]
+    assert len(keywords) > SMALL_KEYWORD_SET
+    validator = vb.contains_any_of(keywords)
+
+    assert validator.validate("ushers", strategy="return_result") is True
+    assert validator.validate("xxpiexx", strategy="return_result") is False
+    assert validator.validate("xxpiesxx", strategy="return_result") is True
+    assert validator.validate("", strategy="return_result") is False
+
+
+def test_keyword_automaton_agrees_with_substring_search():
+    rng = random.Random(7)  # noqa: S311
+    keywords = ["".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(50)]
+    automaton = KeywordAutomaton(keywords)
+
+    for _ in range(500):
+        text = "".join(rng.choices("abcd", k=rng.randint(0, 12)))
+        assert automaton.search(text) is any(keyword in text for keyword in keywords)
+
+
+def test_keyword_automaton_memory_is_bounded_by_keyword_length():
+    keywords = [f"word{i}" for i in range(1000)]
+
+    assert len(KeywordAutomaton(keywords)) <= sum(map(len, keywords)) + 1
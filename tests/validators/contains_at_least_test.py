@@ -0,0 +1,57 @@
+from fluent_validator import Peekable
+from fluent_validator import Validator as vb
+
+
+def numbers(count, consumed=None):
+    for value in range(count):
+        if consumed is not None:
+            consumed.append(value)
+        yield value
+
+
+def test_contains_size_on_sized_values():
+    assert vb.contains_at_least(2).validate([1, 2], strategy="return_result") is True
+    assert vb.contains_at_least(3).validate([1, 2], strategy="return_result") is False
+    assert vb.contains_at_most(2).validate([1, 2], strategy="return_result") is True
+    assert vb.contains_at_most(1).validate([1, 2], strategy="return_result") is False
+    assert vb.contains_exactly(2).validate([1, 2], strategy="return_result") is True
+    assert vb.contains_exactly(2).validate(None, strategy="return_result") is False
+
+
+def test_contains_size_reads_only_what_it_needs():
+    consumed = []
+    assert vb.contains_exactly(2).validate(numbers(1_000_000, consumed), strategy="return_result") is False
+    assert consumed == [0, 1, 2]
+
+    consumed = []
+    assert vb.contains_at_least(3).validate(numbers(1_000_000, consumed), strategy="return_result") is True
+    assert consumed == [0, 1, 2]
+
+
+def test_contains_size_does_not_consume_builtin_iterators():
+    items = iter([1, 2, 3])
+
+    assert vb.contains_at_least(3).contains_at_most(3).validate(items, strategy="return_result") is True
+    assert list(items) == [1, 2, 3]
+
+
+def test_contains_size_on_peekable_replays_items():
+    consumed = []
+    items = Peekable(numbers(5, consumed))
+    validator = vb.is_not_empty().contains_at_least(2).contains_at_most(10)
+
+    assert validator.validate(items, strategy="return_result") is True
+    assert consumed == [0, 1, 2, 3, 4]
+    assert list(items) == [0, 1, 2, 3, 4]
+
+
+def test_peekable_is_empty():
+    assert vb.is_empty().validate(Peekable(iter([])), strategy="return_result") is True
+    assert vb.is_not_empty().validate(Peekable(numbers(1)), strategy="return_result") is True
+
+
+def test_contains_size_with_negative_counts():
+    assert vb.contains_at_least(-1).validate(numbers(3), strategy="return_result") is True
+    assert vb.contains_at_most(-1).validate(numbers(3), strategy="return_result") is False
+    assert vb.contains_exactly(-1).validate(numbers(0), strategy="return_result") is False
+    assert vb.contains_at_least(-1).validate(Peekable(numbers(3)), strategy="return_result") is True
@@ -0,0 +1,14 @@
+from fluent_validator import Validator as vb
+
+
+def test_has_length_between():
+    validator_positive = vb.has_length_between(2, 4)
+    validator_negative = vb.has_length_not_between(2, 4)
+
+    assert validator_positive.validate("ab", strategy="return_result") is True
+    assert validator_positive.validate([1, 2, 3, 4], strategy="return_result") is True
+    assert validator_positive.validate("a", strategy="return_result") is False
+    assert validator_positive.validate("abcde", strategy="return_result") is False
+    assert validator_positive.validate(12, strategy="return_result") is False
+    assert validator_negative.validate("a", strategy="return_result") is True
+    assert validator_negative.validate("abc", strategy="return_result") is False
@@ -0,0 +1,56 @@
+from fluent_validator import Validator as vb
+
+
+def test_has_unique_values():
+    validator = vb.has_unique_values()
+
+    assert validator.validate([1, 2, 3], strategy="return_result") is True
+    assert validator.validate([1, 2, 1], strategy="return_result") is False
+    assert validator.validate([], strategy="return_result") is True
+    assert validator.validate("abc", strategy="return_result") is True
+    assert validator.validate(None, strategy="return_result") is False
+    assert validator.validate(123, strategy="return_result") is False
+
+
+def test_has_unique_values_unhashable_items():
+    validator = vb.has_unique_values()
+
+    assert validator.validate([{"a": [1]}, {"a": [2]}], strategy="return_result") is True
+    assert validator.validate([{"a": [1]}, {"a": [1]}], strategy="return_result") is False
+    assert validator.validate([[1, 2], (1, 2)], strategy="return_result") is True
+    assert validator.validate([{1}, frozenset({1})], strategy="return_result") is False
+    assert validator.validate([(1, [2]), (1, [2])], strategy="return_result") is False
+    assert validator.validate([bytearray(b"a"), b"a"], strategy="return_result") is False
+    assert validator.validate([{1: "a"}, {1.0: "a"}], strategy="return_result") is False
+
+
+def test_has_unique_values_stops_at_first_duplicate():
+    consumed = []
+
+    def values():
+        for value in [1, 2, 1, 3, 4]:
+            consumed.append(value)
+            yield value
+
+    assert vb.has_unique_values().validate(values(), strategy="return_result") is False
+    assert consumed == [1, 2, 1]
+
+
+def test_has_unique_values_deeply_nested_items():
+    deep: list = []
+    for _ in range(5000):
+        deep = [deep]
+    validator = vb.has_unique_values()
+
+    assert validator.validate(deep, strategy="return_result") is True
+    assert validator.validate([deep, [1], {"a": deep}], strategy="return_result") is True
+    assert validator.validate([deep, [1], [1]], strategy="return_result") is False
+
+
+def test_has_unique_values_self_containing_items():
+    loop: list = [1]
+    loop.append(loop)
+    validator = vb.has_unique_values()
+
+    assert validator.validate([loop, [1]], strategy="return_result") is True
+    assert validator.validate([loop, loop], strategy="return_result") is False
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+
+import pytest
+
+from fluent_validator import ValidationError
+from fluent_validator import Validator as vb
+
+
+@dataclass
+class Item:
+    qty: int = field(metadata={"validator": vb.is_number().is_greater_than(0)})
+
+
+def test_has_valid_fields():
+    validator_positive = vb.has_valid_fields()
+    validator_negative = vb.has_invalid_fields()
+
+    assert validator_positive.validate(Item(1), strategy="return_result") is True
+    assert validator_negative.validate(Item(1), strategy="return_result") is False
+
+    assert validator_positive.validate(Item(0), strategy="return_result") is False
+    assert validator_negative.validate(Item(0), strategy="return_result") is True
+
+    assert validator_positive.validate({"qty": 1}, strategy="return_result") is False
+
+
+def test_has_invalid_fields_requires_a_dataclass_instance():
+    validator_negative = vb.has_invalid_fields()
+
+    assert validator_negative.validate({"qty": 0}, strategy="return_result") is False
+    assert validator_negative.validate(Item, strategy="return_result") is False
+    assert validator_negative.validate(None, strategy="return_result") is False
+    with pytest.raises(ValidationError) as exc_info:
+        validator_negative.validate({"qty": 0})
+    assert exc_info.value.errors == [((), "Should be a dataclass instance (rule: has_invalid_fields)")]
+    with pytest.raises(ValidationError) as exc_info:
+        validator_negative.validate(Item(1))
+    assert exc_info.value.errors == [((), "Should be a dataclass with invalid fields (rule: has_invalid_fields)")]
@@ -9,3 +9,59 @@ def test_is_equal():
     assert validator_positive.validate(4, strategy="return_result") is False
     assert validator_negative.validate(3, strategy="return_result") is False
     assert validator_negative.validate(4, strategy="return_result") is True
+
+
+def test_or_of_equalities_is_merged_into_one_lookup():
+    validator = vb.is_equal("a")
+    for value in ["b", "c", 1, None]:
+        validator = validator | vb.is_equal(value)
+    validator = validator | vb.is_in(["d", "e"])
+
+    ((merged, msg),) = validator.validations()
+    assert merged.values == frozenset({"a", "b", "c", 1, None, "d", "e"})
+    assert str(msg).startswith(
+        "(((((Should be equal to a (rule: is_equal)) OR (Should be equal to b (rule: is_equal)))",
+    )
+    assert validator.describe(pretty=True).count("OR") == 5
+    assert validator.validate("e", strategy="return_result") is True
+    assert validator.validate(1.0, strategy="return_result") is True
+    assert validator.validate(None, strategy="return_result") is True
+    assert validator.validate("f", strategy="return_result") is False
+    assert validator.validate(["a"], strategy="return_result") is False
+
+
+def test_or_of_equalities_behind_the_same_type_check_is_merged():
+    validator = vb.is_string().is_equal("a") | vb.is_string().is_equal("b") | vb.is_string().is_in({"c"})
+
+    ((merged, _),) = validator.validations()
+    assert merged.values == frozenset({"a", "b", "c"})
+    assert validator.validate("c", strategy="return_result") is True
+    assert validator.validate(1, strategy="return_result") is False
+
+    mixed = vb.is_string().is_equal("a") | vb.is_number().is_equal(1)
+    assert mixed.validate(1, strategy="return_result") is True
+    assert not hasattr(mixed.validations()[0][0], "values")
+
+
+def test_or_of_non_literal_equalities_is_not_merged():
+    nan = float("nan")
+    validator = vb.is_equal(nan) | vb.is_equal((1, 2))
+
+    assert not hasattr(validator.validations()[0][0], "values")
+    assert validator.validate(nan, strategy="return_result") is False
+    assert validator.validate((1, 2), strategy="return_result") is True
+
+
+def test_or_of_equalities_compares_other_types_with_eq():
+    class AnyString:
+        def __eq__(self, other):
+            return isinstance(other, str)
+
+        __hash__ = object.__hash__
+
+    validator = vb.is_equal("a") | vb.is_equal("b")
+
+    assert hasattr(validator.validations()[0][0], "values")
+    assert vb.is_equal("a").validate(AnyString(), strategy="return_result") is True
+    assert validator.validate(AnyString(), strategy="return_result") is True
+    assert validator.validate(object(), strategy="return_result") is False
@@ -0,0 +1,47 @@
+import pytest
+
+from fluent_validator import Validator as vb
+from fluent_validator.intervals import IntervalSet
+
+
+def test_is_in_ranges():
+    validator_positive = vb.is_in_ranges([(10, 20), (0, 5)])
+    validator_negative = vb.is_not_in_ranges([(10, 20), (0, 5)])
+
+    assert validator_positive.validate(0, strategy="return_result") is True
+    assert validator_positive.validate(5, strategy="return_result") is True
+    assert validator_positive.validate(7, strategy="return_result") is False
+    assert validator_positive.validate(20, strategy="return_result") is True
+    assert validator_positive.validate(21, strategy="return_result") is False
+    assert validator_positive.validate("a", strategy="return_result") is False
+    assert validator_negative.validate(7, strategy="return_result") is True
+    assert validator_negative.validate(15, strategy="return_result") is False
+
+
+@pytest.mark.parametrize(
+    ("closed", "expected"),
+    [
+        ("both", [True, True, True, True, True]),
+        ("left", [True, True, True, True, False]),
+        ("right", [False, True, True, True, True]),
+        ("none", [False, True, False, True, False]),
+    ],
+)
+def test_is_in_ranges_closed(closed, expected):
+    validator = vb.is_in_ranges([(0, 2), (2, 4)], closed=closed)
+
+    assert [validator.validate(v, strategy="return_result") for v in [0, 1, 2, 3, 4]] == expected
+
+
+def test_interval_set_merges_ranges():
+    assert list(IntervalSet([(5, 8), (0, 2), (1, 3), (3, 4), (9, 9)])) == [(0, 4), (5, 8), (9, 9)]
+    assert list(IntervalSet([(0, 2), (2, 4), (3, 3)], closed="none")) == [(0, 2), (2, 4)]
+
+
+def test_is_in_ranges_numpy():
+    np = pytest.importorskip("numpy")
+    validator = vb.is_in_ranges([(0, 5), (10, 20)], closed="left")
+
+    assert validator.validate(np.array([0, 4, 10, 19]), strategy="return_result") is True
+    assert validator.validate(np.array([0, 5]), strategy="return_result") is False
+    assert IntervalSet([(0, 5)]).mask(np.array([-1, 0, 5, 6])).tolist() == [False, True, True, False]
@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+from fluent_validator import Validator as vb
+from fluent_validator import functions as F
+
+
+def test_is_in():
+    validator_positive = vb.is_in(["a", "b", "c"])
+    validator_negative = vb.is_not_in(["a", "b", "c"])
+
+    assert validator_positive.validate("a", strategy="return_result") is True
+    assert validator_positive.validate("z", strategy="return_result") is False
+    assert validator_positive.validate(["a"], strategy="return_result") is False
+    assert validator_negative.validate("z", strategy="return_result") is True
+    assert validator_negative.validate("a", strategy="return_result") is False
+
+
+def test_is_in_copies_collection_at_build_time():
+    allowed = ["a"]
+    validator = vb.is_in(allowed)
+    allowed.append("b")
+
+    assert validator.validate("b", strategy="return_result") is False
+
+
+def test_is_in_accepts_generators():
+    validator = vb.is_in(code for code in ("a", "b"))
+
+    assert validator.validate("a", strategy="return_result") is True
+    assert validator.validate("b", strategy="return_result") is True
+
+
+def test_is_in_range():
+    validator = vb.is_in(range(0, 10**12, 2))
+
+    assert validator.validate(10**11, strategy="return_result") is True
+    assert validator.validate(3, strategy="return_result") is False
+    assert validator.validate(4.0, strategy="return_result") is True
+    assert validator.validate(Decimal("4.5"), strategy="return_result") is False
+    assert validator.validate("4", strategy="return_result") is False
+
+
+def test_is_in_unhashable_values():
+    validator_positive = vb.is_in([[3, 4], [1, 2]])
+    validator_mixed = vb.is_in([[1], {"a": 1}, 2])
+
+    assert validator_positive.validate([1, 2], strategy="return_result") is True
+    assert validator_positive.validate([2, 1], strategy="return_result") is False
+    assert validator_positive.validate("x", strategy="return_result") is False
+    assert validator_mixed.validate({"a": 1}, strategy="return_result") is True
+    assert validator_mixed.validate(2, strategy="return_result") is True
+    assert validator_mixed.validate([2], strategy="return_result") is False
+
+
+def test_as_lookup_structures():
+    assert isinstance(F.as_lookup([1, 2, 2]), frozenset)
+    assert F.as_lookup("abc") == "abc"
+    assert isinstance(F.as_lookup([{1}, {2}]), tuple)
+    assert {2} in F.as_lookup([{1}, {2}])
+
+
+def test_single_unorderable_unhashable_item():
+    assert isinstance(F.as_lookup([{"a": 1}]), tuple)
+    assert vb.is_in([{"a": 1}]).validate({"a": 1}, strategy="return_result") is True
+    assert vb.is_not_in([{"a": 1}]).validate({"a": 1}, strategy="return_result") is False
+    assert vb.is_in([[1, 2]]).validate([1, 2], strategy="return_result") is True
+
+
+def test_is_in_non_iterable_collections():
+    class Evens:
+        def __contains__(self, value):
+            return value % 2 == 0
+
+    assert F.as_lookup(None) is None
+    assert vb.is_in(None).validate("a", strategy="return_result") is False
+    assert vb.is_not_in(None).validate("a", strategy="return_result") is True
+    assert vb.is_in(Evens()).validate(4, strategy="return_result") is True
+    assert vb.is_not_in(Evens()).validate(4, strategy="return_result") is False
@@ -0,0 +1,65 @@
+import re
+
+from fluent_validator import Validator as vb
+from fluent_validator import functions as F
+
+
+def test_matches():
+    validator_positive = vb.matches(r"[A-Z]{2}\d+")
+    validator_negative = vb.does_not_match(r"[A-Z]{2}\d+")
+
+    assert validator_positive.validate("AB123", strategy="return_result") is True
+    assert validator_positive.validate("AB123-x", strategy="return_result") is True
+    assert validator_positive.validate("x-AB123", strategy="return_result") is False
+    assert validator_positive.validate(123, strategy="return_result") is False
+    assert validator_negative.validate("x-AB123", strategy="return_result") is True
+    assert validator_negative.validate("AB123", strategy="return_result") is False
+
+
+def test_matches_flags_and_compiled_patterns():
+    assert vb.matches("ab", flags=re.IGNORECASE).validate("AB", strategy="return_result") is True
+    assert vb.matches(re.compile("ab")).validate("AB", strategy="return_result") is False
+
+
+def test_fullmatches():
+    validator_positive = vb.fullmatches(r"\d+")
+    validator_negative = vb.does_not_fullmatch(r"\d+")
+
+    assert validator_positive.validate("123", strategy="return_result") is True
+    assert validator_positive.validate("123a", strategy="return_result") is False
+    assert validator_positive.validate(None, strategy="return_result") is False
+    assert validator_negative.validate("123a", strategy="return_result") is True
+    assert validator_negative.validate("123", strategy="return_result") is False
+
+
+def test_patterns_are_compiled_once_in_shared_cache():
+    F._compile_cached.cache_clear()
+
+    vb.matches("shared-[0-9]+")
+    vb.fullmatches("shared-[0-9]+").validate("shared-1")
+    vb.matches("shared-[0-9]+").validate("shared-2")
+
+    info = F._compile_cached.cache_info()
+    assert info.misses == 1
+    assert info.maxsize == F.PATTERN_CACHE_SIZE
+
+
+def test_or_of_patterns_is_merged_into_one_alternation():
+    validator = vb.fullmatches(r"\d+") | vb.fullmatches(r"[a-z]+") | vb.fullmatches(r"x(y)")
+
+    ((merged, _),) = validator.validations()
+    assert merged.operand.pattern == r"(?:(?:\d+)|(?:[a-z]+))|(?:x(y))"
+    assert validator.validate("123", strategy="return_result") is True
+    assert validator.validate("abc", strategy="return_result") is True
+    assert validator.validate("xy", strategy="return_result") is True
+    assert validator.validate("abc1", strategy="return_result") is False
+    assert validator.describe(pretty=True).count("OR") == 2
+
+
+def test_or_of_patterns_with_group_references_is_not_merged():
+    validator = vb.fullmatches(r"(a)\1") | vb.fullmatches(r"(b)\1")
+
+    assert not hasattr(validator.validations()[0][0], "operand")
+    assert validator.validate("aa", strategy="return_result") is True
+    assert validator.validate("bb", strategy="return_result") is True
+    assert validator.validate("ab", strategy="return_result") is False
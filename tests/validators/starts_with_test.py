@@ -0,0 +1,31 @@
+from fluent_validator import Validator as vb
+
+
+def test_starts_with():
+    validator_positive = vb.starts_with("ID-")
+    validator_negative = vb.does_not_start_with("ID-")
+
+    assert validator_positive.validate("ID-1", strategy="return_result") is True
+    assert validator_positive.validate("XID-1", strategy="return_result") is False
+    assert validator_positive.validate(None, strategy="return_result") is False
+    assert validator_negative.validate("XID-1", strategy="return_result") is True
+    assert validator_negative.validate("ID-1", strategy="return_result") is False
+
+
+def test_ends_with():
+    validator_positive = vb.ends_with((".csv", ".tsv"))
+    validator_negative = vb.does_not_end_with((".csv", ".tsv"))
+
+    assert validator_positive.validate("a.tsv", strategy="return_result") is True
+    assert validator_positive.validate("a.json", strategy="return_result") is False
+    assert validator_negative.validate("a.json", strategy="return_result") is True
+    assert validator_negative.validate("a.csv", strategy="return_result") is False
+
+
+def test_or_of_prefixes_is_merged_into_one_check():
+    validator = vb.starts_with("a") | vb.starts_with(("b", "c")) | vb.starts_with("d")
+
+    ((merged, _),) = validator.validations()
+    assert merged.operand == ("a", "b", "c", "d")
+    assert validator.validate("cat", strategy="return_result") is True
+    assert validator.validate("eel", strategy="return_result") is False
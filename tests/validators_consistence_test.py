@@ -41,8 +41,19 @@ def test_builder_has_all_spec_methods():
         "from_validations",
         "validate",
         "validate_each",
+        "summarize_each",
         "validations",
         "describe",
+        "incremental",
+        "cached",
+        "cache_info",
+        "cache_clear",
+        "instrumented",
+        "stats",
+        "on_failure",
+        "explain",
+        "to_dict",
+        "from_dict",
     }
     spec_methods = {m_name for m_name in dir(ValidatorSpec) if not m_name.startswith("_")}
     missing_methods = spec_methods - set(dir(Validator)) - ignore_methods